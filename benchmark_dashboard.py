@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Benchmark del Dashboard QA
+Genera libros reporte_tarjetas.xlsx sintéticos a distintas escalas y mide cada
+fase de ComprehensiveQADashboard (carga, limpieza, estadísticas, HTML, escritura).
+El resultado se emite como JSON para comparar entre commits.
+"""
+
+import argparse
+import functools
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import openpyxl
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import dashboard_generator
+from dashboard_generator import ComprehensiveQADashboard
+
+# Escala 1 ~ el reporte real: 10 semanas de ~50 tarjetas
+BASE_SCALE = {'sheets': 10, 'rows_per_sheet': 50, 'developers': 30, 'sites': 20, 'qas': 5}
+DEFAULT_SCALES = [1, 10, 100, 1000]
+
+# Variantes de encabezado que clean_data sabe resolver
+HEADER_VARIANTS = [
+    # Formato actual
+    ['Sitio', 'Descripción', 'Número de tarjeta', 'Prioridad en la Tarjeta', 'Web/App', 'Plataforma',
+     'Desarrollador', 'PM', 'Fecha tentativa  de validación por parte de QA', 'Fecha de Aprobación o Rechazo',
+     'Criterios de Aceptación Entendibles', 'Número de rechazos', 'Aceptado/Rechazado', 'Comentarios'],
+    # Sin fecha de aprobación
+    ['Sitio', 'Descripción', 'Número de tarjeta', 'Prioridad en la Tarjeta', 'Web/App', 'Plataforma',
+     'Desarrollador', 'PM', 'Fecha tentativa  de validación por parte de QA', 'Número de rechazos',
+     'Aceptado/Rechazado', 'Comentarios', 'Incidencias/Stoppers'],
+    # Formato antiguo, nombres alternativos y desarrollador en dos columnas
+    ['SITIO', 'Descripción', 'Número de tarjeta', 'Prioridad', 'Web o App', 'Plataforma',
+     'Developer', 'Desarrollador Backend', 'QA', 'Fecha de validación por parte de QA',
+     'Aceptado/Rechazado', 'Comentarios'],
+]
+
+PLATFORMS = ['iOS', 'Android', 'Desktop', 'Mobile Web', 'AMP', 'Smart TV']
+STATUSES = ['APROBADO', 'APROBADO', 'APROBADO', 'RECHAZADO', None]
+PRIORITIES = ['Alta', 'Media', 'Media', 'Baja']
+
+
+def scale_params(scale, **overrides):
+    """Parámetros del libro sintético para una escala (filas totales = escala x base)"""
+    sheet_factor = max(1, round(math.sqrt(scale)))
+    params = {
+        'sheets': BASE_SCALE['sheets'] * sheet_factor,
+        'rows_per_sheet': max(1, round(BASE_SCALE['rows_per_sheet'] * scale / sheet_factor)),
+        'developers': max(BASE_SCALE['developers'], round(BASE_SCALE['developers'] * math.sqrt(scale))),
+        'sites': max(BASE_SCALE['sites'], round(BASE_SCALE['sites'] * math.log10(scale * 10))),
+        'qas': BASE_SCALE['qas'],
+    }
+    params.update({k: v for k, v in overrides.items() if v is not None})
+    return params
+
+
+def _synthetic_row(header, rng, week_start, developers, sites, qas):
+    """Una tarjeta sintética con los valores que esperan las columnas del encabezado"""
+    tentative = week_start + timedelta(days=rng.randint(0, 4), hours=rng.randint(8, 18))
+    status = rng.choice(STATUSES)
+    developer = rng.choice(developers)
+    values = {
+        'sitio': rng.choice(sites),
+        'descripción': f'Tarjeta {rng.randint(1, 10**6)}',
+        'número de tarjeta': f'QA-{rng.randint(1, 10**6)}',
+        'prioridad en la tarjeta': rng.choice(PRIORITIES),
+        'prioridad': rng.choice(PRIORITIES),
+        'web/app': rng.choice(['Web', 'Web', 'App']),
+        'web o app': rng.choice(['Web', 'Web', 'App']),
+        'plataforma': rng.choice(PLATFORMS),
+        'pm': rng.choice(qas),
+        'qa': rng.choice(qas),
+        'fecha tentativa  de validación por parte de qa': tentative,
+        'fecha de validación por parte de qa': tentative,
+        'fecha de aprobación o rechazo': tentative + timedelta(days=rng.randint(0, 6)) if status else None,
+        'criterios de aceptación entendibles': rng.choice(['Sí', 'No']),
+        'número de rechazos': rng.choice([0, 0, 0, 1, 1, 2, 3]),
+        'aceptado/rechazado': status,
+        'comentarios': rng.choice(['', 'Sin comentarios', 'Revisar estilos', None]),
+        'incidencias/stoppers': None,
+    }
+    row = []
+    dev_columns = [name for name in header if 'desarrollador' in name.lower() or 'developer' in name.lower()]
+    dev_target = rng.choice(dev_columns) if dev_columns else None
+    for name in header:
+        if name in dev_columns:
+            row.append(developer if name == dev_target else None)
+        else:
+            row.append(values.get(name.lower()))
+    return row
+
+
+def generate_workbook(path, sheets, rows_per_sheet, developers, sites, qas, seed=0):
+    """Escribe un reporte_tarjetas.xlsx sintético en modo write_only (memoria acotada)"""
+    rng = random.Random(seed)
+    developer_names = [f'Desarrollador {i:04d}' for i in range(developers)]
+    site_names = [f'Sitio {i:03d}' for i in range(sites)]
+    qa_names = [f'QA {i:02d}' for i in range(qas)]
+
+    workbook = openpyxl.Workbook(write_only=True)
+    first_week = datetime(2025, 1, 6)
+    # Las semanas más recientes primero, como en el libro real
+    for sheet_index in range(sheets):
+        week_start = first_week + timedelta(weeks=sheets - 1 - sheet_index)
+        week_end = week_start + timedelta(days=4)
+        sheet = workbook.create_sheet(f"tarjetas semana {week_start:%d%b}-{week_end:%d%b} {sheet_index}")
+        header = HEADER_VARIANTS[min(len(HEADER_VARIANTS) - 1, sheet_index * len(HEADER_VARIANTS) // sheets)]
+        sheet.append(header)
+        for _ in range(rows_per_sheet):
+            sheet.append(_synthetic_row(header, rng, week_start, developer_names, site_names, qa_names))
+
+    # Hoja que no es de tarjetas y debe ignorarse
+    other = workbook.create_sheet('Hoja5')
+    other.append(['Aprobación', None, 'TESTER'])
+    workbook.save(path)
+
+
+class PhaseTimer:
+    """Envuelve métodos de ComprehensiveQADashboard y acumula su tiempo (inclusivo)"""
+
+    PHASES = ['load_all_sheets', 'clean_data', 'build_aggregation_cube',
+              'get_qa_statistics_complete', 'get_web_statistics_complete', 'get_app_statistics_complete',
+              'get_dev_summary', 'get_dev_weekly_details', 'get_pm_statistics_complete',
+              'get_site_statistics_complete',
+              'get_platform_report', 'get_turnaround_statistics',
+              'get_rework_statistics', 'get_fact_table', 'generate_all_statistics', 'generate_html_dashboard']
+
+    def __init__(self):
+        self.timings = {}
+        self._originals = {}
+
+    def __enter__(self):
+        for name in self.PHASES:
+            original = getattr(ComprehensiveQADashboard, name)
+            self._originals[name] = original
+            setattr(ComprehensiveQADashboard, name, self._wrap(name, original))
+        return self
+
+    def __exit__(self, *exc):
+        for name, original in self._originals.items():
+            setattr(ComprehensiveQADashboard, name, original)
+
+    def _wrap(self, name, method):
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+        return timed
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux lo da en KB, macOS en bytes
+    return round(peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024, 1)
+
+
+def run_once(excel_path, output_dir, workers=1, reader='stream', cache_dir=None):
+    """Ejecuta todas las fases sobre un libro y devuelve tiempos y memoria"""
+    with PhaseTimer() as timer:
+        start = time.perf_counter()
+        dashboard = ComprehensiveQADashboard(excel_path, cache_dir=cache_dir, workers=workers, reader=reader)
+        stats = dashboard.generate_all_statistics()
+        html = dashboard.generate_html_dashboard(stats)
+
+        write_start = time.perf_counter()
+        with open(os.path.join(output_dir, 'index.html'), 'w', encoding='utf-8') as f:
+            f.write(html)
+        timer.timings['write'] = time.perf_counter() - write_start
+        total = time.perf_counter() - start
+
+    return {
+        'rows': len(dashboard.all_data),
+        'weeks': len(dashboard.weeks_list),
+        'html_bytes': len(html.encode('utf-8')),
+        'total_seconds': round(total, 4),
+        'phases': {name: round(seconds, 4) for name, seconds in timer.timings.items()},
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+
+
+def run_scale(scale, args):
+    """Genera el libro de una escala y lo mide en un subproceso (memoria pico aislada)"""
+    params = scale_params(scale, sheets=args.sheets, rows_per_sheet=args.rows_per_sheet,
+                          developers=args.developers, sites=args.sites, qas=args.qas)
+    with tempfile.TemporaryDirectory() as tmp:
+        excel_path = os.path.join(tmp, 'reporte_tarjetas.xlsx')
+        start = time.perf_counter()
+        generate_workbook(excel_path, seed=args.seed, **params)
+        generation_seconds = time.perf_counter() - start
+        workbook_bytes = os.path.getsize(excel_path)
+
+        result_path = os.path.join(tmp, 'result.json')
+        command = [sys.executable, os.path.abspath(__file__), '--run-one', excel_path,
+                   '--result-file', result_path, '--workers', str(args.workers), '--reader', args.reader]
+        if args.warm_cache:
+            command += ['--cache-dir', os.path.join(tmp, 'cache')]
+            # Primera pasada para llenar la caché
+            subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+        subprocess.run(command, check=True, stdout=None if args.verbose else subprocess.DEVNULL)
+        with open(result_path, encoding='utf-8') as f:
+            result = json.load(f)
+
+    result.update({
+        'scale': scale,
+        'params': params,
+        'workbook_bytes': workbook_bytes,
+        'generation_seconds': round(generation_seconds, 4),
+    })
+    return result
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(current, baseline_path):
+    """Imprime la relación de tiempos de cada fase contra un JSON anterior"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+    previous = {r['scale']: r for r in baseline['results']}
+    print(f"\nComparación contra {baseline_path} (commit {baseline.get('commit')}):")
+    for result in current['results']:
+        before = previous.get(result['scale'])
+        if before is None:
+            continue
+        print(f"  Escala {result['scale']}x: total {before['total_seconds']:.3f}s -> {result['total_seconds']:.3f}s")
+        for phase, seconds in result['phases'].items():
+            old = before['phases'].get(phase)
+            if old:
+                print(f"    {phase:32s} {old:9.4f}s -> {seconds:9.4f}s  ({seconds / old:5.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del Dashboard QA con libros sintéticos")
+    parser.add_argument('--scales', type=float, nargs='+', default=DEFAULT_SCALES,
+                        help="Escalas a medir respecto al reporte real (por defecto 1 10 100 1000)")
+    parser.add_argument('--sheets', type=int, help="Fija el número de hojas semanales")
+    parser.add_argument('--rows-per-sheet', type=int, help="Fija las tarjetas por hoja")
+    parser.add_argument('--developers', type=int, help="Fija el número de desarrolladores distintos")
+    parser.add_argument('--sites', type=int, help="Fija el número de sitios distintos")
+    parser.add_argument('--qas', type=int, help="Fija el número de QA/PM distintos")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--reader', choices=['stream', 'pandas'], default='stream')
+    parser.add_argument('--warm-cache', action='store_true', help="Mide con la caché de hojas ya llena")
+    parser.add_argument('--output', default='bench_results.json', help="Archivo JSON de resultados")
+    parser.add_argument('--compare', help="JSON de una ejecución anterior para comparar")
+    parser.add_argument('--generate-only', metavar='XLSX', help="Solo genera el libro sintético de la primera escala")
+    parser.add_argument('--verbose', action='store_true', help="Muestra la salida del generador")
+    # Uso interno: una sola medición dentro del subproceso
+    parser.add_argument('--run-one', metavar='XLSX', help=argparse.SUPPRESS)
+    parser.add_argument('--result-file', help=argparse.SUPPRESS)
+    parser.add_argument('--cache-dir', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        with tempfile.TemporaryDirectory() as output_dir:
+            result = run_once(args.run_one, output_dir, workers=args.workers, reader=args.reader,
+                              cache_dir=args.cache_dir)
+        with open(args.result_file, 'w', encoding='utf-8') as f:
+            json.dump(result, f)
+        return
+
+    if args.generate_only:
+        params = scale_params(args.scales[0], sheets=args.sheets, rows_per_sheet=args.rows_per_sheet,
+                              developers=args.developers, sites=args.sites, qas=args.qas)
+        generate_workbook(args.generate_only, seed=args.seed, **params)
+        print(f"Libro sintético guardado en '{args.generate_only}': {params}")
+        return
+
+    report = {
+        'commit': _git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': dashboard_generator.pd.__version__,
+        'openpyxl': openpyxl.__version__,
+        'reader': args.reader,
+        'workers': args.workers,
+        'warm_cache': args.warm_cache,
+        'results': [],
+    }
+    for scale in args.scales:
+        scale = int(scale) if float(scale).is_integer() else scale
+        print(f"Escala {scale}x ...", flush=True)
+        result = run_scale(scale, args)
+        report['results'].append(result)
+        print(f"  {result['rows']} filas, {result['weeks']} semanas: {result['total_seconds']:.3f}s, "
+              f"pico {result['peak_rss_mb']} MB")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"Resultados guardados en '{args.output}'")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
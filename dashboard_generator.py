@@ -6,443 +6,337 @@ Con vistas semanales e históricas
 
 import pandas as pd
 import numpy as np
+import openpyxl
+from openpyxl.cell.cell import ERROR_CODES
+from pandas.io.parsers import TextParser
 from datetime import datetime
+from html import escape
+from itertools import islice
+from collections import namedtuple
+from collections.abc import Mapping
+from contextlib import contextmanager, nullcontext
+import base64
+import cProfile
+import functools
+import glob
+import gzip
+import hashlib
 import json
+import math
 import os
+import pickle
+import re
+import pstats
+import threading
+import time
+import tracemalloc
+import urllib.request
 import webbrowser
-
-class ComprehensiveQADashboard:
-    def __init__(self, excel_path='reporte_tarjetas.xlsx'):
-        self.excel_path = excel_path
-        self.all_data = pd.DataFrame()
-        self.weeks_list = []
-        self.load_all_sheets()
-
-    def load_all_sheets(self):
-        """Carga todas las hojas del Excel y las combina"""
+from urllib.parse import quote
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+# Versión del formato de la caché de hojas; cambiarla invalida todas las entradas
+SHEET_CACHE_VERSION = 3
+# Versión del snapshot de estadísticas usado por el modo incremental
+STATS_SNAPSHOT_VERSION = 4
+# Bundle parcial de Plotly (scatter, bar y pie: todos los gráficos del dashboard), versión fijada
+PLOTLY_BUNDLE = 'plotly-basic-2.35.2.min.js'
+PLOTLY_BUNDLE_URL = f'https://cdn.plot.ly/{PLOTLY_BUNDLE}'
+
+_NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_NS_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_NS_PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+_SHARED_STRING_REF = re.compile(rb'<c\b[^>]*\bt="s"[^>]*>\s*<v>(\d+)</v>')
+# Entradas de la caché de hojas: <huella>.<lector>.<parquet|pkl>
+_SHEET_CACHE_ENTRY = re.compile(r'([0-9a-f]{64})\.(?:stream|pandas)\.(?:parquet|pkl)')
+
+
+def get_sheet_parts(zf):
+    """Devuelve {nombre de hoja: ruta del XML dentro del xlsx} en el orden del libro"""
+    rels = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+    targets = {}
+    for rel in rels.iter(f'{_NS_PKG_REL}Relationship'):
+        target = rel.get('Target')
+        targets[rel.get('Id')] = target.lstrip('/') if target.startswith('/') else f'xl/{target}'
+
+    workbook = ET.fromstring(zf.read('xl/workbook.xml'))
+    return {sheet.get('name'): targets[sheet.get(f'{_NS_REL}id')]
+            for sheet in workbook.iter(f'{_NS_MAIN}sheet')}
+
+
+def get_sheet_digests(excel_path):
+    """
+    Calcula una huella por hoja a partir de su XML dentro del xlsx.
+    Incluye los textos compartidos que la hoja referencia y los estilos (formatos
+    de fecha), de modo que la huella solo cambia si cambia el contenido de la hoja.
+    """
+    with zipfile.ZipFile(excel_path) as zf:
+        parts = get_sheet_parts(zf)
+        names = set(zf.namelist())
+
+        shared_strings = []
+        if 'xl/sharedStrings.xml' in names:
+            with zf.open('xl/sharedStrings.xml') as f:
+                for _, elem in ET.iterparse(f):
+                    if elem.tag == f'{_NS_MAIN}si':
+                        shared_strings.append(''.join(elem.itertext()))
+                        elem.clear()
+        styles = zf.read('xl/styles.xml') if 'xl/styles.xml' in names else b''
+        styles_digest = hashlib.sha256(styles).digest()
+
+        digests = {}
+        for sheet_name, part in parts.items():
+            sheet_xml = zf.read(part)
+            h = hashlib.sha256()
+            h.update(f'{SHEET_CACHE_VERSION}|{pd.__version__}|{sheet_name}'.encode('utf-8'))
+            h.update(styles_digest)
+            h.update(sheet_xml)
+            for idx in _SHARED_STRING_REF.findall(sheet_xml):
+                h.update(b'\x00' + shared_strings[int(idx)].encode('utf-8'))
+            digests[sheet_name] = h.hexdigest()
+    return digests
+
+
+def prune_sheet_cache(cache_dir, digests):
+    """
+    Borra de la caché de hojas las entradas cuya huella no está en `digests` (hojas que ya
+    no existen o que cambiaron); devuelve cuántas se borraron. Los temporales en escritura
+    y los archivos ajenos a la caché no se tocan.
+    """
+    keep = set(digests)
+    removed = 0
+    try:
+        entries = os.listdir(cache_dir)
+    except FileNotFoundError:
+        return 0
+    for entry in entries:
+        match = _SHEET_CACHE_ENTRY.fullmatch(entry)
+        if match and match.group(1) not in keep:
+            try:
+                os.remove(os.path.join(cache_dir, entry))
+                removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+def _convert_cell_value(value):
+    """Misma conversión de celdas que el lector openpyxl de pandas"""
+    if value is None:
+        return ''
+    if isinstance(value, float):
+        as_int = int(value)
+        return as_int if as_int == value else value
+    if isinstance(value, str) and value in ERROR_CODES:
+        return np.nan
+    return value
+
+
+# Plan de columnas compilado para un encabezado concreto:
+# positions = índices del encabezado que hay que leer,
+# sources = {columna canónica: [posiciones dentro de las columnas leídas]}
+ColumnPlan = namedtuple('ColumnPlan', ['positions', 'sources'])
+
+# Agregado parcial y combinable de un libro: semanas en orden y cubo de conteos
+# (ver ComprehensiveQADashboard.partial_statistics y merge_partial_statistics)
+PartialStatistics = namedtuple('PartialStatistics', ['weeks_list', 'cube'])
+
+
+@functools.lru_cache(maxsize=None)
+def compile_column_plan(header):
+    """
+    Compila (una sola vez por firma de encabezado) el plan de resolución de columnas.
+    `header` debe ser una tupla con los nombres de la fila de encabezado.
+    """
+    resolved = ComprehensiveQADashboard.resolve_sheet_columns(header)
+    sources = {}
+    for position, (_, name) in enumerate(resolved):
+        sources.setdefault(name, []).append(position)
+    return ColumnPlan(tuple(i for i, _ in resolved), sources)
+
+
+def stream_sheet(worksheet):
+    """
+    Lee una hoja fila a fila (openpyxl en modo read_only) conservando solo las
+    columnas del plan compilado para su encabezado. La inferencia de tipos la hace
+    TextParser igual que en pd.read_excel, pero sin materializar el resto de columnas.
+    Devuelve (DataFrame con las columnas leídas, plan).
+    """
+    rows = worksheet.iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None:
+        header = ()
+    plan = compile_column_plan(tuple(header))
+    keep = plan.positions
+
+    data = [[header[i] for i in keep]]
+    last_row_with_data = 0
+    for row_number, row in enumerate(rows, start=1):
+        data.append([_convert_cell_value(row[i]) if i < len(row) else '' for i in keep])
+        # pd.read_excel recorta las filas vacías del final mirando la fila completa
+        if any(value is not None and value != '' for value in row):
+            last_row_with_data = row_number
+    del data[last_row_with_data + 1:]
+
+    if not keep:
+        return pd.DataFrame(index=pd.RangeIndex(last_row_with_data)), plan
+    return TextParser(data, header=0, skip_blank_lines=False).read(), plan
+
+
+def _current_rss():
+    """Memoria residente actual en bytes (solo Linux); None si no se puede leer"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class PhaseProfiler:
+    """
+    Registra tiempo de reloj, tiempo de CPU y variación de memoria de cada fase.
+    La memoria se mide con tracemalloc si está activo y, si no, con el RSS del proceso.
+    Opcionalmente envuelve toda la ejecución en cProfile.
+    """
+
+    def __init__(self, use_tracemalloc=False, use_cprofile=False):
+        self.events = []
+        self.use_tracemalloc = use_tracemalloc
+        self.cprofile = cProfile.Profile() if use_cprofile else None
+        self._origin = time.perf_counter()
+        self._depth = 0
+
+    def start(self):
+        if self.use_tracemalloc:
+            tracemalloc.start()
+        if self.cprofile:
+            self.cprofile.enable()
+
+    def stop(self):
+        if self.cprofile:
+            self.cprofile.disable()
+        if self.use_tracemalloc and tracemalloc.is_tracing():
+            self._top_allocations = tracemalloc.take_snapshot().statistics('lineno')[:15]
+            tracemalloc.stop()
+
+    def _memory(self):
+        if self.use_tracemalloc and tracemalloc.is_tracing():
+            return tracemalloc.get_traced_memory()[0]
+        return _current_rss()
+
+    @contextmanager
+    def phase(self, name):
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        mem_start = self._memory()
+        self._depth += 1
         try:
-            xl_file = pd.ExcelFile(self.excel_path)
-
-            all_sheets = []
-            for sheet_name in xl_file.sheet_names:
-                if 'tarjetas semana' in sheet_name.lower():
-                    print(f"Cargando: {sheet_name}")
-                    df = pd.read_excel(xl_file, sheet_name)
-                    df['Semana'] = sheet_name
-                    all_sheets.append(df)
-                    self.weeks_list.append(sheet_name)
-
-            self.all_data = pd.concat(all_sheets, ignore_index=True)
-            self.clean_data()
-            print(f"Total de registros cargados: {len(self.all_data)}")
-            print(f"Semanas cargadas: {len(self.weeks_list)}")
-            print("Columnas del DataFrame después de la carga y limpieza:", self.all_data.columns.tolist()) # Added for debugging
-
-        except Exception as e:
-            print(f"Error al cargar el archivo: {e}")
-            raise
-
-    def clean_data(self):
-        """
-        Limpia y prepara los datos, estandarizando nombres de columnas
-        y manejando valores nulos.
-        """
-        # Convertir fechas
-        date_columns = ['Fecha tentativa  de validación por parte de QA', 'Fecha de Aprobación o Rechazo']
-        for col in date_columns:
-            if col in self.all_data.columns:
-                self.all_data[col] = pd.to_datetime(self.all_data[col], errors='coerce')
-
-        # Clean 'Número de rechazos'
-        if 'Número de rechazos' in self.all_data.columns:
-            self.all_data['Número de rechazos'] = pd.to_numeric(self.all_data['Número de rechazos'], errors='coerce').fillna(0)
-        else:
-            print("Warning: 'Número de rechazos' column not found. Setting to 0.")
-            self.all_data['Número de rechazos'] = 0
-
-        # Clean 'Aceptado/Rechazado'
-        if 'Aceptado/Rechazado' in self.all_data.columns:
-            self.all_data['Aceptado/Rechazado'] = self.all_data['Aceptado/Rechazado'].fillna('PENDIENTE')
-        else:
-            print("Warning: 'Aceptado/Rechazado' column not found. Setting to 'PENDIENTE'.")
-            self.all_data['Aceptado/Rechazado'] = 'PENDIENTE'
-
-        # --- Handle 'Desarrollador' column specifically ---
-        # Find all columns that might contain developer names (case-insensitive)
-        dev_cols = [col for col in self.all_data.columns if 'desarrollador' in col.lower() or 'developer' in col.lower()]
-
-        if 'Desarrollador' not in self.all_data.columns and dev_cols:
-            # If 'Desarrollador' doesn't exist but other dev columns do,
-            # try to coalesce them into a single 'Desarrollador' column.
-            # This assumes that if multiple dev columns exist, only one should have a value per row.
-            # bfill(axis=1) fills NaNs backwards along rows, then iloc[:, 0] takes the first non-null.
-            self.all_data['Desarrollador'] = self.all_data[dev_cols].bfill(axis=1).iloc[:, 0]
-            print(f"Coalesced columns {dev_cols} into 'Desarrollador'.")
-            # Drop the original developer columns after coalescing
-            self.all_data.drop(columns=dev_cols, inplace=True, errors='ignore')
-        elif 'Desarrollador' not in self.all_data.columns and not dev_cols:
-            print("Warning: 'Desarrollador' column or its variations not found. Creating an empty 'Desarrollador' column.")
-            self.all_data['Desarrollador'] = np.nan
-
-        # Fill any remaining NaNs in 'Desarrollador' with a placeholder
-        if 'Desarrollador' in self.all_data.columns:
-            self.all_data['Desarrollador'] = self.all_data['Desarrollador'].fillna('Desarrollador Desconocido')
-
-        # --- Standardize other key columns ---
-        # This dictionary maps the desired column name to a list of its possible variations (lowercase)
-        expected_cols_mapping = {
-            'PM': ['pm', 'qa'],
-            'Web/App': ['web/app', 'web o app'],
-            'Sitio': ['sitio'],
-            'Plataforma': ['plataforma'],
-            'Prioridad en la Tarjeta': ['prioridad en la tarjeta', 'prioridad']
-        }
-
-        for expected_col, variations in expected_cols_mapping.items():
-            if expected_col not in self.all_data.columns: # If the desired column name is not present
-                found_variation = False
-                for col_name in self.all_data.columns:
-                    # Check if the current column name (lowercase) is in the variations list
-                    if col_name.lower() in variations:
-                        self.all_data.rename(columns={col_name: expected_col}, inplace=True)
-                        print(f"Renamed column '{col_name}' to '{expected_col}'")
-                        found_variation = True
-                        break
-                if not found_variation:
-                    print(f"Warning: Column '{expected_col}' or its variations not found. Creating an empty column.")
-                    self.all_data[expected_col] = np.nan
-
-
-    def get_qa_statistics_complete(self):
-        """Estadísticas COMPLETAS de QA - Por semana y totales"""
-        qa_stats = {
-            'weekly': {},
-            'historical': {
-                'por_qa': {},
-                'total_rechazadas': 0,
-                'total_revisadas': 0
-            }
-        }
-
-        # Por cada semana
-        for semana in self.weeks_list:
-            week_data = self.all_data[self.all_data['Semana'] == semana]
-
-            # Tarjetas por QA esta semana
-            qa_counts = {}
-            qa_rechazadas = {}
-
-            for qa in week_data['PM'].dropna().unique():
-                qa_data = week_data[week_data['PM'] == qa]
-                qa_counts[qa] = len(qa_data)
-                qa_rechazadas[qa] = len(qa_data[qa_data['Aceptado/Rechazado'] == 'RECHAZADO'])
-
-            qa_stats['weekly'][semana] = {
-                'tarjetas_por_qa': qa_counts,
-                'rechazadas_por_qa': qa_rechazadas,
-                'total_semana': len(week_data),
-                'total_rechazadas_semana': len(week_data[week_data['Aceptado/Rechazado'] == 'RECHAZADO'])
-            }
-
-        # Totales históricos
-        for qa in self.all_data['PM'].dropna().unique():
-            qa_data = self.all_data[self.all_data['PM'] == qa]
-            qa_stats['historical']['por_qa'][qa] = {
-                'total_revisadas': len(qa_data),
-                'total_rechazadas': len(qa_data[qa_data['Aceptado/Rechazado'] == 'RECHAZADO']),
-                'promedio_semanal': len(qa_data) / len(self.weeks_list) if len(self.weeks_list) > 0 else 0
-            }
-
-        qa_stats['historical']['total_rechazadas'] = len(self.all_data[self.all_data['Aceptado/Rechazado'] == 'RECHAZADO'])
-        qa_stats['historical']['total_revisadas'] = len(self.all_data)
-
-        return qa_stats
-
-    def get_web_statistics_complete(self):
-        """Estadísticas COMPLETAS Web - Por semana y totales"""
-        web_stats = {
-            'weekly': {},
-            'historical': {
-                'total_revisadas': 0,
-                'total_rechazadas': 0,
-                'total_aceptadas': 0,
-                'porcentaje_rechazo': 0
-            }
-        }
-
-        # Por cada semana
-        for semana in self.weeks_list:
-            week_data = self.all_data[self.all_data['Semana'] == semana]
-            web_data = week_data[week_data['Web/App'] == 'Web']
-
-            total = len(web_data)
-            rechazadas = len(web_data[web_data['Aceptado/Rechazado'] == 'RECHAZADO'])
-            aceptadas = len(web_data[web_data['Aceptado/Rechazado'] == 'APROBADO'])
-
-            web_stats['weekly'][semana] = {
-                'revisadas': total,
-                'rechazadas': rechazadas,
-                'aceptadas': aceptadas,
-                'porcentaje_rechazo': round((rechazadas / total * 100) if total > 0 else 0, 2)
-            }
-
-        # Totales históricos
-        web_data_total = self.all_data[self.all_data['Web/App'] == 'Web']
-        total = len(web_data_total)
-        rechazadas = len(web_data_total[web_data_total['Aceptado/Rechazado'] == 'RECHAZADO'])
-        aceptadas = len(web_data_total[web_data_total['Aceptado/Rechazado'] == 'APROBADO'])
-
-        web_stats['historical'] = {
-            'total_revisadas': total,
-            'total_rechazadas': rechazadas,
-            'total_aceptadas': aceptadas,
-            'porcentaje_rechazo': round((rechazadas / total * 100) if total > 0 else 0, 2)
-        }
-
-        return web_stats
-
-    def get_app_statistics_complete(self):
-        """Estadísticas COMPLETAS App - Por semana y totales"""
-        app_stats = {
-            'weekly': {},
-            'historical': {
-                'total_revisadas': 0,
-                'total_rechazadas': 0,
-                'total_aceptadas': 0,
-                'porcentaje_rechazo': 0
-            }
-        }
-
-        # Por cada semana
-        for semana in self.weeks_list:
-            week_data = self.all_data[self.all_data['Semana'] == semana]
-            app_data = week_data[week_data['Web/App'] == 'App']
-
-            total = len(app_data)
-            rechazadas = len(app_data[app_data['Aceptado/Rechazado'] == 'RECHAZADO'])
-            aceptadas = len(app_data[app_data['Aceptado/Rechazado'] == 'APROBADO'])
-
-            app_stats['weekly'][semana] = {
-                'revisadas': total,
-                'rechazadas': rechazadas,
-                'aceptadas': aceptadas,
-                'porcentaje_rechazo': round((rechazadas / total * 100) if total > 0 else 0, 2)
-            }
-
-        # Totales históricos
-        app_data_total = self.all_data[self.all_data['Web/App'] == 'App']
-        total = len(app_data_total)
-        rechazadas = len(app_data_total[app_data_total['Aceptado/Rechazado'] == 'RECHAZADO'])
-        aceptadas = len(app_data_total[app_data_total['Aceptado/Rechazado'] == 'APROBADO'])
-
-        app_stats['historical'] = {
-            'total_revisadas': total,
-            'total_rechazadas': rechazadas,
-            'total_aceptadas': aceptadas,
-            'porcentaje_rechazo': round((rechazadas / total * 100) if total > 0 else 0, 2)
-        }
-
-        return app_stats
-
-    def get_dev_statistics(self, dev_type):
-        """
-        Estadísticas COMPLETAS de desarrolladores (Web o App)
-        Retorna estadísticas históricas y un desglose semanal detallado por desarrollador.
-        """
-        filtered_data = self.all_data[self.all_data['Web/App'] == dev_type.capitalize()]
-        dev_stats = {}
-        dev_weekly_details = {} # To store weekly breakdowns for each dev
-
-        for dev in filtered_data['Desarrollador'].dropna().unique():
-            dev_data = filtered_data[filtered_data['Desarrollador'] == dev]
-
-            # Calculate statistics per week for the specific developer
-            weekly_summary = {}
-            for semana in self.weeks_list:
-                week_dev_data = dev_data[dev_data['Semana'] == semana]
-                total_week = len(week_dev_data)
-                rechazadas_week = len(week_dev_data[week_dev_data['Aceptado/Rechazado'] == 'RECHAZADO'])
-                aceptadas_week = len(week_dev_data[week_dev_data['Aceptado/Rechazado'] == 'APROBADO'])
-                porcentaje_rechazo_week = round((rechazadas_week / total_week * 100) if total_week > 0 else 0, 2)
-
-                if total_week > 0: # Only include weeks where the developer was active
-                    weekly_summary[semana] = {
-                        'total_tarjetas': total_week,
-                        'rechazadas': rechazadas_week,
-                        'aceptadas': aceptadas_week,
-                        'porcentaje_rechazo': porcentaje_rechazo_week
-                    }
-            dev_weekly_details[dev] = weekly_summary
-
-
-            # Overall historical stats for developer
-            total = len(dev_data)
-            rechazadas = len(dev_data[dev_data['Aceptado/Rechazado'] == 'RECHAZADO'])
-            aceptadas = len(dev_data[dev_data['Aceptado/Rechazado'] == 'APROBADO'])
-            promedio_semanal = total / len(self.weeks_list) if len(self.weeks_list) > 0 else 0
-            porcentaje_rechazo = round((rechazadas / total * 100) if total > 0 else 0, 2)
-            semanas_activo = len(dev_data['Semana'].unique())
-
-
-            dev_stats[dev] = {
-                'total_tarjetas': total,
-                'rechazadas': rechazadas,
-                'aceptadas': aceptadas,
-                'promedio_semanal_historico': round(promedio_semanal, 2),
-                'porcentaje_rechazo': porcentaje_rechazo,
-                'semanas_activo': semanas_activo
-            }
-
-        # Order by total cards
-        dev_stats = dict(sorted(dev_stats.items(), key=lambda x: x[1]['total_tarjetas'], reverse=True))
-
-        return dev_stats, dev_weekly_details
-
-    def get_pm_statistics_complete(self):
-        """Estadísticas COMPLETAS de PM"""
-        pm_stats = {
-            'prioridades': {
-                'alta': {
-                    'total': len(self.all_data[self.all_data['Prioridad en la Tarjeta'] == 'Alta']),
-                    'promedio_semanal': 0
-                },
-                'media': {
-                    'total': len(self.all_data[self.all_data['Prioridad en la Tarjeta'] == 'Media']),
-                    'promedio_semanal': 0
-                },
-                'baja': {
-                    'total': len(self.all_data[self.all_data['Prioridad en la Tarjeta'] == 'Baja']),
-                    'promedio_semanal': 0
+            yield
+        finally:
+            self._depth -= 1
+            mem_end = self._memory()
+            self.events.append({
+                'name': name,
+                'start': wall_start - self._origin,
+                'wall': time.perf_counter() - wall_start,
+                'cpu': time.process_time() - cpu_start,
+                'mem_delta': mem_end - mem_start if mem_start is not None and mem_end is not None else None,
+                'depth': self._depth
+            })
+
+    def print_summary(self):
+        """Resumen por fase ordenado por tiempo de reloj (los tiempos son inclusivos)"""
+        totals = {}
+        for event in self.events:
+            entry = totals.setdefault(event['name'], {'calls': 0, 'wall': 0.0, 'cpu': 0.0, 'mem_delta': 0})
+            entry['calls'] += 1
+            entry['wall'] += event['wall']
+            entry['cpu'] += event['cpu']
+            if event['mem_delta'] is not None:
+                entry['mem_delta'] += event['mem_delta']
+
+        print("\nPerfil por fase (tiempos inclusivos):")
+        print(f"  {'Fase':42s} {'Llamadas':>8s} {'Reloj (s)':>10s} {'CPU (s)':>10s} {'Memoria (MB)':>13s}")
+        for name, entry in sorted(totals.items(), key=lambda x: x[1]['wall'], reverse=True):
+            print(f"  {name:42s} {entry['calls']:8d} {entry['wall']:10.4f} {entry['cpu']:10.4f} "
+                  f"{entry['mem_delta'] / (1024 * 1024):+13.2f}")
+
+        if self.cprofile:
+            print("\ncProfile (top 25 por tiempo acumulado):")
+            pstats.Stats(self.cprofile).sort_stats('cumulative').print_stats(25)
+        if getattr(self, '_top_allocations', None):
+            print("tracemalloc (top 15 líneas por memoria viva al terminar):")
+            for stat in self._top_allocations:
+                print(f"  {stat}")
+
+    def write_chrome_trace(self, path):
+        """Escribe las fases en formato Chrome trace-event (chrome://tracing, Perfetto)"""
+        trace = {
+            'traceEvents': [{
+                'name': event['name'],
+                'cat': 'phase',
+                'ph': 'X',
+                'ts': round(event['start'] * 1e6),
+                'dur': round(event['wall'] * 1e6),
+                'pid': os.getpid(),
+                'tid': 0,
+                'args': {
+                    'cpu_ms': round(event['cpu'] * 1000, 3),
+                    'mem_delta_bytes': event['mem_delta']
                 }
-            },
-            'promedio_semanal': {
-                'web': 0,
-                'app': 0,
-                'total': 0
-            },
-            'por_semana': {}
-        }
-
-        # Calcular promedios
-        num_semanas = len(self.weeks_list)
-        if num_semanas > 0:
-            pm_stats['prioridades']['alta']['promedio_semanal'] = round(pm_stats['prioridades']['alta']['total'] / num_semanas, 2)
-            pm_stats['prioridades']['media']['promedio_semanal'] = round(pm_stats['prioridades']['media']['total'] / num_semanas, 2)
-            pm_stats['prioridades']['baja']['promedio_semanal'] = round(pm_stats['prioridades']['baja']['total'] / num_semanas, 2)
-
-            # Promedios por tipo
-            web_por_semana = self.all_data[self.all_data['Web/App'] == 'Web'].groupby('Semana').size()
-            app_por_semana = self.all_data[self.all_data['Web/App'] == 'App'].groupby('Semana').size()
-
-            pm_stats['promedio_semanal']['web'] = round(web_por_semana.mean(), 2) if not web_por_semana.empty else 0
-            pm_stats['promedio_semanal']['app'] = round(app_por_semana.mean(), 2) if not app_por_semana.empty else 0
-            pm_stats['promedio_semanal']['total'] = round((pm_stats['promedio_semanal']['web'] + pm_stats['promedio_semanal']['app']), 2)
-
-
-        # Desglose por semana
-        for semana in self.weeks_list:
-            week_data = self.all_data[self.all_data['Semana'] == semana]
-            pm_stats['por_semana'][semana] = {
-                'alta': len(week_data[week_data['Prioridad en la Tarjeta'] == 'Alta']),
-                'media': len(week_data[week_data['Prioridad en la Tarjeta'] == 'Media']),
-                'baja': len(week_data[week_data['Prioridad en la Tarjeta'] == 'Baja']),
-                'web': len(week_data[week_data['Web/App'] == 'Web']),
-                'app': len(week_data[week_data['Web/App'] == 'App'])
-            }
-
-        return pm_stats
-
-    def get_site_statistics_complete(self):
-        """Estadísticas COMPLETAS por sitio"""
-        site_stats = {}
-
-        for sitio in self.all_data['Sitio'].dropna().unique():
-            site_data = self.all_data[self.all_data['Sitio'] == sitio]
-
-            # Totales
-            total = len(site_data)
-            web = len(site_data[site_data['Web/App'] == 'Web'])
-            app = len(site_data[site_data['Web/App'] == 'App'])
-            rechazadas = len(site_data[site_data['Aceptado/Rechazado'] == 'RECHAZADO'])
-            aceptadas = len(site_data[site_data['Aceptado/Rechazado'] == 'APROBADO'])
-
-            # Promedios
-            num_semanas = site_data['Semana'].nunique()
-            promedio_total = total / num_semanas if num_semanas > 0 else 0
-            promedio_rechazadas = rechazadas / num_semanas if num_semanas > 0 else 0
-            promedio_aceptadas = aceptadas / num_semanas if num_semanas > 0 else 0
-
-            # Plataformas
-            plataformas = site_data['Plataforma'].value_counts().to_dict()
-
-            site_stats[sitio] = {
-                'total': total,
-                'web': web,
-                'app': app,
-                'rechazadas': rechazadas,
-                'aceptadas': aceptadas,
-                'promedio_por_semana': round(promedio_total, 2),
-                'promedio_rechazadas_semana': round(promedio_rechazadas, 2),
-                'promedio_aceptadas_semana': round(promedio_aceptadas, 2),
-                'plataformas': plataformas,
-                'semanas_activo': num_semanas
-            }
-
-        # Ordenar por total
-        site_stats = dict(sorted(site_stats.items(), key=lambda x: x[1]['total'], reverse=True))
-
-        return site_stats
-
-    def get_platform_report(self):
-        """Reporte de número de tarjetas por plataforma"""
-        platform_counts = self.all_data['Plataforma'].value_counts().to_dict()
-
-        # Limpiar valores nulos
-        cleaned_counts = {}
-        for k, v in platform_counts.items():
-            if pd.isna(k):
-                cleaned_counts['Sin especificar'] = v
-            else:
-                cleaned_counts[k] = v
-
-        return cleaned_counts
-
-    def generate_all_statistics(self):
-        """Genera TODAS las estadísticas solicitadas"""
-        print("Generando estadísticas completas...")
-
-        dev_web_stats, dev_web_weekly = self.get_dev_statistics('web')
-        dev_app_stats, dev_app_weekly = self.get_dev_statistics('app')
-
-        stats = {
-            'qa': self.get_qa_statistics_complete(),
-            'web': self.get_web_statistics_complete(),
-            'app': self.get_app_statistics_complete(),
-            'dev_web': dev_web_stats,
-            'dev_app': dev_app_stats,
-            'dev_web_weekly_details': dev_web_weekly, # New: detailed weekly stats for web devs
-            'dev_app_weekly_details': dev_app_weekly, # New: detailed weekly stats for app devs
-            'pm': self.get_pm_statistics_complete(),
-            'sites': self.get_site_statistics_complete(),
-            'platforms': self.get_platform_report(),
-            'weeks_list': self.weeks_list,
-            'total_weeks': len(self.weeks_list)
+            } for event in sorted(self.events, key=lambda e: (e['start'], e['depth']))],
+            'displayTimeUnit': 'ms'
         }
-
-        return stats
-
-    def generate_html_dashboard(self, stats):
-        """Genera el dashboard HTML con TODAS las métricas"""
-        html = """<!DOCTYPE html>
-<html lang="es">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Dashboard QA - Métricas</title>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
-    <style>
-        :root {
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f, ensure_ascii=False)
+        print(f"Traza de perfil guardada en '{path}'")
+
+
+def profiled(method):
+    """Mide el método como una fase cuando el dashboard tiene un profiler"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        name = method.__name__
+        if args and isinstance(args[0], str):
+            name = f"{name}({args[0]})"
+        with self._phase(name):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def read_sheets(excel_path, sheet_names, reader='stream'):
+    """
+    Lee varias hojas abriendo el libro una sola vez.
+    Devuelve [(nombre, DataFrame, segundos)]; se usa también desde los procesos del pool.
+    """
+    results = []
+    if reader == 'stream':
+        workbook = openpyxl.load_workbook(excel_path, read_only=True, data_only=True, keep_links=False)
+        try:
+            for sheet_name in sheet_names:
+                start = time.perf_counter()
+                df, plan = stream_sheet(workbook[sheet_name])
+                df = ComprehensiveQADashboard.normalize_sheet(df, plan)
+                results.append((sheet_name, df, time.perf_counter() - start))
+        finally:
+            workbook.close()
+    else:
+        with pd.ExcelFile(excel_path) as xl_file:
+            for sheet_name in sheet_names:
+                start = time.perf_counter()
+                header = pd.read_excel(xl_file, sheet_name, nrows=0).columns
+                plan = compile_column_plan(tuple(header))
+                df = pd.read_excel(xl_file, sheet_name, usecols=list(plan.positions))
+                df = ComprehensiveQADashboard.normalize_sheet(df, plan)
+                results.append((sheet_name, df, time.perf_counter() - start))
+    return results
+
+
+# Estilos del dashboard (contenido del bloque <style>)
+DASHBOARD_STYLES = """        :root {
             --primary-color: #4A00E0;
             --secondary-color: #8E2DE2;
             --accent-color: #00C9FF;
@@ -742,11 +636,39 @@ class ComprehensiveQADashboard:
             min-width: 200px;
         }
 
-        .highlight {
-            background: #FFF3CD;
-            padding: 3px 8px;
-            border-radius: 5px;
-            font-weight: 600;
+        .explorer-filters {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 15px;
+            margin: 25px 0;
+            padding: 20px;
+            background: var(--card-background);
+            border-radius: 10px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.05);
+        }
+
+        .explorer-filters label {
+            display: flex;
+            flex-direction: column;
+            gap: 6px;
+            font-weight: 500;
+            color: var(--text-dark);
+        }
+
+        .explorer-filters select {
+            padding: 8px 12px;
+            border: 1px solid var(--border-light);
+            border-radius: 8px;
+            background: white;
+            font-family: inherit;
+            font-size: 0.95em;
+        }
+
+        .highlight {
+            background: #FFF3CD;
+            padding: 3px 8px;
+            border-radius: 5px;
+            font-weight: 600;
             color: var(--warning-color);
         }
 
@@ -759,6 +681,58 @@ class ComprehensiveQADashboard:
             cursor: pointer;
         }
 
+        .virtual-table-toolbar {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            gap: 15px;
+            margin-bottom: 12px;
+        }
+
+        .table-filter {
+            padding: 10px 15px;
+            border: 1px solid var(--border-light);
+            border-radius: 8px;
+            font-family: inherit;
+            font-size: 0.95em;
+            min-width: 260px;
+        }
+
+        .table-count {
+            color: var(--text-medium);
+            font-size: 0.9em;
+        }
+
+        .virtual-table-viewport {
+            max-height: 600px;
+            overflow-y: auto;
+            border-radius: 15px;
+            box-shadow: 0 4px 12px rgba(0,0,0,0.08);
+            margin-bottom: 30px;
+        }
+
+        .virtual-table-viewport table {
+            overflow: visible; /* Deja que el encabezado quede fijo al desplazar */
+            box-shadow: none;
+            margin-bottom: 0;
+        }
+
+        .virtual-table th {
+            position: sticky;
+            top: 0;
+            z-index: 1;
+            cursor: pointer;
+            user-select: none;
+        }
+
+        .virtual-table th[aria-sort="ascending"]::after { content: ' ▲'; }
+        .virtual-table th[aria-sort="descending"]::after { content: ' ▼'; }
+
+        .virtual-spacer td {
+            padding: 0;
+            border: none;
+        }
+
         /* Responsive adjustments */
         @media (max-width: 768px) {
             .header {
@@ -830,938 +804,3685 @@ class ComprehensiveQADashboard:
                 width: 100%;
             }
         }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>📊 Dashboard QA - Análisis de Tarjetas</h1>
-            <p class="timestamp">Generado el: """ + datetime.now().strftime('%d/%m/%Y a las %H:%M:%S') + """</p>
-            <p class="timestamp">Total de semanas analizadas: """ + str(stats['total_weeks']) + """</p>
-        </div>
-
-        <div class="nav-tabs">
-            <button class="tab-button active" onclick="showTab('resumen')">📈 Resumen General</button>
-            <button class="tab-button" onclick="showTab('qa')">👥 QA</button>
-            <button class="tab-button" onclick="showTab('web')">🌐 Web</button>
-            <button class="tab-button" onclick="showTab('app')">📱 App</button>
-            <button class="tab-button" onclick="showTab('devs')">👨‍💻 Desarrolladores</button>
-            <button class="tab-button" onclick="showTab('pm')">📋 PM</button>
-            <button class="tab-button" onclick="showTab('sites')">🏢 Sitios</button>
-            <button class="tab-button" onclick="showTab('weekly')">📅 Vista Semanal</button>
-        </div>
+"""
 
-        <div id="resumen" class="tab-content active">
-            <h2 class="section-title">Resumen General - Métricas Históricas</h2>
+# Lógica del dashboard en el navegador; espera la constante global allStats
+DASHBOARD_SCRIPT = """
+        // Reconstruye las estadísticas a partir del formato columnar de encode_stats_payload
+        function decodeStats(payload) {
+            const dims = payload.dims;
+            const decode = node => {
+                if (Array.isArray(node)) {
+                    return node.map(decode);
+                }
+                if (node === null || typeof node !== 'object' || !node.$) {
+                    return node;
+                }
+                const result = {};
+                const count = node.$ === 't' ? node.c[0].length : node.v.length;
+                let previous = 0;
+                const codes = typeof node.k === 'number'
+                    ? Array.from({length: count}, (_, i) => node.k + i)
+                    : node.k.map(delta => (previous += delta));
+                if (node.$ === 't') {
+                    const fields = node.f.map(code => dims.keys[code]);
+                    codes.forEach((code, i) => {
+                        const record = {};
+                        fields.forEach((field, j) => { record[field] = decode(node.c[j][i]); });
+                        result[dims[node.d][code]] = record;
+                    });
+                } else {
+                    codes.forEach((code, i) => { result[dims[node.d][code]] = decode(node.v[i]); });
+                }
+                return result;
+            };
+            return decode(payload.root);
+        }
 
-            <div class="stats-grid">
-                <div class="stat-card">
-                    <div class="stat-label">Total Tarjetas Revisadas</div>
-                    <div class="stat-value">""" + str(stats['qa']['historical']['total_revisadas']) + """</div>
-                    <p class="small-text">En """ + str(stats['total_weeks']) + """ semanas</p>
-                </div>
+        // Payload comprimido (ver compress_payload): base64 de un gzip del formato columnar
+        async function inflateStats(base64) {
+            const bytes = Uint8Array.from(atob(base64), char => char.charCodeAt(0));
+            const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+            return decodeStats(JSON.parse(await new Response(stream).text()));
+        }
 
-                <div class="stat-card">
-                    <div class="stat-label">Total Rechazadas</div>
-                    <div class="stat-value">""" + str(stats['qa']['historical']['total_rechazadas']) + """</div>
-                    <p class="small-text">""" + str(round(stats['qa']['historical']['total_rechazadas'] / stats['qa']['historical']['total_revisadas'] * 100, 2) if stats['qa']['historical']['total_revisadas'] > 0 else 0) + """% del total</p>
-                </div>
+        // Common Plotly layout options for consistency
+        const commonLayout = {
+            font: {
+                family: 'Inter, sans-serif',
+                size: 12,
+                color: 'var(--text-dark)'
+            },
+            paper_bgcolor: 'var(--card-background)',
+            plot_bgcolor: 'var(--card-background)',
+            margin: { t: 60, b: 80, l: 60, r: 30 },
+            hovermode: 'closest',
+            title: {
+                font: {
+                    size: 18,
+                    color: 'var(--text-dark)'
+                },
+                x: 0.05, // Align title to left
+                xanchor: 'left'
+            },
+            xaxis: {
+                showgrid: false,
+                zeroline: false,
+                linecolor: 'var(--border-light)',
+                linewidth: 1,
+                tickfont: { size: 10 }
+            },
+            yaxis: {
+                showgrid: true,
+                gridcolor: '#f0f0f0',
+                zeroline: false,
+                linecolor: 'var(--border-light)',
+                linewidth: 1,
+                tickfont: { size: 10 }
+            },
+            legend: {
+                orientation: 'h',
+                xanchor: 'center',
+                x: 0.5,
+                y: -0.2, // Below the chart
+                font: { size: 10 }
+            }
+        };
 
-                <div class="stat-card">
-                    <div class="stat-label">Tarjetas Web</div>
-                    <div class="stat-value">""" + str(stats['web']['historical']['total_revisadas']) + """</div>
-                    <p class="small-text">""" + str(stats['web']['historical']['porcentaje_rechazo']) + """% rechazadas</p>
-                </div>
+        // Los gráficos con una versión SVG pre-renderizada (data-static-chart) la conservan
+        // hasta la primera interacción, y entonces se sustituyen por el gráfico de Plotly
+        const chartInteractionEvents = ['mouseenter', 'touchstart', 'focusin'];
+        function plotChart(chartId, data, layout) {
+            const chartDiv = document.getElementById(chartId);
+            if (!chartDiv.hasAttribute('data-static-chart')) {
+                Plotly.newPlot(chartId, data, layout);
+                return;
+            }
+            const waiting = Boolean(chartDiv.pendingPlot);
+            chartDiv.pendingPlot = { data, layout };
+            if (waiting) {
+                return;
+            }
+            const upgrade = () => {
+                if (typeof Plotly === 'undefined') {
+                    return;
+                }
+                chartInteractionEvents.forEach(type => chartDiv.removeEventListener(type, upgrade));
+                chartDiv.removeAttribute('data-static-chart');
+                chartDiv.innerHTML = '';
+                Plotly.newPlot(chartId, chartDiv.pendingPlot.data, chartDiv.pendingPlot.layout);
+                chartDiv.pendingPlot = null;
+            };
+            chartInteractionEvents.forEach(type => chartDiv.addEventListener(type, upgrade, { passive: true }));
+        }
 
-                <div class="stat-card">
-                    <div class="stat-label">Tarjetas App</div>
-                    <div class="stat-value">""" + str(stats['app']['historical']['total_revisadas']) + """</div>
-                    <p class="small-text">""" + str(stats['app']['historical']['porcentaje_rechazo']) + """% rechazadas</p>
-                </div>
-            </div>
+        // Tablas virtualizadas de desarrolladores y sitios: solo las filas visibles del conjunto
+        // filtrado y ordenado están en el DOM; filas espaciadoras ocupan el alto del resto
+        const VIRTUAL_TABLE_OVERSCAN = 8;
+        const virtualTables = {};
+        const virtualTableSources = {
+            devWebTable: { data: () => allStats.dev_web, renderRow: (dev, data) => devTableRow(dev, data, 'web'), columns: 7, noun: 'desarrolladores' },
+            devAppTable: { data: () => allStats.dev_app, renderRow: (dev, data) => devTableRow(dev, data, 'app'), columns: 7, noun: 'desarrolladores' },
+            siteTable: { data: () => allStats.sites, renderRow: siteTableRow, columns: 9, noun: 'sitios' }
+        };
 
-            <div class="chart-container">
-                <div id="summaryChart"></div>
-            </div>
+        function escapeHtml(value) {
+            const entities = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+            return String(value).replace(/[&<>"']/g, c => entities[c]);
+        }
 
-            <h3 class="section-title">Distribución por Plataforma</h3>
-            <div class="chart-container">
-                <div id="platformChart"></div>
-            </div>
-        </div>
+        function percentageClass(value) {
+            return value > 20 ? 'high' : (value > 10 ? 'medium' : 'low');
+        }
 
-        <div id="qa" class="tab-content">
-            <h2 class="section-title">Estadísticas Completas de QA</h2>
+        function devTableRow(dev, data, devType) {
+            return `
+                <tr class="developer-table-row" ondblclick="showDevWeeklyMetrics(${escapeHtml(JSON.stringify(dev))}, '${devType}')">
+                    <td data-label="Desarrollador">${escapeHtml(dev)}</td>
+                    <td data-label="Total Tarjetas">${data.total_tarjetas}</td>
+                    <td data-label="Rechazadas">${data.rechazadas}</td>
+                    <td data-label="Aceptadas">${data.aceptadas}</td>
+                    <td data-label="Promedio Semanal (Histórico)">${data.promedio_semanal_historico}</td>
+                    <td data-label="% Rechazo"><span class="percentage ${percentageClass(data.porcentaje_rechazo)}">${data.porcentaje_rechazo}%</span></td>
+                    <td data-label="Semanas Activo">${data.semanas_activo}</td>
+                </tr>`;
+        }
 
-            <div class="info-box">
-                <h3>📊 Resumen Histórico de QA</h3>
-                <p><strong>Total de tarjetas revisadas:</strong> """ + str(stats['qa']['historical']['total_revisadas']) + """</p>
-                <p><strong>Total de tarjetas rechazadas:</strong> """ + str(stats['qa']['historical']['total_rechazadas']) + """</p>
-            </div>
+        function siteTableRow(site, data) {
+            return `
+                <tr>
+                    <td data-label="Sitio">${escapeHtml(site)}</td>
+                    <td data-label="Total">${data.total}</td>
+                    <td data-label="Web">${data.web}</td>
+                    <td data-label="App">${data.app}</td>
+                    <td data-label="Aceptadas">${data.aceptadas}</td>
+                    <td data-label="Rechazadas">${data.rechazadas}</td>
+                    <td data-label="Promedio/Semana">${data.promedio_por_semana}</td>
+                    <td data-label="Promedio Rechazadas/Semana">${data.promedio_rechazadas_semana}</td>
+                    <td data-label="Promedio Aceptadas/Semana">${data.promedio_aceptadas_semana}</td>
+                </tr>`;
+        }
 
-            <h3>Detalle por QA (Histórico)</h3>
-            <table>
-                <thead>
-                    <tr>
-                        <th>QA/PM</th>
-                        <th>Total Revisadas</th>
-                        <th>Total Rechazadas</th>
-                        <th>Promedio Semanal</th>
-                        <th>% Rechazo</th>
-                    </tr>
-                </thead>
-                <tbody>"""
+        function initVirtualTable(tableId) {
+            if (virtualTables[tableId]) {
+                renderVirtualTable(tableId);
+                return;
+            }
+            const container = document.getElementById(tableId);
+            const source = virtualTableSources[tableId];
+            virtualTables[tableId] = {
+                source,
+                entries: Object.entries(source.data()),
+                view: [],
+                sortKey: null,
+                sortDirection: 1,
+                filter: '',
+                rowHeight: 50,
+                renderPending: false,
+                viewport: container.querySelector('.virtual-table-viewport'),
+                tbody: container.querySelector('tbody'),
+                count: container.querySelector('.table-count')
+            };
+            updateVirtualTableView(tableId);
+        }
 
-        # Agregar datos de QA
-        for qa, data in stats['qa']['historical']['por_qa'].items():
-            porcentaje_rechazo = round((data['total_rechazadas'] / data['total_revisadas'] * 100) if data['total_revisadas'] > 0 else 0, 2)
-            percentage_class = 'high' if porcentaje_rechazo > 20 else 'medium' if porcentaje_rechazo > 10 else 'low'
-            html += f"""
-                <tr>
-                    <td data-label="QA/PM">{qa}</td>
-                    <td data-label="Total Revisadas">{data['total_revisadas']}</td>
-                    <td data-label="Total Rechazadas">{data['total_rechazadas']}</td>
-                    <td data-label="Promedio Semanal">{data['promedio_semanal']:.2f}</td>
-                    <td data-label="% Rechazo"><span class="percentage {percentage_class}">{porcentaje_rechazo}%</span></td>
-                </tr>"""
+        function updateVirtualTableView(tableId) {
+            const table = virtualTables[tableId];
+            const filter = table.filter.toLowerCase();
+            const view = filter ? table.entries.filter(([name]) => name.toLowerCase().includes(filter)) : table.entries.slice();
+            if (table.sortKey !== null) {
+                const key = table.sortKey;
+                const direction = table.sortDirection;
+                view.sort((a, b) => direction * (key === '' ? a[0].localeCompare(b[0]) : a[1][key] - b[1][key]));
+            }
+            table.view = view;
+            table.viewport.scrollTop = 0;
+            renderVirtualTable(tableId);
+        }
 
-        html += """
-                </tbody>
-            </table>
+        function sortVirtualTable(tableId, key) {
+            const table = virtualTables[tableId];
+            if (!table) {
+                return;
+            }
+            if (table.sortKey === key) {
+                table.sortDirection = -table.sortDirection;
+            } else {
+                table.sortKey = key;
+                table.sortDirection = key === '' ? 1 : -1;
+            }
+            document.querySelectorAll(`#${tableId} th`).forEach(th => {
+                const sorted = th.dataset.key === key;
+                th.setAttribute('aria-sort', sorted ? (table.sortDirection > 0 ? 'ascending' : 'descending') : 'none');
+            });
+            updateVirtualTableView(tableId);
+        }
 
-            <h3>Vista Semanal de QA</h3>
-            <div class="week-selector">
-                <label>Seleccionar semana: </label>
-                <select id="qaWeekSelector" onchange="updateQAWeekView()">
-                    <option value="all">Todas las semanas</option>"""
+        function filterVirtualTable(tableId, text) {
+            const table = virtualTables[tableId];
+            if (!table) {
+                return;
+            }
+            table.filter = text.trim();
+            updateVirtualTableView(tableId);
+        }
 
-        for week in stats['weeks_list']:
-            html += f'<option value="{week}">{week}</option>'
+        function scheduleVirtualTableRender(tableId) {
+            const table = virtualTables[tableId];
+            if (!table || table.renderPending) {
+                return;
+            }
+            table.renderPending = true;
+            requestAnimationFrame(() => {
+                table.renderPending = false;
+                renderVirtualTable(tableId);
+            });
+        }
 
-        html += """
-                </select>
-            </div>
-            <div id="qaWeeklyDetails"></div>
-        </div>
+        function renderVirtualTable(tableId) {
+            const table = virtualTables[tableId];
+            const total = table.view.length;
+            const visibleRows = Math.ceil((table.viewport.clientHeight || 600) / table.rowHeight);
+            const start = Math.max(0, Math.floor(table.viewport.scrollTop / table.rowHeight) - VIRTUAL_TABLE_OVERSCAN);
+            const end = Math.min(total, start + visibleRows + 2 * VIRTUAL_TABLE_OVERSCAN);
+            const spacer = height => `<tr class="virtual-spacer"><td colspan="${table.source.columns}" style="height: ${height}px"></td></tr>`;
+            // Con un número par de filas por encima se añade un espaciador vacío para que el
+            // rayado tr:nth-child(even) siga la posición real de cada fila
+            let html = spacer(start * table.rowHeight) + (start % 2 === 0 ? spacer(0) : '');
+            html += table.view.slice(start, end).map(([name, data]) => table.source.renderRow(name, data)).join('');
+            html += spacer((total - end) * table.rowHeight);
+            table.tbody.innerHTML = html;
+
+            // El alto real de fila (cambia en móvil) se mide con las dos primeras filas dibujadas
+            const rows = table.tbody.querySelectorAll('tr:not(.virtual-spacer)');
+            if (rows.length > 1 && rows[1].offsetTop > rows[0].offsetTop) {
+                table.rowHeight = rows[1].offsetTop - rows[0].offsetTop;
+            }
+            table.count.textContent = `${total} de ${table.entries.length} ${table.source.noun}`;
+        }
 
-        <div id="web" class="tab-content">
-            <h2 class="section-title">Estadísticas Completas Web</h2>
+        // Function to change tabs
+        function showTab(tabName) {
+            // Ocultar todos los tabs
+            const tabs = document.querySelectorAll('.tab-content');
+            tabs.forEach(tab => tab.classList.remove('active'));
 
-            <div class="metric-group">
-                <h4>🌐 Totales Históricos Web</h4>
-                <p><strong>Número de tarjetas revisadas:</strong> """ + str(stats['web']['historical']['total_revisadas']) + """</p>
-                <p><strong>Número de tarjetas rechazadas:</strong> """ + str(stats['web']['historical']['total_rechazadas']) + """</p>
-                <p><strong>Número de tarjetas aceptadas:</strong> """ + str(stats['web']['historical']['total_aceptadas']) + """</p>
-                <p><strong>Porcentaje de rechazo:</strong> <span class="highlight">""" + str(stats['web']['historical']['porcentaje_rechazo']) + """%</span></p>
-            </div>
+            // Desactivar todos los botones
+            const buttons = document.querySelectorAll('.tab-button');
+            buttons.forEach(btn => btn.classList.remove('active'));
 
-            <h3>Estadísticas Web por Semana</h3>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Semana</th>
-                        <th>Revisadas</th>
-                        <th>Aceptadas</th>
-                        <th>Rechazadas</th>
-                        <th>% Rechazo</th>
-                    </tr>
-                </thead>
-                <tbody>"""
+            // Mostrar tab seleccionado
+            document.getElementById(tabName).classList.add('active');
 
-        # Datos semanales Web
-        for week, data in stats['web']['weekly'].items():
-            percentage_class = 'high' if data['porcentaje_rechazo'] > 20 else 'medium' if data['porcentaje_rechazo'] > 10 else 'low'
-            html += f"""
-                <tr>
-                    <td data-label="Semana">{week}</td>
-                    <td data-label="Revisadas">{data['revisadas']}</td>
-                    <td data-label="Aceptadas">{data['aceptadas']}</td>
-                    <td data-label="Rechazadas">{data['rechazadas']}</td>
-                    <td data-label="% Rechazo"><span class="percentage {percentage_class}">{data['porcentaje_rechazo']}%</span></td>
-                </tr>"""
+            // Activar botón correspondiente
+            const buttonTextMap = {
+                'resumen': 'Resumen General',
+                'qa': 'QA',
+                'web': 'Web',
+                'app': 'App',
+                'devs': 'Desarrolladores',
+                'pm': 'PM',
+                'sites': 'Sitios',
+                'weekly': 'Vista Semanal',
+                'explorer': 'Explorar'
+            };
+            const clickedButton = Array.from(document.querySelectorAll('.tab-button')).find(btn => btn.textContent.includes(buttonTextMap[tabName]));
+            if (clickedButton) {
+                clickedButton.classList.add('active');
+            }
+
+
+            // Cargar gráficos según el tab
+            if (tabName === 'resumen') {
+                loadSummaryCharts();
+                updateReworkView();
+            } else if (tabName === 'qa') {
+                updateTurnaroundView();
+            } else if (tabName === 'web') {
+                loadWebCharts();
+            } else if (tabName === 'app') {
+                loadAppCharts();
+            } else if (tabName === 'devs') {
+                initVirtualTable('devWebTable');
+                initVirtualTable('devAppTable');
+                loadDevCharts();
+                // Hide any previously shown developer weekly details
+                document.getElementById('devWebWeeklyDetails').style.display = 'none';
+                document.getElementById('devAppWeeklyDetails').style.display = 'none';
+            } else if (tabName === 'pm') {
+                loadPMCharts();
+            } else if (tabName === 'sites') {
+                initVirtualTable('siteTable');
+                loadSiteCharts();
+            } else if (tabName === 'explorer') {
+                initExplorer();
+            }
+        }
+
+        // Explorador: re-agrega la tabla de hechos (allStats.facts, ver get_fact_table) con los filtros
+        // elegidos. aggregateFacts corre en un Web Worker para que la página siga respondiendo con
+        // cientos de miles de tarjetas; si no hay Workers, en el hilo principal.
+        function aggregateFacts(facts, query) {
+            const start = Date.now();
+            const names = Object.keys(facts.codes);
+            const codes = names.map(name => facts.codes[name]);
+            const weekIndex = names.indexOf('semana');
+            const weekLow = Math.min(query.weekFrom, query.weekTo);
+            const weekHigh = Math.max(query.weekFrom, query.weekTo);
+            const filters = names.map(name => name in query.filters ? query.filters[name] : -1);
+            const groupCodes = facts.codes[query.groupBy];
+            const groupSize = facts.sizes[query.groupBy];
+            const { n, rechazadas, aceptadas } = facts.measures;
+
+            const totals = { n: 0, rechazadas: 0, aceptadas: 0 };
+            const groups = {
+                n: new Float64Array(groupSize), rechazadas: new Float64Array(groupSize), aceptadas: new Float64Array(groupSize)
+            };
+            const weekly = { n: new Float64Array(facts.sizes.semana), rechazadas: new Float64Array(facts.sizes.semana) };
+            // Tarjetas por opción de cada filtro con el resto de filtros aplicados
+            const facets = names.map(name => new Float64Array(facts.sizes[name]));
+
+            for (let row = 0; row < facts.rows; row++) {
+                // Filtro que la fila no cumple: -1 ninguno, -2 más de uno
+                let failed = -1;
+                for (let d = 0; d < codes.length; d++) {
+                    const code = codes[d][row];
+                    const pass = d === weekIndex ? code >= weekLow && code <= weekHigh : filters[d] < 0 || code === filters[d];
+                    if (!pass) {
+                        if (failed !== -1) {
+                            failed = -2;
+                            break;
+                        }
+                        failed = d;
+                    }
+                }
+                if (failed === -2) {
+                    continue;
+                }
+                const count = n[row];
+                if (failed === -1) {
+                    totals.n += count;
+                    totals.rechazadas += rechazadas[row];
+                    totals.aceptadas += aceptadas[row];
+                    const group = groupCodes[row];
+                    groups.n[group] += count;
+                    groups.rechazadas[group] += rechazadas[row];
+                    groups.aceptadas[group] += aceptadas[row];
+                    for (let d = 0; d < codes.length; d++) {
+                        facets[d][codes[d][row]] += count;
+                    }
+                } else {
+                    facets[failed][codes[failed][row]] += count;
+                }
+                // La serie semanal no aplica el rango de semanas: se recorta al dibujarla
+                if (failed === -1 || failed === weekIndex) {
+                    weekly.n[codes[weekIndex][row]] += count;
+                    weekly.rechazadas[codes[weekIndex][row]] += rechazadas[row];
+                }
+            }
+
+            const groupRows = [];
+            for (let code = 0; code < groupSize; code++) {
+                if (groups.n[code] > 0) {
+                    groupRows.push({ code, n: groups.n[code], rechazadas: groups.rechazadas[code], aceptadas: groups.aceptadas[code] });
+                }
+            }
+            groupRows.sort((a, b) => b.n - a.n);
+            const facetCounts = {};
+            names.forEach((name, d) => { facetCounts[name] = Array.from(facets[d]); });
+            return {
+                id: query.id,
+                groupBy: query.groupBy,
+                totals,
+                groups: groupRows,
+                facets: facetCounts,
+                weekly: { n: Array.from(weekly.n), rechazadas: Array.from(weekly.rechazadas) },
+                elapsed: Date.now() - start
+            };
+        }
+
+        const explorer = { facts: null, labels: null, worker: null, queryId: 0 };
+
+        function factArray([type, base64]) {
+            const bytes = Uint8Array.from(atob(base64), char => char.charCodeAt(0));
+            const arrayTypes = { Uint8: Uint8Array, Uint16: Uint16Array, Uint32: Uint32Array };
+            return new arrayTypes[type](bytes.buffer);
+        }
+
+        function explorerLabel(label) {
+            return label === null ? '(sin dato)' : String(label).replace('tarjetas semana ', '');
+        }
+
+        function explorerPercentage(rechazadas, total) {
+            return total > 0 ? Math.round(rechazadas / total * 10000) / 100 : 0;
+        }
+
+        function initExplorer() {
+            if (explorer.facts) {
+                return;
+            }
+            const source = allStats.facts;
+            const facts = { rows: source.rows, codes: {}, sizes: {}, measures: {} };
+            for (const [name, column] of Object.entries(source.codes)) {
+                facts.codes[name] = factArray(column);
+                facts.sizes[name] = source.dimensions[name].length;
+            }
+            for (const [name, column] of Object.entries(source.measures)) {
+                facts.measures[name] = factArray(column);
+            }
+            explorer.facts = facts;
+            explorer.labels = source.dimensions;
+
+            const weekOptions = source.dimensions.semana
+                .map((week, code) => `<option value="${code}">${escapeHtml(explorerLabel(week))}</option>`).join('');
+            document.getElementById('explorerWeekFrom').innerHTML = weekOptions;
+            document.getElementById('explorerWeekTo').innerHTML = weekOptions;
+            document.getElementById('explorerWeekFrom').value = '0';
+            document.getElementById('explorerWeekTo').value = String(source.dimensions.semana.length - 1);
+            for (const name of Object.keys(source.dimensions)) {
+                if (name !== 'semana') {
+                    renderExplorerOptions(name, null);
+                }
+            }
+
+            try {
+                const workerSource = aggregateFacts.toString() + `
+                    let facts = null;
+                    onmessage = event => {
+                        if (event.data.facts) {
+                            facts = event.data.facts;
+                        } else {
+                            postMessage(aggregateFacts(facts, event.data));
+                        }
+                    };`;
+                explorer.worker = new Worker(URL.createObjectURL(new Blob([workerSource], { type: 'text/javascript' })));
+                explorer.worker.onmessage = event => renderExplorer(event.data);
+                explorer.worker.postMessage({ facts });
+            } catch (error) {
+                explorer.worker = null;
+            }
+            updateExplorer();
+        }
+
+        function renderExplorerOptions(name, counts) {
+            const select = document.getElementById(`explorer-${name}`);
+            const selected = select.value || '-1';
+            let html = '<option value="-1">Todos</option>';
+            explorer.labels[name].forEach((label, code) => {
+                const count = counts ? ` (${counts[code]})` : '';
+                html += `<option value="${code}">${escapeHtml(explorerLabel(label))}${count}</option>`;
+            });
+            select.innerHTML = html;
+            select.value = selected;
+        }
+
+        function updateExplorer() {
+            if (!explorer.facts) {
+                return;
+            }
+            const query = {
+                id: ++explorer.queryId,
+                weekFrom: Number(document.getElementById('explorerWeekFrom').value),
+                weekTo: Number(document.getElementById('explorerWeekTo').value),
+                groupBy: document.getElementById('explorerGroupBy').value,
+                filters: {}
+            };
+            for (const name of Object.keys(explorer.labels)) {
+                if (name !== 'semana') {
+                    query.filters[name] = Number(document.getElementById(`explorer-${name}`).value || -1);
+                }
+            }
+            document.getElementById('explorerStatus').textContent = 'Calculando...';
+            if (explorer.worker) {
+                explorer.worker.postMessage(query);
+            } else {
+                renderExplorer(aggregateFacts(explorer.facts, query));
+            }
+        }
+
+        function renderExplorer(result) {
+            // Solo se dibuja la respuesta a la última consulta
+            if (result.id !== explorer.queryId) {
+                return;
+            }
+            const { totals } = result;
+            const cards = [
+                ['Tarjetas', totals.n],
+                ['Rechazadas', totals.rechazadas],
+                ['Aceptadas', totals.aceptadas],
+                ['% Rechazo', explorerPercentage(totals.rechazadas, totals.n) + '%']
+            ];
+            document.getElementById('explorerTotals').innerHTML = cards.map(([label, value]) => `
+                <div class="stat-card">
+                    <div class="stat-label">${label}</div>
+                    <div class="stat-value">${value}</div>
+                </div>`).join('');
+
+            for (const name of Object.keys(explorer.labels)) {
+                if (name !== 'semana') {
+                    renderExplorerOptions(name, result.facets[name]);
+                }
+            }
+
+            const weekFrom = Number(document.getElementById('explorerWeekFrom').value);
+            const weekTo = Number(document.getElementById('explorerWeekTo').value);
+            const weekCodes = [];
+            for (let code = Math.min(weekFrom, weekTo); code <= Math.max(weekFrom, weekTo); code++) {
+                weekCodes.push(code);
+            }
+            const weeks = weekCodes.map(code => explorerLabel(explorer.labels.semana[code]));
+            const data = [
+                {
+                    x: weeks,
+                    y: weekCodes.map(code => result.weekly.n[code]),
+                    name: 'Tarjetas',
+                    type: 'bar',
+                    marker: { color: '#4A00E0' }
+                },
+                {
+                    x: weeks,
+                    y: weekCodes.map(code => explorerPercentage(result.weekly.rechazadas[code], result.weekly.n[code])),
+                    name: '% Rechazo',
+                    type: 'scatter',
+                    mode: 'lines+markers',
+                    yaxis: 'y2',
+                    line: { color: '#FF6347', width: 3 }
+                }
+            ];
+            const layout = {
+                ...commonLayout,
+                title: 'Tarjetas y Rechazo por Semana (con los filtros aplicados)',
+                xaxis: { title: 'Semana' },
+                yaxis: { title: 'Tarjetas' },
+                yaxis2: { title: '% Rechazo', overlaying: 'y', side: 'right', range: [0, 100] },
+                height: 400
+            };
+            if (typeof Plotly !== 'undefined') {
+                Plotly.react('explorerChart', data, layout);
+            }
+
+            const groupLabels = explorer.labels[result.groupBy];
+            const shown = result.groups.slice(0, 100);
+            let html = '<table><thead><tr><th>Valor</th><th>Tarjetas</th><th>Rechazadas</th><th>Aceptadas</th><th>% Rechazo</th></tr></thead><tbody>';
+            for (const group of shown) {
+                const porcentaje = explorerPercentage(group.rechazadas, group.n);
+                html += `<tr>
+                    <td data-label="Valor">${escapeHtml(explorerLabel(groupLabels[group.code]))}</td>
+                    <td data-label="Tarjetas">${group.n}</td>
+                    <td data-label="Rechazadas">${group.rechazadas}</td>
+                    <td data-label="Aceptadas">${group.aceptadas}</td>
+                    <td data-label="% Rechazo"><span class="percentage ${percentageClass(porcentaje)}">${porcentaje}%</span></td>
+                </tr>`;
+            }
+            html += '</tbody></table>';
+            document.getElementById('explorerGroups').innerHTML = html;
+            const more = result.groups.length > shown.length ? ` (se muestran ${shown.length} de ${result.groups.length} valores)` : '';
+            document.getElementById('explorerStatus').textContent =
+                `${explorer.facts.rows} combinaciones agregadas en ${result.elapsed} ms${more}`;
+        }
+
+        // Cargar gráficos de resumen
+        function loadSummaryCharts() {
+            // Gráfico de resumen general
+            const summaryData = [
+                {
+                    x: ['Web', 'App'],
+                    y: [allStats.web.historical.total_revisadas, allStats.app.historical.total_revisadas],
+                    name: 'Total Revisadas',
+                    type: 'bar',
+                    marker: { color: 'var(--primary-color)' }
+                },
+                {
+                    x: ['Web', 'App'],
+                    y: [allStats.web.historical.total_rechazadas, allStats.app.historical.total_rechazadas],
+                    name: 'Rechazadas',
+                    type: 'bar',
+                    marker: { color: 'var(--danger-color)' }
+                },
+                {
+                    x: ['Web', 'App'],
+                    y: [allStats.web.historical.total_aceptadas, allStats.app.historical.total_aceptadas],
+                    name: 'Aceptadas',
+                    type: 'bar',
+                    marker: { color: 'var(--success-color)' }
+                }
+            ];
+
+            const summaryLayout = {
+                ...commonLayout,
+                title: 'Resumen General - Web vs App',
+                barmode: 'group',
+                height: 400
+            };
+
+            plotChart('summaryChart', summaryData, summaryLayout);
+
+            // Gráfico de plataformas
+            const platformData = {
+                labels: Object.keys(allStats.platforms),
+                values: Object.values(allStats.platforms),
+                type: 'pie',
+                hole: 0.4,
+                textposition: 'outside', // Changed to outside for better readability
+                textinfo: 'label+percent',
+                marker: {
+                    colors: [
+                        '#4A00E0', '#8E2DE2', '#00C9FF', '#FF8C00', '#20B2AA',
+                        '#FF6347', '#4682B4', '#DA70D6', '#3CB371', '#BA55D3'
+                    ]
+                },
+                hoverinfo: 'label+value+percent',
+                pull: [0.05, 0, 0, 0, 0, 0, 0, 0, 0, 0] // Slightly pull out the first slice
+            };
+
+            const platformLayout = {
+                ...commonLayout,
+                title: 'Distribución por Plataforma',
+                height: 400,
+                showlegend: true,
+                legend: {
+                    orientation: 'h',
+                    xanchor: 'center',
+                    x: 0.5,
+                    y: -0.2, // Below the chart
+                    font: { size: 10 }
+                }
+            };
+
+            plotChart('platformChart', [platformData], platformLayout);
+        }
+
+        // Cargar gráficos Web
+        function loadWebCharts() {
+            const weeks = Object.keys(allStats.web.weekly);
+            const webData = Object.values(allStats.web.weekly);
+
+            const webTrace = {
+                x: weeks.map(w => w.replace('tarjetas semana ', '')),
+                y: webData.map(d => d.porcentaje_rechazo),
+                type: 'scatter',
+                mode: 'lines+markers',
+                name: 'Porcentaje de Rechazo',
+                line: { color: 'var(--primary-color)', width: 3, shape: 'spline' },
+                marker: { size: 8, symbol: 'circle', color: 'var(--primary-color)', line: { width: 1, color: 'white' } },
+                hovertemplate: 'Semana: %{x}<br>Rechazo: %{y:.2f}%<extra></extra>'
+            };
+
+            const webLayout = {
+                ...commonLayout,
+                title: 'Tendencia de Rechazo Web por Semana',
+                xaxis: { title: 'Semana' },
+                yaxis: { title: 'Porcentaje de Rechazo (%)', range: [0, Math.max(...webData.map(d => d.porcentaje_rechazo)) * 1.2 || 100] },
+                height: 400
+            };
+
+            plotChart('webTrendChart', [webTrace], webLayout);
+        }
+
+        // Cargar gráficos App
+        function loadAppCharts() {
+            const weeks = Object.keys(allStats.app.weekly);
+            const appData = Object.values(allStats.app.weekly);
+
+            const appTrace = {
+                x: weeks.map(w => w.replace('tarjetas semana ', '')),
+                y: appData.map(d => d.porcentaje_rechazo),
+                type: 'scatter',
+                mode: 'lines+markers',
+                name: 'Porcentaje de Rechazo',
+                line: { color: 'var(--danger-color)', width: 3, shape: 'spline' },
+                marker: { size: 8, symbol: 'square', color: 'var(--danger-color)', line: { width: 1, color: 'white' } },
+                hovertemplate: 'Semana: %{x}<br>Rechazo: %{y:.2f}%<extra></extra>'
+            };
+
+            const appLayout = {
+                ...commonLayout,
+                title: 'Tendencia de Rechazo App por Semana',
+                xaxis: { title: 'Semana' },
+                yaxis: { title: 'Porcentaje de Rechazo (%)', range: [0, Math.max(...appData.map(d => d.porcentaje_rechazo)) * 1.2 || 100] },
+                height: 400
+            };
+
+            plotChart('appTrendChart', [appTrace], appLayout);
+        }
+
+        // Cargar gráficos de desarrolladores
+        function loadDevCharts() {
+            // Top 5 desarrolladores Web vs App
+            const top5Web = Object.entries(allStats.dev_web).slice(0, 5);
+            const top5App = Object.entries(allStats.dev_app).slice(0, 5);
+
+            const traces = [
+                {
+                    x: top5Web.map(([dev, data]) => dev),
+                    y: top5Web.map(([dev, data]) => data.total_tarjetas),
+                    name: 'Web - Total',
+                    type: 'bar',
+                    marker: { color: 'var(--primary-color)' }
+                },
+                {
+                    x: top5Web.map(([dev, data]) => dev),
+                    y: top5Web.map(([dev, data]) => data.rechazadas),
+                    name: 'Web - Rechazadas',
+                    type: 'bar',
+                    marker: { color: 'rgba(74, 0, 224, 0.6)' } // Lighter primary
+                },
+                {
+                    x: top5App.map(([dev, data]) => dev),
+                    y: top5App.map(([dev, data]) => data.total_tarjetas),
+                    name: 'App - Total',
+                    type: 'bar',
+                    marker: { color: 'var(--danger-color)' }
+                },
+                {
+                    x: top5App.map(([dev, data]) => dev),
+                    y: top5App.map(([dev, data]) => data.rechazadas),
+                    name: 'App - Rechazadas',
+                    type: 'bar',
+                    marker: { color: 'rgba(231, 76, 60, 0.6)' } // Lighter danger
+                }
+            ];
+
+            const layout = {
+                ...commonLayout,
+                title: 'Top 5 Desarrolladores - Comparación Web vs App',
+                barmode: 'group',
+                height: 500,
+                xaxis: { tickangle: -45 }
+            };
+
+            plotChart('devComparisonChart', traces, layout);
+        }
+
+        // Cargar gráficos PM
+        function loadPMCharts() {
+            const weeks = Object.keys(allStats.pm.por_semana);
+            const pmData = Object.values(allStats.pm.por_semana);
+
+            const traces = [
+                {
+                    x: weeks.map(w => w.replace('tarjetas semana ', '')),
+                    y: pmData.map(d => d.alta),
+                    name: 'Alta',
+                    type: 'scatter',
+                    mode: 'lines+markers',
+                    line: { color: 'var(--danger-color)', width: 3, shape: 'spline' },
+                    marker: { size: 8 }
+                },
+                {
+                    x: weeks.map(w => w.replace('tarjetas semana ', '')),
+                    y: pmData.map(d => d.media),
+                    name: 'Media',
+                    type: 'scatter',
+                    mode: 'lines+markers',
+                    line: { color: 'var(--warning-color)', width: 3, shape: 'spline' },
+                    marker: { size: 8 }
+                },
+                {
+                    x: weeks.map(w => w.replace('tarjetas semana ', '')),
+                    y: pmData.map(d => d.baja),
+                    name: 'Baja',
+                    type: 'scatter',
+                    mode: 'lines+markers',
+                    line: { color: 'var(--success-color)', width: 3, shape: 'spline' },
+                    marker: { size: 8 }
+                }
+            ];
+
+            const layout = {
+                ...commonLayout,
+                title: 'Evolución de Prioridades por Semana',
+                xaxis: { title: 'Semana' },
+                yaxis: { title: 'Número de Tarjetas' },
+                height: 400
+            };
+
+            plotChart('priorityChart', traces, layout);
+        }
+
+        // Cargar gráficos de sitios
+        function loadSiteCharts() {
+            const top10Sites = Object.entries(allStats.sites).slice(0, 10);
+
+            const traces = [
+                {
+                    x: top10Sites.map(([site, data]) => site),
+                    y: top10Sites.map(([site, data]) => data.web),
+                    name: 'Web',
+                    type: 'bar',
+                    marker: { color: 'var(--primary-color)' }
+                },
+                {
+                    x: top10Sites.map(([site, data]) => site),
+                    y: top10Sites.map(([site, data]) => data.app),
+                    name: 'App',
+                    type: 'bar',
+                    marker: { color: 'var(--danger-color)' }
+                }
+            ];
+
+            const layout = {
+                ...commonLayout,
+                title: 'Top 10 Sitios - Distribución Web vs App',
+                barmode: 'stack',
+                height: 400,
+                xaxis: { tickangle: -45 }
+            };
+
+            plotChart('siteChart', traces, layout);
+        }
+
+        // Actualizar vista semanal
+        function updateWeeklyView() {
+            const selectedWeek = document.getElementById('weekSelector').value;
+            const weekData = {
+                qa: allStats.qa.weekly[selectedWeek],
+                web: allStats.web.weekly[selectedWeek],
+                app: allStats.app.weekly[selectedWeek],
+                pm: allStats.pm.por_semana[selectedWeek]
+            };
+
+            let html = '<div class="info-box">';
+            html += '<h3>Resumen de ' + selectedWeek + '</h3>';
+            html += '<div class="stats-grid">';
+            html += '<div class="metric-group">';
+            html += '<h4>QA</h4>';
+            html += '<p>Total tarjetas: <strong>' + weekData.qa.total_semana + '</strong></p>';
+            html += '<p>Total rechazadas: <strong>' + weekData.qa.total_rechazadas_semana + '</strong></p>';
+            html += '</div>';
+            html += '<div class="metric-group">';
+            html += '<h4>Web</h4>';
+            html += '<p>Revisadas: <strong>' + weekData.web.revisadas + '</strong></p>';
+            html += '<p>Aceptadas: <strong>' + weekData.web.aceptadas + '</strong></p>';
+            html += '<p>Rechazadas: <strong>' + weekData.web.rechazadas + '</strong></p>';
+            html += '<p>% Rechazo: <span class="highlight">' + weekData.web.porcentaje_rechazo + '%</span></p>';
+            html += '</div>';
+            html += '<div class="metric-group">';
+            html += '<h4>App</h4>';
+            html += '<p>Revisadas: <strong>' + weekData.app.revisadas + '</strong></p>';
+            html += '<p>Aceptadas: <strong>' + weekData.app.aceptadas + '</strong></p>';
+            html += '<p>Rechazadas: <strong>' + weekData.app.rechazadas + '</strong></p>';
+            html += '<p>% Rechazo: <span class="highlight">' + weekData.app.porcentaje_rechazo + '%</span></p>';
+            html += '</div>';
+            html += '<div class="metric-group">';
+            html += '<h4>Prioridades</h4>';
+            html += '<p>Alta: <strong>' + weekData.pm.alta + '</strong></p>';
+            html += '<p>Media: <strong>' + weekData.pm.media + '</strong></p>';
+            html += '<p>Baja: <strong>' + weekData.pm.baja + '</strong></p>';
+            html += '</div>';
+            html += '</div>';
+            html += '</div>';
+
+            document.getElementById('weeklyAnalysis').innerHTML = html;
+        }
+
+        // Actualizar vista semanal de QA
+        function updateQAWeekView() {
+            const selector = document.getElementById('qaWeekSelector');
+            const selectedWeek = selector.value;
+
+            if (selectedWeek === 'all') {
+                document.getElementById('qaWeeklyDetails').innerHTML = '';
+                return;
+            }
+
+            const weekData = allStats.qa.weekly[selectedWeek];
+            let html = '<div class="info-box">';
+            html += '<h4>Detalle de ' + selectedWeek + '</h4>';
+            html += '<table><thead><tr><th>QA/PM</th><th>Tarjetas Revisadas</th><th>Tarjetas Rechazadas</th></tr></thead><tbody>';
+
+            for (const [qa, count] of Object.entries(weekData.tarjetas_por_qa)) {
+                const rechazadas = weekData.rechazadas_por_qa[qa] || 0;
+                html += `<tr>
+                            <td data-label="QA/PM">${qa}</td>
+                            <td data-label="Tarjetas Revisadas">${count}</td>
+                            <td data-label="Tarjetas Rechazadas">${rechazadas}</td>
+                         </tr>`;
+            }
+
+            html += '</tbody></table></div>';
+            document.getElementById('qaWeeklyDetails').innerHTML = html;
+        }
+
+        // Retrabajo (allStats.rework) agrupado según reworkGroupBy
+        function updateReworkView() {
+            const groupBy = document.getElementById('reworkGroupBy').value || 'por_desarrollador';
+            const label = { por_desarrollador: 'Desarrollador', por_sitio: 'Sitio', por_tipo: 'Web/App', por_semana: 'Semana' }[groupBy];
+            const groups = Object.entries(allStats.rework[groupBy]);
+            if (groupBy !== 'por_semana') {
+                groups.sort((a, b) => b[1].ciclos - a[1].ciclos);
+            }
+
+            let html = `<table><thead><tr><th>${label}</th><th>Tarjetas</th><th>Ciclos de Rechazo</th><th>Promedio por Tarjeta</th><th>Máximo</th><th>Con 2+ Rechazos</th><th>% con 2+</th></tr></thead><tbody>`;
+            for (const [name, data] of groups) {
+                html += `<tr>
+                            <td data-label="${label}">${escapeHtml(name)}</td>
+                            <td data-label="Tarjetas">${data.tarjetas}</td>
+                            <td data-label="Ciclos de Rechazo">${data.ciclos}</td>
+                            <td data-label="Promedio por Tarjeta">${data.promedio_ciclos}</td>
+                            <td data-label="Máximo">${data.max_ciclos}</td>
+                            <td data-label="Con 2+ Rechazos">${data.tarjetas_2_o_mas}</td>
+                            <td data-label="% con 2+"><span class="percentage ${percentageClass(data.porcentaje_2_o_mas)}">${data.porcentaje_2_o_mas}%</span></td>
+                         </tr>`;
+            }
+            html += '</tbody></table>';
+            document.getElementById('reworkDetails').innerHTML = html;
+        }
+
+        // Tiempo de respuesta de QA (allStats.turnaround) agrupado según turnaroundGroupBy
+        function updateTurnaroundView() {
+            const groupBy = document.getElementById('turnaroundGroupBy').value || 'por_qa';
+            const label = { por_qa: 'QA/PM', por_desarrollador: 'Desarrollador', por_sitio: 'Sitio', por_semana: 'Semana' }[groupBy];
+            const percentiles = allStats.turnaround.percentiles;
+            const groups = Object.entries(allStats.turnaround[groupBy]);
+            if (groupBy !== 'por_semana') {
+                groups.sort((a, b) => b[1].tarjetas - a[1].tarjetas);
+            }
+
+            let html = `<table><thead><tr><th>${label}</th><th>Tarjetas con Fechas</th>`;
+            html += percentiles.map(p => `<th>p${p} (días)</th>`).join('') + '</tr></thead><tbody>';
+            for (const [name, data] of groups) {
+                html += `<tr>
+                            <td data-label="${label}">${escapeHtml(name)}</td>
+                            <td data-label="Tarjetas con Fechas">${data.tarjetas}</td>`;
+                html += percentiles.map(p => `<td data-label="p${p} (días)">${data['p' + p]}</td>`).join('');
+                html += '</tr>';
+            }
+            if (groups.length === 0) {
+                html += `<tr><td colspan="${percentiles.length + 2}" style="text-align: center; color: var(--text-medium);">No hay tarjetas con ambas fechas.</td></tr>`;
+            }
+            html += '</tbody></table>';
+            document.getElementById('turnaroundDetails').innerHTML = html;
+        }
+
+        // NEW: Function to show weekly metrics for a specific developer
+        function showDevWeeklyMetrics(developerName, devType) {
+            let weeklyDetails = {};
+            let targetDivId = '';
+
+            if (devType === 'web') {
+                weeklyDetails = allStats.dev_web_weekly_details[developerName];
+                targetDivId = 'devWebWeeklyDetails';
+            } else if (devType === 'app') {
+                weeklyDetails = allStats.dev_app_weekly_details[developerName];
+                targetDivId = 'devAppWeeklyDetails';
+            }
+
+            let html = `<h3>Métricas Semanales para ${developerName} (${devType.toUpperCase()})</h3>`;
+            html += `<table>
+                        <thead>
+                            <tr>
+                                <th>Semana</th>
+                                <th>Total Tarjetas</th>
+                                <th>Rechazadas</th>
+                                <th>Aceptadas</th>
+                                <th>% Rechazo</th>
+                            </tr>
+                        </thead>
+                        <tbody>`;
+
+            if (!weeklyDetails || Object.keys(weeklyDetails).length === 0) {
+                html += `<tr><td colspan="5" style="text-align: center; color: var(--text-medium);">No hay datos semanales disponibles para este desarrollador.</td></tr>`;
+            } else {
+                for (const week of allStats.weeks_list) { // Iterate through all weeks to show gaps
+                    const data = weeklyDetails[week];
+                    if (data) {
+                        const percentageClass = data.porcentaje_rechazo > 20 ? 'high' : (data.porcentaje_rechazo > 10 ? 'medium' : 'low');
+                        html += `<tr>
+                                    <td data-label="Semana">${week}</td>
+                                    <td data-label="Total Tarjetas">${data.total_tarjetas}</td>
+                                    <td data-label="Rechazadas">${data.rechazadas}</td>
+                                    <td data-label="Aceptadas">${data.aceptadas}</td>
+                                    <td data-label="% Rechazo"><span class="percentage ${percentageClass}">${data.porcentaje_rechazo}%</span></td>
+                                </tr>`;
+                    } else {
+                        html += `<tr>
+                                    <td data-label="Semana">${week}</td>
+                                    <td colspan="4" style="text-align: center; color: var(--text-medium); font-style: italic;">(No activo esta semana)</td>
+                                </tr>`;
+                    }
+                }
+            }
+
+            html += `</tbody></table>`;
+
+            const targetDiv = document.getElementById(targetDivId);
+            targetDiv.innerHTML = html;
+            targetDiv.style.display = 'block'; // Make the div visible
+
+            // Scroll to the new details section
+            targetDiv.scrollIntoView({ behavior: 'smooth', block: 'start' });
+        }
+
+"""
+
+# Arranque del dashboard: dibuja el resumen e inicializa la vista semanal
+DASHBOARD_INIT_SCRIPT = """
+        // Cargar gráficos iniciales
+        loadSummaryCharts();
+        updateReworkView();
+
+        // Inicializar vista semanal con la primera semana
+        if (allStats.weeks_list.length > 0) {
+            document.getElementById('weekSelector').value = allStats.weeks_list[0];
+            updateWeeklyView();
+        }
+"""
+
+# Modo de datos separados: completa allStats bajo demanda con los JSON de dataFiles.
+# Espera las constantes globales dataFiles (archivo -> URL) y tabDataFiles.
+DASHBOARD_LAZY_SCRIPT = """
+        // Cada archivo de datos se pide una sola vez y se mezcla en allStats
+        const dataRequests = {};
+        function loadDataFile(name) {
+            if (!dataRequests[name]) {
+                dataRequests[name] = fetch(dataFiles[name])
+                    .then(response => {
+                        if (!response.ok) {
+                            throw new Error(`${name}.json: HTTP ${response.status}`);
+                        }
+                        return response.json();
+                    })
+                    .then(data => Object.assign(allStats, decodeStats(data)))
+                    .catch(error => {
+                        delete dataRequests[name];
+                        throw error;
+                    });
+            }
+            return dataRequests[name];
+        }
+
+        function loadTabData(tabName) {
+            return Promise.all((tabDataFiles[tabName] || []).map(loadDataFile));
+        }
+
+        // Los gráficos de cada pestaña se dibujan cuando sus datos ya llegaron
+        const renderTab = showTab;
+        showTab = function(tabName) {
+            loadTabData(tabName)
+                .then(() => renderTab(tabName))
+                .catch(error => console.error('No se pudieron cargar los datos del dashboard:', error));
+        };
+
+        const renderDevWeeklyMetrics = showDevWeeklyMetrics;
+        showDevWeeklyMetrics = function(developerName, devType) {
+            loadDataFile(`dev_${devType}_weekly`)
+                .then(() => renderDevWeeklyMetrics(developerName, devType))
+                .catch(error => console.error('No se pudieron cargar los datos del dashboard:', error));
+        };
+"""
+
+# Gráficos SVG estáticos: versión ligera de la vista inicial de cada gráfico, incrustada
+# en el HTML para el primer pintado. Las medidas imitan commonLayout del JS.
+SVG_CHART_WIDTH = 800
+PLATFORM_COLORS = ['#4A00E0', '#8E2DE2', '#00C9FF', '#FF8C00', '#20B2AA',
+                   '#FF6347', '#4682B4', '#DA70D6', '#3CB371', '#BA55D3']
+
+
+def _nice_ticks(max_value, count=5):
+    """Marcas redondas del eje Y desde 0 hasta cubrir max_value"""
+    if max_value <= 0:
+        return [0, 1]
+    raw_step = max_value / count
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw_step)
+    return [round(i * step, 10) for i in range(math.ceil(max_value / step - 1e-9) + 1)]
+
+
+def _svg_label(text, limit=20):
+    text = str(text)
+    return escape(text if len(text) <= limit else text[:limit - 1] + '…')
+
+
+def _svg_chart_frame(title, height, legend):
+    """Abre el SVG con el título y la leyenda ([(nombre, color)]); devuelve (partes, y donde empieza el gráfico)"""
+    parts = [
+        f'<svg viewBox="0 0 {SVG_CHART_WIDTH} {height}" width="100%" height="{height}" role="img" '
+        f'aria-label="{escape(title)}" xmlns="http://www.w3.org/2000/svg" '
+        f'style="font-family: Inter, sans-serif; font-size: 10px;">',
+        f'<text x="40" y="28" style="font-size: 18px; fill: var(--text-dark);">{escape(title)}</text>',
+    ]
+    x, y = 40, 46
+    for name, color in legend:
+        label = _svg_label(name)
+        if x > SVG_CHART_WIDTH - 150:
+            x, y = 40, y + 16
+        parts.append(f'<rect x="{x}" y="{y}" width="10" height="10" style="fill: {color};"/>')
+        parts.append(f'<text x="{x + 14}" y="{y + 9}" style="fill: var(--text-dark);">{label}</text>')
+        x += 30 + 6 * len(label)
+    return parts, y + 30
+
+
+def _svg_axes(parts, categories, ticks, top, height, tickangle):
+    """Dibuja rejilla, eje Y y etiquetas del eje X; devuelve ((izq, arriba, der, abajo), ancho de cada categoría)"""
+    left, right = 60, SVG_CHART_WIDTH - 30
+    band = (right - left) / max(len(categories), 1)
+    longest = max((len(_svg_label(category)) for category in categories), default=0)
+    if tickangle is None:
+        tickangle = -45 if longest * 6 > band else 0
+    bottom = height - 30 - (longest * 4.3 if tickangle else 0)
+    for tick in ticks:
+        y = bottom - (bottom - top) * tick / ticks[-1]
+        parts.append(f'<line x1="{left}" y1="{y:.1f}" x2="{right}" y2="{y:.1f}" style="stroke: #f0f0f0;"/>')
+        parts.append(f'<text x="{left - 6}" y="{y + 3:.1f}" text-anchor="end" style="fill: var(--text-dark);">{tick:g}</text>')
+    parts.append(f'<line x1="{left}" y1="{bottom:.1f}" x2="{right}" y2="{bottom:.1f}" style="stroke: var(--border-light);"/>')
+    for i, category in enumerate(categories):
+        x = left + band * (i + 0.5)
+        if tickangle:
+            parts.append(f'<text transform="translate({x:.1f},{bottom + 12:.1f}) rotate({tickangle})" text-anchor="end" '
+                         f'style="fill: var(--text-dark);">{_svg_label(category)}</text>')
+        else:
+            parts.append(f'<text x="{x:.1f}" y="{bottom + 16:.1f}" text-anchor="middle" '
+                         f'style="fill: var(--text-dark);">{_svg_label(category)}</text>')
+    return (left, top, right, bottom), band
+
+
+def svg_bar_chart(title, series, height=400, stacked=False, tickangle=None):
+    """Barras agrupadas o apiladas; series es [(nombre, {categoría: valor}, color)]"""
+    categories = list(dict.fromkeys(category for _, values, _ in series for category in values))
+    if stacked:
+        max_value = max((sum(values.get(category, 0) for _, values, _ in series) for category in categories), default=0)
+    else:
+        max_value = max((value for _, values, _ in series for value in values.values()), default=0)
+    ticks = _nice_ticks(max_value)
+    parts, top = _svg_chart_frame(title, height, [(name, color) for name, _, color in series])
+    (left, top, right, bottom), band = _svg_axes(parts, categories, ticks, top, height, tickangle)
+    scale = (bottom - top) / ticks[-1]
+    bar_width = band * 0.8 if stacked else band * 0.8 / max(len(series), 1)
+    for i, category in enumerate(categories):
+        base = bottom
+        for j, (_, values, color) in enumerate(series):
+            value = values.get(category, 0)
+            if not value:
+                continue
+            bar_height = value * scale
+            x = left + band * (i + 0.1) + (0 if stacked else j * bar_width)
+            parts.append(f'<rect x="{x:.1f}" y="{base - bar_height:.1f}" width="{bar_width:.1f}" '
+                         f'height="{bar_height:.1f}" style="fill: {color};"/>')
+            if stacked:
+                base -= bar_height
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+def svg_line_chart(title, categories, series, height=400, y_max=None, tickangle=None):
+    """Líneas con marcadores; series es [(nombre, [valores alineados con categories], color)]"""
+    if y_max is None:
+        y_max = max((value for _, values, _ in series for value in values), default=0)
+    ticks = _nice_ticks(y_max)
+    parts, top = _svg_chart_frame(title, height, [(name, color) for name, _, color in series])
+    (left, top, right, bottom), band = _svg_axes(parts, categories, ticks, top, height, tickangle)
+    scale = (bottom - top) / ticks[-1]
+    for _, values, color in series:
+        points = [(left + band * (i + 0.5), bottom - value * scale) for i, value in enumerate(values)]
+        path = ' '.join(f'{x:.1f},{y:.1f}' for x, y in points)
+        parts.append(f'<polyline points="{path}" style="fill: none; stroke: {color}; stroke-width: 3;"/>')
+        parts.extend(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="4" style="fill: {color}; stroke: white;"/>' for x, y in points)
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+def svg_donut_chart(title, labels, values, colors, height=400, hole=0.4):
+    """Anillo con las porciones ordenadas de mayor a menor, como Plotly, y el porcentaje fuera"""
+    legend = [(label, colors[i % len(colors)]) for i, label in enumerate(labels)]
+    parts, top = _svg_chart_frame(title, height, legend)
+    total = sum(values)
+    cx, cy = SVG_CHART_WIDTH / 2, (top + height) / 2
+    radius = (height - top) / 2 - 30
+    inner = radius * hole
+
+    def point(r, angle):
+        return cx + r * math.cos(angle), cy - r * math.sin(angle)
+
+    # Empieza arriba y gira en sentido antihorario
+    angle = math.pi / 2
+    order = sorted(range(len(values)), key=lambda i: -values[i])
+    for i in order:
+        if total <= 0 or values[i] <= 0:
+            continue
+        color = colors[i % len(colors)]
+        share = values[i] / total
+        if share >= 1:
+            parts.append(f'<circle cx="{cx:.1f}" cy="{cy:.1f}" r="{(radius + inner) / 2:.1f}" '
+                         f'style="fill: none; stroke: {color}; stroke-width: {radius - inner:.1f};"/>')
+        else:
+            end = angle + 2 * math.pi * share
+            large = 1 if share > 0.5 else 0
+            (x0, y0), (x1, y1) = point(radius, angle), point(radius, end)
+            (x2, y2), (x3, y3) = point(inner, end), point(inner, angle)
+            parts.append(f'<path d="M{x0:.1f},{y0:.1f} A{radius:.1f},{radius:.1f} 0 {large} 0 {x1:.1f},{y1:.1f} '
+                         f'L{x2:.1f},{y2:.1f} A{inner:.1f},{inner:.1f} 0 {large} 1 {x3:.1f},{y3:.1f} Z" '
+                         f'style="fill: {color}; stroke: white;"/>')
+        middle = angle + math.pi * share
+        if share >= 0.02:
+            x, y = point(radius + 12, middle)
+            anchor = 'start' if math.cos(middle) >= 0 else 'end'
+            parts.append(f'<text x="{x:.1f}" y="{y + 3:.1f}" text-anchor="{anchor}" style="fill: var(--text-dark);">'
+                         f'{_svg_label(labels[i])} {share * 100:.1f}%</text>')
+        angle += 2 * math.pi * share
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+def _json_key(key):
+    """Clave tal como la escribe json.dumps (los números, None y booleanos pasan a texto)"""
+    return key if isinstance(key, str) else next(iter(json.loads(json.dumps({key: None}))))
+
+
+def _typed_array(values):
+    """[tipo, base64] del array tipado sin signo más pequeño que admite `values` (enteros >= 0)"""
+    top = int(values.max()) if len(values) else 0
+    array_type, dtype = next((name, dtype) for name, dtype, limit in
+                             (('Uint8', '<u1', 0xFF), ('Uint16', '<u2', 0xFFFF), ('Uint32', '<u4', 0xFFFFFFFF))
+                             if top <= limit)
+    return [array_type, base64.b64encode(np.asarray(values, dtype=dtype).tobytes()).decode('ascii')]
+
+
+def encode_stats_payload(stats, dimensions):
+    """
+    Codifica las estadísticas en formato columnar con diccionarios de dimensiones.
+    dimensions es {nombre: conjunto de claves} (semanas, QAs, desarrolladores, sitios...).
+    Las claves de cada diccionario se guardan como códigos de la primera dimensión que las
+    contiene todas, o de 'keys' (nombres de campo y demás), como diferencias entre códigos
+    sucesivos o, si son consecutivos, solo el primero. Si los valores son registros con
+    los mismos campos, el diccionario se guarda como tabla, con una lista de valores por campo.
+    decodeStats (DASHBOARD_SCRIPT) reconstruye el mismo objeto que JSON.parse(json.dumps(stats)).
+    """
+    pools = {name: {} for name in [*dimensions, 'keys']}
+
+    def code(pool, key):
+        codes = pools[pool]
+        return codes.setdefault(key, len(codes))
+
+    def pool_of(keys):
+        return next((name for name, members in dimensions.items() if all(key in members for key in keys)), 'keys')
+
+    def encode(value):
+        if isinstance(value, (list, tuple)):
+            return [encode(item) for item in value]
+        if isinstance(value, float) and value.is_integer():
+            # En JS 25.0 y 25 son el mismo número
+            return int(value)
+        if not isinstance(value, dict) or not value:
+            return value
+        keys = [_json_key(key) for key in value]
+        pool = pool_of(keys)
+        codes = [code(pool, key) for key in keys]
+        # Códigos consecutivos (p. ej. todas las semanas en orden): basta con el primero;
+        # si no, diferencias con el anterior, pequeñas cuando las claves siguen el orden de la dimensión
+        consecutive = codes == list(range(codes[0], codes[0] + len(codes)))
+        node = {'$': 'm', 'd': pool,
+                'k': codes[0] if consecutive else [b - a for a, b in zip([0] + codes, codes)]}
+        records = list(value.values())
+        fields = [_json_key(field) for field in records[0]] if isinstance(records[0], dict) else None
+        # Tabla si hay varios registros con los mismos campos y estos no son claves de una dimensión
+        if (len(records) > 1 and fields and pool_of(fields) == 'keys'
+                and all(isinstance(record, dict) and [_json_key(field) for field in record] == fields
+                        for record in records)):
+            node['$'] = 't'
+            node['f'] = [code('keys', field) for field in fields]
+            node['c'] = [[encode(item) for item in column] for column in zip(*(record.values() for record in records))]
+        else:
+            node['v'] = [encode(record) for record in records]
+        return node
+
+    root = encode(stats)
+    return {'dims': {name: list(codes) for name, codes in pools.items() if codes}, 'root': root}
+
+
+def vendor_plotly_bundle(output_dir, source=None):
+    """
+    Deja el bundle parcial de Plotly en <output_dir>/vendor/ y devuelve su ruta relativa.
+    source es un archivo local con el bundle; sin él se descarga PLOTLY_BUNDLE_URL,
+    solo si no está ya en vendor/.
+    """
+    bundle_name = os.path.basename(source) if source else PLOTLY_BUNDLE
+    bundle_path = f'vendor/{bundle_name}'
+    full_path = os.path.join(output_dir, bundle_path)
+    if source and os.path.abspath(source) == os.path.abspath(full_path):
+        return bundle_path
+    if source or not os.path.exists(full_path):
+        if source:
+            with open(source, 'rb') as f:
+                content = f.read()
+        else:
+            print(f"Descargando {PLOTLY_BUNDLE_URL}...")
+            with urllib.request.urlopen(PLOTLY_BUNDLE_URL, timeout=60) as response:
+                content = response.read()
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        tmp_path = f'{full_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, full_path)
+    return bundle_path
+
+
+class LazyStatistics(Mapping):
+    """
+    Diccionario de estadísticas de solo lectura cuyas secciones se calculan al pedirlas
+    por primera vez y se memorizan. `sections` es {nombre: función sin argumentos}.
+    """
+
+    def __init__(self, sections):
+        self._sections = sections
+        self._values = {}
+
+    def __getitem__(self, key):
+        if key not in self._values:
+            self._values[key] = self._sections[key]()
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(self._sections)
+
+    def __len__(self):
+        return len(self._sections)
+
+
+class AssetWriter:
+    """
+    Escribe los recursos estáticos del dashboard con el hash del contenido en el nombre
+    (<nombre>.<hash>.<ext>), de modo que el navegador puede guardarlos en caché sin
+    revalidar. Cada archivo va acompañado de copias .gz y .br (esta solo si brotli está
+    instalado) para servidores que entregan archivos precomprimidos.
+    asset-manifest.json relaciona cada nombre lógico con su archivo; los archivos del
+    manifest anterior que ya no se usan se borran al terminar.
+    """
+    MANIFEST = 'asset-manifest.json'
+    VERSION = 1
+    HASH_LENGTH = 12
+
+    def __init__(self, path):
+        self.path = path
+        self.files = {}
+        self.compressors = [('gzip', '.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+        try:
+            import brotli
+            self.compressors.append(('br', '.br', lambda data: brotli.compress(data, quality=11)))
+        except ImportError:
+            print("Aviso: brotli no está instalado; solo se generan copias .gz")
+
+    def read_manifest(self):
+        try:
+            with open(os.path.join(self.path, self.MANIFEST), encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if manifest.get('version') != self.VERSION:
+            return None
+        return manifest
+
+    @staticmethod
+    def _write_file(path, content):
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+    def add(self, logical_path, content):
+        """Escribe content (str o bytes) bajo logical_path con el hash en el nombre; devuelve la ruta relativa"""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        digest = hashlib.sha256(content).hexdigest()[:self.HASH_LENGTH]
+        base, ext = os.path.splitext(logical_path)
+        asset_path = f'{base}.{digest}{ext}'
+        full_path = os.path.join(self.path, asset_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        # Mismo nombre implica mismo contenido: lo que ya existe no se reescribe
+        if not os.path.exists(full_path):
+            self._write_file(full_path, content)
+        encodings = []
+        for encoding, suffix, compress in self.compressors:
+            if not os.path.exists(full_path + suffix):
+                self._write_file(full_path + suffix, compress(content))
+            encodings.append(encoding)
+        self.files[logical_path] = {'path': asset_path, 'size': len(content), 'encodings': encodings}
+        return asset_path
+
+    def finish(self):
+        """Borra los archivos que ya no están en uso y escribe el manifest"""
+        previous = self.read_manifest()
+        if previous:
+            current = {entry['path'] for entry in self.files.values()}
+            for entry in previous['files'].values():
+                if entry['path'] in current:
+                    continue
+                for suffix in [''] + [suffix for _, suffix, _ in self.compressors]:
+                    try:
+                        os.remove(os.path.join(self.path, entry['path'] + suffix))
+                    except FileNotFoundError:
+                        pass
+        manifest = {'version': self.VERSION, 'files': self.files}
+        self._write_file(os.path.join(self.path, self.MANIFEST),
+                         json.dumps(manifest, indent=2, ensure_ascii=False).encode('utf-8'))
+        return manifest
+
+
+class CardStore:
+    """
+    Almacén columnar de tarjetas ya limpias, particionado por semana.
+    Cada semana es un archivo Arrow IPC sin comprimir en <dir>/Semana=<nombre>/part-0.arrow
+    que se lee con memory map, sin copias. _manifest.json guarda el orden de las
+    semanas y la huella de la hoja de la que salió cada una.
+    Requiere pyarrow.
+    """
+    MANIFEST = '_manifest.json'
+    VERSION = 1
+
+    def __init__(self, path):
+        self.path = path
+
+    @staticmethod
+    def _feather():
+        try:
+            from pyarrow import feather
+        except ImportError:
+            raise ImportError("El almacén de tarjetas requiere pyarrow (pip install pyarrow)")
+        return feather
+
+    def read_manifest(self):
+        manifest_path = os.path.join(self.path, self.MANIFEST)
+        if not os.path.exists(manifest_path):
+            return {'version': self.VERSION, 'weeks': []}
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') != self.VERSION:
+            raise ValueError(f"Versión de almacén no soportada en '{self.path}': {manifest.get('version')}")
+        return manifest
+
+    def _write_manifest(self, manifest):
+        manifest_path = os.path.join(self.path, self.MANIFEST)
+        with open(manifest_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(manifest_path + '.tmp', manifest_path)
+
+    @staticmethod
+    def _arrow_safe(frame):
+        """Convierte a texto las columnas con tipos mezclados, que Arrow no admite"""
+        frame = frame.copy(deep=False)
+        for col in frame.columns:
+            values = frame[col]
+            categorical = isinstance(values.dtype, pd.CategoricalDtype)
+            inferred = pd.api.types.infer_dtype(values.cat.categories if categorical else values, skipna=True)
+            if inferred.startswith('mixed'):
+                values = values.astype(object)
+                values = values.where(values.isna(), values.astype(str))
+                frame[col] = values.astype('category') if categorical else values
+        return frame
+
+    def import_dashboard(self, dashboard):
+        """Guarda las semanas nuevas o modificadas de un dashboard ya cargado"""
+        feather = self._feather()
+        import pyarrow as pa
+
+        manifest = self.read_manifest()
+        stored = {week['name']: week for week in manifest['weeks']}
+        weeks = dashboard.all_data.groupby('Semana', sort=False, observed=True)
+        present = set(weeks.groups)
+
+        imported = 0
+        for semana in dashboard.weeks_list:
+            digest = dashboard.sheet_digests.get(semana)
+            if semana in stored and digest is not None and stored[semana]['digest'] == digest:
+                continue
+            frame = weeks.get_group(semana) if semana in present else dashboard.all_data.iloc[0:0]
+            table = pa.Table.from_pandas(self._arrow_safe(frame.drop(columns=['Semana'])), preserve_index=False)
+
+            relative = os.path.join(f"Semana={quote(semana, safe='')}", 'part-0.arrow')
+            path = os.path.join(self.path, relative)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            feather.write_feather(table, path + '.tmp', compression='uncompressed')
+            os.replace(path + '.tmp', path)
+
+            stored[semana] = {'name': semana, 'file': relative, 'digest': digest, 'rows': len(frame)}
+            imported += 1
+
+        # Semanas del Excel en su orden y después las que solo quedan en el almacén
+        order = list(dashboard.weeks_list)
+        order += [week['name'] for week in manifest['weeks'] if week['name'] not in set(order)]
+        os.makedirs(self.path, exist_ok=True)
+        self._write_manifest({'version': self.VERSION, 'weeks': [stored[semana] for semana in order]})
+        print(f"Semanas importadas al almacén: {imported} (total en '{self.path}': {len(order)})")
+        return imported
+
+    def load(self):
+        """Devuelve (semanas en orden, DataFrame de tarjetas, huellas por semana)"""
+        feather = self._feather()
+        manifest = self.read_manifest()
+        if not manifest['weeks']:
+            raise FileNotFoundError(f"El almacén '{self.path}' está vacío; importa primero un Excel.")
+
+        frames = []
+        for week in manifest['weeks']:
+            df = feather.read_table(os.path.join(self.path, week['file']), memory_map=True).to_pandas()
+            df['Semana'] = week['name']
+            frames.append(df)
+
+        weeks_list = [week['name'] for week in manifest['weeks']]
+        digests = {week['name']: week['digest'] for week in manifest['weeks']}
+        return weeks_list, pd.concat(frames, ignore_index=True), digests
+
+
+class _LiveReloadHandler(SimpleHTTPRequestHandler):
+    """Sirve el directorio del dashboard; las páginas HTML llevan el script de recarga"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        live_reload = self.server.live_reload
+        if self.path == live_reload.EVENTS_PATH:
+            live_reload.stream_reloads(self)
+            return
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            path = os.path.join(path, 'index.html')
+        if path.endswith('.html') and os.path.isfile(path):
+            with open(path, 'rb') as f:
+                content = f.read()
+            position = content.rfind(b'</body>')
+            if position == -1:
+                position = len(content)
+            content = content[:position] + live_reload.RELOAD_SCRIPT + content[position:]
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(content)))
+            self.send_header('Cache-Control', 'no-store')
+            self.end_headers()
+            self.wfile.write(content)
+            return
+        super().do_GET()
+
+
+class LiveReloadServer:
+    """
+    Servidor HTTP local del modo --watch. Sirve el directorio del dashboard y añade a cada
+    página HTML un script que escucha EVENTS_PATH (Server-Sent Events): notify_reload()
+    hace que los navegadores abiertos recarguen la página. Los archivos en disco no cambian.
+    """
+    EVENTS_PATH = '/__livereload'
+    RELOAD_SCRIPT = b'<script>new EventSource("/__livereload").onmessage = () => location.reload();</script>\n'
+    KEEPALIVE_SECONDS = 15
+
+    def __init__(self, directory='.', port=8000):
+        self.version = 0
+        self.condition = threading.Condition()
+        handler = functools.partial(_LiveReloadHandler, directory=directory)
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', port), handler)
+        self.httpd.daemon_threads = True
+        self.httpd.live_reload = self
+        self.url = f'http://127.0.0.1:{self.httpd.server_address[1]}/'
+
+    def start(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def notify_reload(self):
+        with self.condition:
+            self.version += 1
+            self.condition.notify_all()
+
+    def stream_reloads(self, handler):
+        """Mantiene abierta la conexión y envía un evento por cada notify_reload()"""
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'text/event-stream')
+        handler.send_header('Cache-Control', 'no-cache')
+        handler.end_headers()
+        version = self.version
+        try:
+            while True:
+                with self.condition:
+                    self.condition.wait_for(lambda: self.version != version, timeout=self.KEEPALIVE_SECONDS)
+                    changed = self.version != version
+                    version = self.version
+                # El comentario de keepalive detecta las pestañas cerradas
+                handler.wfile.write(b'data: reload\n\n' if changed else b': keepalive\n\n')
+                handler.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def watch_file(path, on_change, interval=0.5, debounce=1.0):
+    """
+    Llama a on_change() cada vez que path cambia (fecha de modificación o tamaño), una vez
+    que lleva `debounce` segundos sin cambiar, para no leer un guardado a medias.
+    Si on_change() falla (p. ej. el libro sigue incompleto o está dañado), el error se
+    muestra y se sigue vigilando hasta el siguiente cambio.
+    Se sondea cada `interval` segundos; termina con Ctrl+C.
+    """
+    def signature():
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    built = seen = signature()
+    changed_at = None
+    while True:
+        time.sleep(interval)
+        current = signature()
+        if current != seen:
+            seen, changed_at = current, time.monotonic()
+        elif changed_at is not None and time.monotonic() - changed_at >= debounce:
+            changed_at = None
+            if current is not None and current != built:
+                built = current
+                try:
+                    on_change()
+                except Exception as e:
+                    print(f"Error al regenerar el dashboard; se conserva el anterior: {e}")
+
+
+class ComprehensiveQADashboard:
+    DATE_COLUMNS = ['Fecha tentativa  de validación por parte de QA', 'Fecha de Aprobación o Rechazo']
+
+    # This dictionary maps the desired column name to a list of its possible variations (lowercase)
+    EXPECTED_COLS_MAPPING = {
+        'PM': ['pm', 'qa'],
+        'Web/App': ['web/app', 'web o app'],
+        'Sitio': ['sitio'],
+        'Plataforma': ['plataforma'],
+        'Prioridad en la Tarjeta': ['prioridad en la tarjeta', 'prioridad']
+    }
+
+    CATEGORY_COLUMNS = ['Semana', 'PM', 'Web/App', 'Desarrollador', 'Sitio', 'Plataforma',
+                        'Prioridad en la Tarjeta', 'Aceptado/Rechazado']
+
+    def __init__(self, excel_path='reporte_tarjetas.xlsx', cache_dir='.sheet_cache', workers=1, reader='stream',
+                 profiler=None, store_dir=None, partial=None):
+        self.excel_path = excel_path
+        self.cache_dir = cache_dir
+        self.workers = workers
+        self.reader = reader
+        self.profiler = profiler
+        self.store_dir = store_dir
+        self.all_data = pd.DataFrame()
+        self.weeks_list = []
+        self.sheet_digests = {}
+        self._cube = None
+        if partial is not None:
+            # Dashboard a partir de un agregado ya calculado (p. ej. la combinación de varios libros)
+            self.weeks_list, self._cube = list(partial.weeks_list), partial.cube
+        elif store_dir:
+            self.load_from_store()
+        else:
+            self.load_all_sheets()
+
+    @profiled
+    def load_from_store(self):
+        """Carga las tarjetas desde el almacén columnar (CardStore) en lugar del Excel"""
+        self.weeks_list, self.all_data, self.sheet_digests = CardStore(self.store_dir).load()
+        self.clean_data()
+        self._cube = None
+        print(f"Total de registros cargados desde '{self.store_dir}': {len(self.all_data)}")
+        print(f"Semanas cargadas: {len(self.weeks_list)}")
+
+    @profiled
+    def load_all_sheets(self):
+        """Carga todas las hojas del Excel y las combina"""
+        try:
+            digests = self._get_sheet_digests()
+            sheet_names = list(digests) if digests else pd.ExcelFile(self.excel_path).sheet_names
+            week_sheets = [name for name in sheet_names if 'tarjetas semana' in name.lower()]
+
+            frames = {}
+            pending = []
+            for sheet_name in week_sheets:
+                digest = digests.get(sheet_name) if digests else None
+                self.sheet_digests[sheet_name] = digest
+                df = self._read_cached_sheet(digest)
+                if df is None:
+                    pending.append(sheet_name)
+                else:
+                    print(f"Cargando (caché): {sheet_name}")
+                    frames[sheet_name] = df
+
+            for sheet_name, df, elapsed in self._read_pending_sheets(pending):
+                print(f"Cargando: {sheet_name} ({elapsed:.2f}s)")
+                self._write_cached_sheet(self.sheet_digests[sheet_name], df)
+                frames[sheet_name] = df
+
+            # Concatenar siempre en el orden del libro para que all_data sea determinista
+            all_sheets = []
+            for sheet_name in week_sheets:
+                df = frames[sheet_name]
+                df['Semana'] = sheet_name
+                all_sheets.append(df)
+                self.weeks_list.append(sheet_name)
+
+            self.all_data = pd.concat(all_sheets, ignore_index=True)
+            self.clean_data()
+            self._cube = None
+            print(f"Total de registros cargados: {len(self.all_data)}")
+            print(f"Semanas cargadas: {len(self.weeks_list)}")
+            print("Columnas del DataFrame después de la carga y limpieza:", self.all_data.columns.tolist()) # Added for debugging
+
+        except Exception as e:
+            print(f"Error al cargar el archivo: {e}")
+            raise
+
+    def _phase(self, name):
+        """Contexto de medición de una fase; no hace nada sin profiler"""
+        return self.profiler.phase(name) if self.profiler else nullcontext()
+
+    @classmethod
+    def canonical_columns(cls):
+        """Columnas que tiene cada hoja después de aplicar el esquema"""
+        return (list(cls.EXPECTED_COLS_MAPPING) + ['Desarrollador'] + cls.DATE_COLUMNS
+                + ['Número de rechazos', 'Aceptado/Rechazado'])
+
+    @classmethod
+    def resolve_sheet_columns(cls, header):
+        """
+        Resuelve el encabezado de UNA hoja antes de leerla.
+        Devuelve [(índice, nombre canónico)] solo para las columnas que se usan;
+        si hay varias columnas de desarrollador sin 'Desarrollador', todas se
+        resuelven como 'Desarrollador' para combinarlas después.
+        Las variantes se eligen con el encabezado de cada hoja, no con el del libro
+        completo: una hoja con 'SITIO' o 'Developer' conserva esos datos aunque otra
+        hoja use 'Sitio' o 'Desarrollador' (antes esas filas quedaban vacías).
+        """
+        names = [name if isinstance(name, str) else '' for name in header]
+        plan = []
+
+        for col in cls.DATE_COLUMNS + ['Número de rechazos', 'Aceptado/Rechazado']:
+            if col in names:
+                plan.append((names.index(col), col))
+
+        if 'Desarrollador' in names:
+            plan.append((names.index('Desarrollador'), 'Desarrollador'))
+        else:
+            plan.extend((i, 'Desarrollador') for i, name in enumerate(names)
+                        if 'desarrollador' in name.lower() or 'developer' in name.lower())
+
+        for expected_col, variations in cls.EXPECTED_COLS_MAPPING.items():
+            if expected_col in names:
+                plan.append((names.index(expected_col), expected_col))
+            else:
+                # La primera variación en el orden de la hoja, igual que clean_data
+                for i, name in enumerate(names):
+                    if name.lower() in variations:
+                        plan.append((i, expected_col))
+                        break
+
+        return sorted(plan)
+
+    @classmethod
+    def normalize_sheet(cls, df, plan):
+        """
+        Aplica el plan compilado a una hoja y la normaliza columna a columna:
+        combina las columnas de desarrollador, convierte fechas y número de rechazos
+        y rellena los nulos. El DataFrame resultante tiene exactamente canonical_columns().
+        """
+        columns = {}
+        for col in cls.canonical_columns():
+            sources = plan.sources.get(col)
+            if not sources:
+                columns[col] = pd.Series(np.nan, index=df.index, dtype=object)
+                continue
+            series = df.iloc[:, sources[0]]
+            # Primer valor no nulo entre las columnas candidatas (equivale a bfill(axis=1))
+            for position in sources[1:]:
+                series = series.where(series.notna(), df.iloc[:, position])
+            columns[col] = series
+
+        for col in cls.DATE_COLUMNS:
+            columns[col] = pd.to_datetime(columns[col], errors='coerce')
+        columns['Número de rechazos'] = pd.to_numeric(columns['Número de rechazos'], errors='coerce').fillna(0)
+        columns['Aceptado/Rechazado'] = columns['Aceptado/Rechazado'].fillna('PENDIENTE')
+        columns['Desarrollador'] = columns['Desarrollador'].fillna('Desarrollador Desconocido')
+
+        return pd.DataFrame(columns, index=df.index, copy=False)
+
+    @profiled
+    def _read_pending_sheets(self, pending):
+        """
+        Lee las hojas que no están en caché. Con workers > 1 las reparte en bloques
+        entre un ProcessPoolExecutor; cada proceso abre el xlsx por su cuenta.
+        """
+        if self.workers <= 1 or len(pending) <= 1:
+            return read_sheets(self.excel_path, pending, self.reader) if pending else []
+
+        workers = min(self.workers, len(pending))
+        chunks = [pending[i::workers] for i in range(workers)]
+        results = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for chunk_results in pool.map(read_sheets, [self.excel_path] * workers, chunks, [self.reader] * workers):
+                results.extend(chunk_results)
+        return results
+
+    def _get_sheet_digests(self):
+        """Huellas por hoja, o None si la caché está desactivada o el archivo no es un xlsx"""
+        if not self.cache_dir:
+            return None
+        try:
+            return get_sheet_digests(self.excel_path)
+        except (zipfile.BadZipFile, KeyError) as e:
+            print(f"Warning: no se pudo calcular la huella de las hojas ({e}). Caché desactivada.")
+            return None
+
+    def _cache_path(self, digest, extension):
+        return os.path.join(self.cache_dir, f'{digest}.{self.reader}.{extension}')
+
+    def _read_cached_sheet(self, digest):
+        """Lee una hoja ya procesada de la caché (Parquet si hay pyarrow, si no pickle)"""
+        if digest is None:
+            return None
+        parquet_path = self._cache_path(digest, 'parquet')
+        pickle_path = self._cache_path(digest, 'pkl')
+        try:
+            if os.path.exists(parquet_path):
+                return pd.read_parquet(parquet_path)
+            if os.path.exists(pickle_path):
+                return pd.read_pickle(pickle_path)
+        except Exception as e:
+            print(f"Warning: entrada de caché ilegible ({e}). Se vuelve a leer la hoja.")
+        return None
+
+    def _write_cached_sheet(self, digest, df):
+        """
+        Guarda la hoja leída en la caché; los fallos solo se avisan.
+        Se escribe a un temporal y se renombra, porque varios procesos (modo batch) comparten la caché.
+        """
+        if digest is None:
+            return
+        parquet_path = self._cache_path(digest, 'parquet')
+        tmp_path = f'{parquet_path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            try:
+                df.to_parquet(tmp_path, index=False)
+                os.replace(tmp_path, parquet_path)
+            except (ImportError, ValueError, TypeError):
+                # Sin pyarrow, o columnas con tipos mezclados que Parquet no admite
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                pickle_path = self._cache_path(digest, 'pkl')
+                tmp_path = f'{pickle_path}.{os.getpid()}.tmp'
+                df.to_pickle(tmp_path, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, pickle_path)
+        except OSError as e:
+            print(f"Warning: no se pudo escribir la caché de hojas ({e}).")
+
+    def prune_sheet_cache(self):
+        """
+        Borra las entradas de la caché que no son de ninguna hoja actual del libro.
+        No se usa en el modo batch, donde la caché es compartida (ver run_batch).
+        """
+        digests = list(self.sheet_digests.values())
+        if not self.cache_dir or self.store_dir or not digests or None in digests:
+            return
+        removed = prune_sheet_cache(self.cache_dir, digests)
+        if removed:
+            print(f"Caché de hojas: {removed} entradas sin uso borradas")
+
+    @profiled
+    def clean_data(self):
+        """
+        Limpia y prepara los datos, estandarizando nombres de columnas
+        y manejando valores nulos.
+        Las hojas llegan ya normalizadas por normalize_sheet; si all_data trae
+        columnas sin resolver se aplica el mismo plan compilado a todo el DataFrame.
+        """
+        canonical = self.canonical_columns()
+        if [col for col in self.all_data.columns if col != 'Semana'] != canonical:
+            semana = self.all_data['Semana'] if 'Semana' in self.all_data.columns else None
+            raw = self.all_data.drop(columns=['Semana']) if semana is not None else self.all_data
+            plan = compile_column_plan(tuple(raw.columns))
+            self.all_data = self.normalize_sheet(raw.iloc[:, list(plan.positions)], plan)
+            if semana is not None:
+                self.all_data['Semana'] = semana
+
+        # Columnas de baja cardinalidad como category: menos memoria y comparaciones por código
+        for col in self.CATEGORY_COLUMNS:
+            if col in self.all_data.columns:
+                self.all_data[col] = self.all_data[col].astype('category')
+
+
+    # Secciones de generate_all_statistics, en orden (ver statistics)
+    STATISTICS_SECTIONS = ('qa', 'web', 'app', 'dev_web', 'dev_app', 'dev_web_weekly_details',
+                           'dev_app_weekly_details', 'pm', 'sites', 'platforms', 'turnaround', 'rework', 'facts',
+                           'weeks_list', 'total_weeks')
+
+    # Dimensiones de la tabla de hechos del explorador: (columna del cubo, nombre en el JS, etiqueta)
+    FACT_DIMENSIONS = [
+        ('Semana', 'semana', 'Semana'),
+        ('Web/App', 'tipo', 'Web/App'),
+        ('Sitio', 'sitio', 'Sitio'),
+        ('Plataforma', 'plataforma', 'Plataforma'),
+        ('Desarrollador', 'desarrollador', 'Desarrollador'),
+        ('PM', 'pm', 'QA/PM'),
+        ('Prioridad en la Tarjeta', 'prioridad', 'Prioridad'),
+    ]
+    FACT_MEASURES = ['n', 'rechazadas', 'aceptadas']
+
+    # Modo de datos separados: archivo de data/ -> secciones de stats que contiene.
+    # Las secciones que no aparecen aquí van a summary.json.
+    DATA_FILES = {
+        'dev_web': ['dev_web'],
+        'dev_app': ['dev_app'],
+        'dev_web_weekly': ['dev_web_weekly_details'],
+        'dev_app_weekly': ['dev_app_weekly_details'],
+        'sites': ['sites'],
+        'facts': ['facts'],
+    }
+    # Archivos que necesita cada pestaña antes de dibujar sus gráficos
+    TAB_DATA_FILES = {
+        'resumen': ['summary'],
+        'qa': ['summary'],
+        'web': ['summary'],
+        'app': ['summary'],
+        'devs': ['summary', 'dev_web', 'dev_app'],
+        'pm': ['summary'],
+        'sites': ['summary', 'sites'],
+        'weekly': ['summary'],
+        'explorer': ['summary', 'facts'],
+    }
+
+    # Tablas virtualizadas: (encabezado, clave de ordenación en stats; '' ordena por nombre)
+    DEV_TABLE_COLUMNS = [
+        ('Desarrollador', ''),
+        ('Total Tarjetas', 'total_tarjetas'),
+        ('Rechazadas', 'rechazadas'),
+        ('Aceptadas', 'aceptadas'),
+        ('Promedio Semanal (Histórico)', 'promedio_semanal_historico'),
+        ('% Rechazo', 'porcentaje_rechazo'),
+        ('Semanas Activo', 'semanas_activo'),
+    ]
+    SITE_TABLE_COLUMNS = [
+        ('Sitio', ''),
+        ('Total', 'total'),
+        ('Web', 'web'),
+        ('App', 'app'),
+        ('Aceptadas', 'aceptadas'),
+        ('Rechazadas', 'rechazadas'),
+        ('Promedio/Semana', 'promedio_por_semana'),
+        ('Promedio Rechazadas/Semana', 'promedio_rechazadas_semana'),
+        ('Promedio Aceptadas/Semana', 'promedio_aceptadas_semana'),
+    ]
+    VIRTUAL_TABLE_PRERENDER_ROWS = 20
+
+    # Con compress_payload, los payloads más pequeños se siguen incrustando como JSON:
+    # por debajo de este tamaño el ahorro no compensa la descompresión asíncrona
+    COMPRESS_PAYLOAD_MIN_BYTES = 32 * 1024
+
+    # Días enteros desde la fecha tentativa de validación hasta la aprobación o rechazo.
+    # Como dimensión del cubo, sus conteos son un histograma exacto por día que se suma
+    # entre semanas y libros igual que el resto de conteos (ver get_turnaround_statistics)
+    TURNAROUND_KEY = 'Días hasta decisión'
+    TURNAROUND_PERCENTILES = (50, 90, 99)
+
+    # Dimensiones del cubo de conteos; cada combinación observada es una fila
+    CUBE_KEYS = ['Semana', 'Web/App', 'PM', 'Desarrollador', 'Sitio', 'Plataforma',
+                 'Prioridad en la Tarjeta', 'Aceptado/Rechazado', TURNAROUND_KEY]
+    # Medidas de cada fila del cubo y cómo se combinan dos filas con las mismas claves.
+    # ciclos suma 'Número de rechazos', retrabajo cuenta las tarjetas con 2 o más rechazos
+    # y max_ciclos es el máximo de rechazos de una tarjeta
+    CUBE_MEASURES = {'n': 'sum', 'rechazadas': 'sum', 'aceptadas': 'sum',
+                     'ciclos': 'sum', 'retrabajo': 'sum', 'max_ciclos': 'max'}
+
+    @profiled
+    def build_aggregation_cube(self):
+        """
+        Construye en una sola pasada el cubo de conteos sobre todas las dimensiones.
+        Todas las estadísticas get_* se derivan de este cubo en lugar de volver a
+        filtrar self.all_data.
+        """
+        self._cube = self._cube_from_frame(self.all_data, self.CUBE_KEYS)
+        return self._cube
+
+    @classmethod
+    def turnaround_days(cls, data):
+        """Días de calendario entre las dos DATE_COLUMNS de cada tarjeta; NaN si falta alguna fecha"""
+        tentative, decision = (data[col].dt.normalize() for col in cls.DATE_COLUMNS)
+        return (decision - tentative).dt.days.rename(cls.TURNAROUND_KEY)
+
+    @classmethod
+    def _cube_from_frame(cls, data, keys):
+        """Cubo de conteos para un subconjunto de filas (ver build_aggregation_cube)"""
+        # Las claves se agrupan como Series (la dimensión derivada incluida), sin copiar `data`
+        keys = [cls.turnaround_days(data) if key == cls.TURNAROUND_KEY and key not in data.columns else data[key]
+                for key in keys]
+        rechazos = data['Número de rechazos']
+        cube = (pd.DataFrame({'ciclos': rechazos, 'retrabajo': rechazos >= 2}, copy=False)
+                .groupby(keys, dropna=False, sort=False, observed=True)
+                .agg(n=('ciclos', 'size'), ciclos=('ciclos', 'sum'), retrabajo=('retrabajo', 'sum'),
+                     max_ciclos=('ciclos', 'max'))
+                .reset_index())
+        cube = cube[cube['n'] > 0].reset_index(drop=True)
+        # Conteos derivados por estado para poder sumar directamente
+        cube['rechazadas'] = cube['n'].where(cube['Aceptado/Rechazado'] == 'RECHAZADO', 0)
+        cube['aceptadas'] = cube['n'].where(cube['Aceptado/Rechazado'] == 'APROBADO', 0)
+        return cube[[key.name for key in keys] + list(cls.CUBE_MEASURES)]
+
+    def partial_statistics(self):
+        """
+        Agregado parcial del libro (semanas y cubo de conteos) para combinarlo con los de
+        otros libros mediante merge_partial_statistics sin juntar sus filas.
+        """
+        return PartialStatistics(list(self.weeks_list), self.cube)
+
+    @property
+    def cube(self):
+        """Cubo de conteos (se construye la primera vez que se usa)"""
+        if self._cube is None:
+            self.build_aggregation_cube()
+        return self._cube
+
+    def _rollup(self, keys, cube=None):
+        """
+        Suma n/rechazadas/aceptadas del cubo agrupando por `keys`.
+        Conserva el orden de primera aparición y descarta claves nulas,
+        igual que .dropna().unique() sobre los datos originales.
+        """
+        cube = self.cube if cube is None else cube
+        return cube.groupby(keys, sort=False, observed=True)[['n', 'rechazadas', 'aceptadas']].sum()
+
+    @profiled
+    def get_qa_statistics_complete(self):
+        """Estadísticas COMPLETAS de QA - Por semana y totales"""
+        qa_stats = {
+            'weekly': {},
+            'historical': {
+                'por_qa': {},
+                'total_rechazadas': 0,
+                'total_revisadas': 0
+            }
+        }
+
+        por_semana = self._rollup('Semana')
+        por_semana_qa = self._rollup(['Semana', 'PM'])
+        semanas_con_qa = set(por_semana_qa.index.get_level_values(0))
+
+        # Por cada semana
+        for semana in self.weeks_list:
+            # Tarjetas por QA esta semana
+            qa_counts = {}
+            qa_rechazadas = {}
+
+            if semana in semanas_con_qa:
+                for qa, row in por_semana_qa.xs(semana, level=0).iterrows():
+                    qa_counts[qa] = int(row['n'])
+                    qa_rechazadas[qa] = int(row['rechazadas'])
+
+            week_totals = por_semana.loc[semana] if semana in por_semana.index else None
+            qa_stats['weekly'][semana] = {
+                'tarjetas_por_qa': qa_counts,
+                'rechazadas_por_qa': qa_rechazadas,
+                'total_semana': int(week_totals['n']) if week_totals is not None else 0,
+                'total_rechazadas_semana': int(week_totals['rechazadas']) if week_totals is not None else 0
+            }
+
+        # Totales históricos
+        for qa, row in self._rollup('PM').iterrows():
+            qa_stats['historical']['por_qa'][qa] = {
+                'total_revisadas': int(row['n']),
+                'total_rechazadas': int(row['rechazadas']),
+                'promedio_semanal': int(row['n']) / len(self.weeks_list) if len(self.weeks_list) > 0 else 0
+            }
+
+        qa_stats['historical']['total_rechazadas'] = int(self.cube['rechazadas'].sum())
+        qa_stats['historical']['total_revisadas'] = int(self.cube['n'].sum())
+
+        return qa_stats
+
+    def _get_platform_type_statistics(self, platform_type):
+        """Estadísticas semanales e históricas para un tipo ('Web' o 'App')"""
+        type_cube = self.cube[self.cube['Web/App'] == platform_type]
+        por_semana = self._rollup('Semana', type_cube)
+
+        type_stats = {'weekly': {}, 'historical': {}}
+
+        # Por cada semana
+        for semana in self.weeks_list:
+            if semana in por_semana.index:
+                row = por_semana.loc[semana]
+                total, rechazadas, aceptadas = int(row['n']), int(row['rechazadas']), int(row['aceptadas'])
+            else:
+                total, rechazadas, aceptadas = 0, 0, 0
+
+            type_stats['weekly'][semana] = {
+                'revisadas': total,
+                'rechazadas': rechazadas,
+                'aceptadas': aceptadas,
+                'porcentaje_rechazo': round((rechazadas / total * 100) if total > 0 else 0, 2)
+            }
 
-        html += """
-                </tbody>
-            </table>
+        # Totales históricos
+        total = int(type_cube['n'].sum())
+        rechazadas = int(type_cube['rechazadas'].sum())
+        aceptadas = int(type_cube['aceptadas'].sum())
 
-            <div class="chart-container">
-                <div id="webTrendChart"></div>
-            </div>
-        </div>
+        type_stats['historical'] = {
+            'total_revisadas': total,
+            'total_rechazadas': rechazadas,
+            'total_aceptadas': aceptadas,
+            'porcentaje_rechazo': round((rechazadas / total * 100) if total > 0 else 0, 2)
+        }
 
-        <div id="app" class="tab-content">
-            <h2 class="section-title">Estadísticas Completas App</h2>
+        return type_stats
 
-            <div class="metric-group">
-                <h4>📱 Totales Históricos App</h4>
-                <p><strong>Número de tarjetas revisadas:</strong> """ + str(stats['app']['historical']['total_revisadas']) + """</p>
-                <p><strong>Número de tarjetas rechazadas:</strong> """ + str(stats['app']['historical']['total_rechazadas']) + """</p>
-                <p><strong>Número de tarjetas aceptadas:</strong> """ + str(stats['app']['historical']['total_aceptadas']) + """</p>
-                <p><strong>Porcentaje de rechazo:</strong> <span class="highlight">""" + str(stats['app']['historical']['porcentaje_rechazo']) + """%</span></p>
-            </div>
+    @profiled
+    def get_web_statistics_complete(self):
+        """Estadísticas COMPLETAS Web - Por semana y totales"""
+        return self._get_platform_type_statistics('Web')
 
-            <h3>Estadísticas App por Semana</h3>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Semana</th>
-                        <th>Revisadas</th>
-                        <th>Aceptadas</th>
-                        <th>Rechazadas</th>
-                        <th>% Rechazo</th>
-                    </tr>
-                </thead>
-                <tbody>"""
+    @profiled
+    def get_app_statistics_complete(self):
+        """Estadísticas COMPLETAS App - Por semana y totales"""
+        return self._get_platform_type_statistics('App')
 
-        # Datos semanales App
-        for week, data in stats['app']['weekly'].items():
-            percentage_class = 'high' if data['porcentaje_rechazo'] > 20 else 'medium' if data['porcentaje_rechazo'] > 10 else 'low'
-            html += f"""
-                <tr>
-                    <td data-label="Semana">{week}</td>
-                    <td data-label="Revisadas">{data['revisadas']}</td>
-                    <td data-label="Aceptadas">{data['aceptadas']}</td>
-                    <td data-label="Rechazadas">{data['rechazadas']}</td>
-                    <td data-label="% Rechazo"><span class="percentage {percentage_class}">{data['porcentaje_rechazo']}%</span></td>
-                </tr>"""
+    def get_dev_statistics(self, dev_type):
+        """
+        Estadísticas COMPLETAS de desarrolladores (Web o App)
+        Retorna estadísticas históricas y un desglose semanal detallado por desarrollador.
+        """
+        return self.get_dev_summary(dev_type), self.get_dev_weekly_details(dev_type)
+
+    @profiled
+    def get_dev_summary(self, dev_type):
+        """Estadísticas históricas por desarrollador (Web o App), ordenadas por total de tarjetas"""
+        type_cube = self.cube[self.cube['Web/App'] == dev_type.capitalize()]
+        por_dev = self._rollup('Desarrollador', type_cube)
+        semanas_activo = self._rollup(['Desarrollador', 'Semana'], type_cube).groupby(level=0, sort=False, observed=True).size()
+        dev_stats = {}
 
-        html += """
-                </tbody>
-            </table>
+        for dev, row in por_dev.iterrows():
+            # Overall historical stats for developer
+            total = int(row['n'])
+            rechazadas = int(row['rechazadas'])
+            aceptadas = int(row['aceptadas'])
+            promedio_semanal = total / len(self.weeks_list) if len(self.weeks_list) > 0 else 0
+            porcentaje_rechazo = round((rechazadas / total * 100) if total > 0 else 0, 2)
 
-            <div class="chart-container">
-                <div id="appTrendChart"></div>
-            </div>
-        </div>
+            dev_stats[dev] = {
+                'total_tarjetas': total,
+                'rechazadas': rechazadas,
+                'aceptadas': aceptadas,
+                'promedio_semanal_historico': round(promedio_semanal, 2),
+                'porcentaje_rechazo': porcentaje_rechazo,
+                'semanas_activo': int(semanas_activo.get(dev, 0))
+            }
 
-        <div id="devs" class="tab-content">
-            <h2 class="section-title">Estadísticas Completas de Desarrolladores</h2>
+        # Order by total cards
+        return dict(sorted(dev_stats.items(), key=lambda x: x[1]['total_tarjetas'], reverse=True))
+
+    @profiled
+    def get_dev_weekly_details(self, dev_type):
+        """Desglose semanal por desarrollador (Web o App): solo las semanas activas, en el orden de weeks_list"""
+        type_cube = self.cube[self.cube['Web/App'] == dev_type.capitalize()]
+        por_dev_semana = self._rollup(['Desarrollador', 'Semana'], type_cube)
+        week_order = {semana: i for i, semana in enumerate(self.weeks_list)}
+        dev_weekly_details = {}
+
+        for (dev, semana), row in por_dev_semana.iterrows():
+            total_week = int(row['n'])
+            rechazadas_week = int(row['rechazadas'])
+            dev_weekly_details.setdefault(dev, {})[semana] = {
+                'total_tarjetas': total_week,
+                'rechazadas': rechazadas_week,
+                'aceptadas': int(row['aceptadas']),
+                'porcentaje_rechazo': round((rechazadas_week / total_week * 100) if total_week > 0 else 0, 2)
+            }
 
-            <h3>🌐 Desarrollo Web - Todas las métricas</h3>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Desarrollador</th>
-                        <th>Total Tarjetas</th>
-                        <th>Rechazadas</th>
-                        <th>Aceptadas</th>
-                        <th>Promedio Semanal (Histórico)</th>
-                        <th>% Rechazo</th>
-                        <th>Semanas Activo</th>
-                    </tr>
-                </thead>
-                <tbody>"""
+        for dev in self._rollup('Desarrollador', type_cube).index:
+            weekly_summary = dev_weekly_details.get(dev, {})
+            dev_weekly_details[dev] = dict(sorted(weekly_summary.items(), key=lambda x: week_order.get(x[0], len(week_order))))
 
-        # Top desarrolladores Web
-        dev_count = 0
-        for dev, data in stats['dev_web'].items():
-            if dev_count < 20:  # Top 20
-                percentage_class = 'high' if data['porcentaje_rechazo'] > 20 else 'medium' if data['porcentaje_rechazo'] > 10 else 'low'
-                # Add ondblclick to the row
-                html += f"""
-                <tr class="developer-table-row" ondblclick="showDevWeeklyMetrics('{dev}', 'web')">
-                    <td data-label="Desarrollador">{dev}</td>
-                    <td data-label="Total Tarjetas">{data['total_tarjetas']}</td>
-                    <td data-label="Rechazadas">{data['rechazadas']}</td>
-                    <td data-label="Aceptadas">{data['aceptadas']}</td>
-                    <td data-label="Promedio Semanal (Histórico)">{data['promedio_semanal_historico']}</td>
-                    <td data-label="% Rechazo"><span class="percentage {percentage_class}">{data['porcentaje_rechazo']}%</span></td>
-                    <td data-label="Semanas Activo">{data['semanas_activo']}</td>
-                </tr>"""
-                dev_count += 1
+        return dev_weekly_details
 
-        html += """
-                </tbody>
-            </table>
-            <div id="devWebWeeklyDetails" class="info-box" style="display: none;"></div>
+    @profiled
+    def get_pm_statistics_complete(self):
+        """Estadísticas COMPLETAS de PM"""
+        por_prioridad = self._rollup('Prioridad en la Tarjeta')['n']
+        pm_stats = {
+            'prioridades': {
+                'alta': {
+                    'total': int(por_prioridad.get('Alta', 0)),
+                    'promedio_semanal': 0
+                },
+                'media': {
+                    'total': int(por_prioridad.get('Media', 0)),
+                    'promedio_semanal': 0
+                },
+                'baja': {
+                    'total': int(por_prioridad.get('Baja', 0)),
+                    'promedio_semanal': 0
+                }
+            },
+            'promedio_semanal': {
+                'web': 0,
+                'app': 0,
+                'total': 0
+            },
+            'por_semana': {}
+        }
 
-            <h3>📱 Desarrollo App - Todas las métricas</h3>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Desarrollador</th>
-                        <th>Total Tarjetas</th>
-                        <th>Rechazadas</th>
-                        <th>Aceptadas</th>
-                        <th>Promedio Semanal (Histórico)</th>
-                        <th>% Rechazo</th>
-                        <th>Semanas Activo</th>
-                    </tr>
-                </thead>
-                <tbody>"""
+        por_semana_tipo = self._rollup(['Semana', 'Web/App'])['n']
+        por_semana_prioridad = self._rollup(['Semana', 'Prioridad en la Tarjeta'])['n']
 
-        # Top desarrolladores App
-        dev_count = 0
-        for dev, data in stats['dev_app'].items():
-            if dev_count < 20:  # Top 20
-                percentage_class = 'high' if data['porcentaje_rechazo'] > 20 else 'medium' if data['porcentaje_rechazo'] > 10 else 'low'
-                # Add ondblclick to the row
-                html += f"""
-                <tr class="developer-table-row" ondblclick="showDevWeeklyMetrics('{dev}', 'app')">
-                    <td data-label="Desarrollador">{dev}</td>
-                    <td data-label="Total Tarjetas">{data['total_tarjetas']}</td>
-                    <td data-label="Rechazadas">{data['rechazadas']}</td>
-                    <td data-label="Aceptadas">{data['aceptadas']}</td>
-                    <td data-label="Promedio Semanal (Histórico)">{data['promedio_semanal_historico']}</td>
-                    <td data-label="% Rechazo"><span class="percentage {percentage_class}">{data['porcentaje_rechazo']}%</span></td>
-                    <td data-label="Semanas Activo">{data['semanas_activo']}</td>
-                </tr>"""
-                dev_count += 1
+        # Calcular promedios
+        num_semanas = len(self.weeks_list)
+        if num_semanas > 0:
+            pm_stats['prioridades']['alta']['promedio_semanal'] = round(pm_stats['prioridades']['alta']['total'] / num_semanas, 2)
+            pm_stats['prioridades']['media']['promedio_semanal'] = round(pm_stats['prioridades']['media']['total'] / num_semanas, 2)
+            pm_stats['prioridades']['baja']['promedio_semanal'] = round(pm_stats['prioridades']['baja']['total'] / num_semanas, 2)
 
-        html += """
-                </tbody>
-            </table>
-            <div id="devAppWeeklyDetails" class="info-box" style="display: none;"></div>
+            # Promedios por tipo
+            web_por_semana = por_semana_tipo.xs('Web', level=1) if 'Web' in por_semana_tipo.index.get_level_values(1) else pd.Series(dtype=float)
+            app_por_semana = por_semana_tipo.xs('App', level=1) if 'App' in por_semana_tipo.index.get_level_values(1) else pd.Series(dtype=float)
 
-            <div class="chart-container">
-                <div id="devComparisonChart"></div>
-            </div>
+            pm_stats['promedio_semanal']['web'] = round(web_por_semana.mean(), 2) if not web_por_semana.empty else 0
+            pm_stats['promedio_semanal']['app'] = round(app_por_semana.mean(), 2) if not app_por_semana.empty else 0
+            pm_stats['promedio_semanal']['total'] = round((pm_stats['promedio_semanal']['web'] + pm_stats['promedio_semanal']['app']), 2)
+
+
+        # Desglose por semana
+        for semana in self.weeks_list:
+            pm_stats['por_semana'][semana] = {
+                'alta': int(por_semana_prioridad.get((semana, 'Alta'), 0)),
+                'media': int(por_semana_prioridad.get((semana, 'Media'), 0)),
+                'baja': int(por_semana_prioridad.get((semana, 'Baja'), 0)),
+                'web': int(por_semana_tipo.get((semana, 'Web'), 0)),
+                'app': int(por_semana_tipo.get((semana, 'App'), 0))
+            }
+
+        return pm_stats
+
+    def _value_counts_from_cube(self, cube, column):
+        """Equivalente a .value_counts() de una columna, calculado desde el cubo"""
+        counts = cube.groupby(column, sort=False, observed=True)['n'].sum()
+        counts = counts[counts > 0].sort_values(ascending=False, kind='stable')
+        return {k: int(v) for k, v in counts.items()}
+
+    @profiled
+    def get_site_statistics_complete(self):
+        """Estadísticas COMPLETAS por sitio"""
+        site_stats = {}
+        por_sitio = self._rollup('Sitio')
+        por_sitio_tipo = self._rollup(['Sitio', 'Web/App'])['n']
+        semanas_por_sitio = self.cube.dropna(subset=['Sitio']).groupby('Sitio', sort=False, observed=True)['Semana'].nunique()
+        sitio_groups = self.cube.groupby('Sitio', sort=False, observed=True)
+
+        for sitio, row in por_sitio.iterrows():
+            # Totales
+            total = int(row['n'])
+            web = int(por_sitio_tipo.get((sitio, 'Web'), 0))
+            app = int(por_sitio_tipo.get((sitio, 'App'), 0))
+            rechazadas = int(row['rechazadas'])
+            aceptadas = int(row['aceptadas'])
+
+            # Promedios
+            num_semanas = int(semanas_por_sitio.get(sitio, 0))
+            promedio_total = total / num_semanas if num_semanas > 0 else 0
+            promedio_rechazadas = rechazadas / num_semanas if num_semanas > 0 else 0
+            promedio_aceptadas = aceptadas / num_semanas if num_semanas > 0 else 0
+
+            # Plataformas
+            plataformas = self._value_counts_from_cube(sitio_groups.get_group(sitio), 'Plataforma')
+
+            site_stats[sitio] = {
+                'total': total,
+                'web': web,
+                'app': app,
+                'rechazadas': rechazadas,
+                'aceptadas': aceptadas,
+                'promedio_por_semana': round(promedio_total, 2),
+                'promedio_rechazadas_semana': round(promedio_rechazadas, 2),
+                'promedio_aceptadas_semana': round(promedio_aceptadas, 2),
+                'plataformas': plataformas,
+                'semanas_activo': num_semanas
+            }
+
+        # Ordenar por total
+        site_stats = dict(sorted(site_stats.items(), key=lambda x: x[1]['total'], reverse=True))
+
+        return site_stats
+
+    @profiled
+    def get_platform_report(self):
+        """Reporte de número de tarjetas por plataforma"""
+        platform_counts = self._value_counts_from_cube(self.cube, 'Plataforma')
+
+        # Limpiar valores nulos
+        cleaned_counts = {}
+        for k, v in platform_counts.items():
+            if pd.isna(k):
+                cleaned_counts['Sin especificar'] = v
+            else:
+                cleaned_counts[k] = v
+
+        return cleaned_counts
+
+    def _turnaround_percentiles(self, keys):
+        """
+        Percentiles TURNAROUND_PERCENTILES (rango más cercano) por grupo de `keys` sobre el
+        histograma de días del cubo: DataFrame indexado por grupo, en orden de primera
+        aparición, con 'tarjetas' (tarjetas con ambas fechas) y una columna por percentil.
+        """
+        hist = self._rollup(keys + [self.TURNAROUND_KEY])['n'].reset_index()
+        hist = hist[hist['n'] > 0]
+        columns = ['tarjetas'] + [f'p{percentile}' for percentile in self.TURNAROUND_PERCENTILES]
+        if hist.empty:
+            # Ninguna tarjeta con ambas fechas y valor en todas las columnas de `keys`
+            return pd.DataFrame(columns=columns)
+        group = hist.groupby(keys, sort=False, observed=True).ngroup().to_numpy() if keys else np.zeros(len(hist), dtype=int)
+        hist = hist.iloc[np.lexsort((hist[self.TURNAROUND_KEY].to_numpy(), group))]
+        group = np.sort(group, kind='stable')
+        by_group = hist['n'].groupby(group, sort=False)
+        cumulative = by_group.cumsum().to_numpy()
+        total = by_group.transform('sum').to_numpy()
+
+        # Un índice por grupo: el de keys cuando los hay
+        first = np.r_[True, group[1:] != group[:-1]]
+        if keys:
+            index = pd.MultiIndex.from_frame(hist.loc[first, keys]) if len(keys) > 1 else pd.Index(hist.loc[first, keys[0]])
+        else:
+            index = pd.RangeIndex(int(first.sum()))
+        result = pd.DataFrame({'tarjetas': total[first]}, index=index)
+        days = hist[self.TURNAROUND_KEY].to_numpy()
+        for percentile in self.TURNAROUND_PERCENTILES:
+            # Primer día del grupo cuyo acumulado llega a percentile% de las tarjetas
+            reached = cumulative * 100 >= total * percentile
+            reached_first = reached & np.r_[True, (group[1:] != group[:-1]) | ~reached[:-1]]
+            result[f'p{percentile}'] = days[reached_first]
+        return result
+
+    @profiled
+    def get_turnaround_statistics(self):
+        """
+        Tiempo de respuesta de QA en días (de la fecha tentativa de validación a la aprobación
+        o rechazo): percentiles históricos y por QA, desarrollador, sitio y semana.
+        Solo cuentan las tarjetas con ambas fechas; un valor negativo es una decisión
+        anterior a la fecha tentativa.
+        """
+        def records(frame):
+            return {name: {column: int(value) for column, value in row.items()} for name, row in frame.iterrows()}
+
+        historical = self._turnaround_percentiles([])
+        por_semana = records(self._turnaround_percentiles(['Semana']))
+        return {
+            'percentiles': list(self.TURNAROUND_PERCENTILES),
+            'historical': records(historical).get(0, dict.fromkeys(historical.columns, None) | {'tarjetas': 0}),
+            'por_qa': records(self._turnaround_percentiles(['PM'])),
+            'por_desarrollador': records(self._turnaround_percentiles(['Desarrollador'])),
+            'por_sitio': records(self._turnaround_percentiles(['Sitio'])),
+            'por_semana': {semana: por_semana[semana] for semana in self.weeks_list if semana in por_semana},
+        }
+
+    REWORK_MEASURES = ['n', 'ciclos', 'retrabajo', 'max_ciclos']
+
+    @staticmethod
+    def _rework_records(rollup):
+        """Métricas de retrabajo de cada fila de un rollup de REWORK_MEASURES, vectorizadas"""
+        n = rollup['n'].to_numpy()
+        ciclos = rollup['ciclos'].to_numpy()
+        retrabajo = rollup['retrabajo'].to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            promedio = np.where(n > 0, np.round(ciclos / n, 2), 0)
+            porcentaje = np.where(n > 0, np.round(retrabajo / n * 100, 2), 0)
+        frame = pd.DataFrame({
+            'tarjetas': n.astype(int),
+            'ciclos': ciclos.astype(int),
+            'promedio_ciclos': promedio,
+            'max_ciclos': np.nan_to_num(rollup['max_ciclos'].to_numpy()).astype(int),
+            'tarjetas_2_o_mas': retrabajo.astype(int),
+            'porcentaje_2_o_mas': porcentaje,
+        }, index=rollup.index)
+        return {name: record for name, record in zip(frame.index, frame.to_dict('records'))}
+
+    @profiled
+    def get_rework_statistics(self):
+        """
+        Retrabajo según 'Número de rechazos': ciclos de rechazo totales, promedio y máximo por
+        tarjeta y porcentaje de tarjetas con 2 o más rechazos; histórico y por desarrollador,
+        sitio, Web/App y semana. Sale de las medidas del cubo, sin volver a recorrer all_data.
+        """
+        measures = {measure: self.CUBE_MEASURES[measure] for measure in self.REWORK_MEASURES}
+
+        def rollup(key):
+            return self._rework_records(self.cube.groupby(key, sort=False, observed=True).agg(measures))
+
+        historical = self.cube.agg(measures).to_frame().T
+        por_semana = rollup('Semana')
+        return {
+            'historical': self._rework_records(historical)[0],
+            'por_desarrollador': rollup('Desarrollador'),
+            'por_sitio': rollup('Sitio'),
+            'por_tipo': rollup('Web/App'),
+            'por_semana': {semana: por_semana[semana] for semana in self.weeks_list if semana in por_semana},
+        }
+
+    @profiled
+    def get_fact_table(self):
+        """
+        Tabla de hechos del explorador del navegador: el cubo agregado sobre FACT_DIMENSIONS.
+        Cada dimensión va como códigos enteros sobre su lista de valores (las semanas en el orden
+        de weeks_list; un valor vacío es null al final de la lista) y cada medida de FACT_MEASURES
+        como enteros. Las columnas son arrays tipados little-endian en base64: [tipo, datos].
+        """
+        keys = [column for column, _, _ in self.FACT_DIMENSIONS]
+        facts = (self.cube
+                 .groupby(keys, dropna=False, sort=False, observed=True)[self.FACT_MEASURES]
+                 .sum()
+                 .reset_index())
+        table = {'rows': len(facts), 'dimensions': {}, 'codes': {}, 'measures': {}}
+        for column, name, _ in self.FACT_DIMENSIONS:
+            values = facts[column].astype(object)
+            if column == 'Semana':
+                labels = list(self.weeks_list)
+                codes = pd.Categorical(values, categories=labels).codes.astype(np.int64)
+            else:
+                codes, uniques = pd.factorize(values)
+                labels = pd.Index(uniques).tolist()
+            if (codes < 0).any():
+                codes = np.where(codes < 0, len(labels), codes)
+                labels.append(None)
+            table['dimensions'][name] = labels
+            table['codes'][name] = _typed_array(codes)
+        for measure in self.FACT_MEASURES:
+            table['measures'][measure] = _typed_array(facts[measure].to_numpy())
+        return table
+
+    @profiled
+    def generate_all_statistics(self):
+        """Genera TODAS las estadísticas solicitadas"""
+        print("Generando estadísticas completas...")
+        return dict(self.statistics())
+
+    def statistics(self):
+        """
+        Estadísticas perezosas: cada sección de STATISTICS_SECTIONS se calcula la primera vez
+        que se pide. Para salidas parciales (p. ej. --sections) que no necesitan todas.
+        """
+        return LazyStatistics({
+            'qa': self.get_qa_statistics_complete,
+            'web': self.get_web_statistics_complete,
+            'app': self.get_app_statistics_complete,
+            'dev_web': lambda: self.get_dev_summary('web'),
+            'dev_app': lambda: self.get_dev_summary('app'),
+            'dev_web_weekly_details': lambda: self.get_dev_weekly_details('web'), # New: detailed weekly stats for web devs
+            'dev_app_weekly_details': lambda: self.get_dev_weekly_details('app'), # New: detailed weekly stats for app devs
+            'pm': self.get_pm_statistics_complete,
+            'sites': self.get_site_statistics_complete,
+            'platforms': self.get_platform_report,
+            'turnaround': self.get_turnaround_statistics,
+            'rework': self.get_rework_statistics,
+            'facts': self.get_fact_table,
+            'weeks_list': lambda: self.weeks_list,
+            'total_weeks': lambda: len(self.weeks_list)
+        })
+
+    def export_statistics(self, filename, sections):
+        """Escribe como JSON solo las secciones pedidas, sin calcular las demás"""
+        stats = self.statistics()
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump({section: stats[section] for section in sections}, f, ensure_ascii=False, indent=2, default=str)
+        print(f"Secciones {', '.join(sections)} guardadas en '{filename}'")
+
+    @profiled
+    def generate_statistics_incremental(self, snapshot_path, verify=False):
+        """
+        Genera las estadísticas reutilizando el snapshot de la ejecución anterior.
+        Solo se agregan las semanas nuevas o modificadas; el resto del cubo se toma
+        del snapshot y los campos derivados se recalculan sobre el cubo combinado.
+        """
+        digests = self.sheet_digests
+        if not digests or any(d is None for d in digests.values()):
+            digests = get_sheet_digests(self.excel_path)
+        digests = {semana: digests.get(semana) for semana in self.weeks_list}
+
+        # Cada hoja se normaliza solo con su propio encabezado (resolve_sheet_columns) y la
+        # huella de la hoja incluye SHEET_CACHE_VERSION, así que basta comparar las huellas
+        snapshot = self._load_stats_snapshot(snapshot_path)
+        previous = snapshot['week_digests'] if snapshot else {}
+
+        changed = [semana for semana in self.weeks_list if previous.get(semana) != digests[semana]]
+        if snapshot is not None and not changed and snapshot['weeks_list'] == self.weeks_list:
+            print("Sin cambios desde el último snapshot; reutilizando estadísticas.")
+            self._cube = snapshot['cube']
+            stats = snapshot['stats']
+        else:
+            print(f"Semanas nuevas o modificadas: {len(changed)} de {len(self.weeks_list)}")
+            changed_data = self.all_data[self.all_data['Semana'].isin(changed)]
+            changed_cube = self._cube_from_frame(changed_data, self.CUBE_KEYS)
+            old_cube = snapshot['cube'] if snapshot else changed_cube.iloc[0:0]
+
+            # El cubo global es la concatenación de los cubos por semana en el orden
+            # de weeks_list, así que el orden de primera aparición se conserva
+            week_cubes = dict(tuple(old_cube.groupby('Semana', sort=False, observed=True)))
+            week_cubes.update(dict(tuple(changed_cube.groupby('Semana', sort=False, observed=True))))
+            parts = [week_cubes[semana] for semana in self.weeks_list if semana in week_cubes]
+            self._cube = pd.concat(parts, ignore_index=True) if parts else changed_cube
+            stats = self.generate_all_statistics()
+
+        if verify:
+            self.verify_statistics(stats)
+
+        self._save_stats_snapshot(snapshot_path, {
+            'version': STATS_SNAPSHOT_VERSION,
+            'weeks_list': list(self.weeks_list),
+            'week_digests': digests,
+            'cube': self._cube,
+            'stats': stats
+        })
+        return stats
+
+    @profiled
+    def verify_statistics(self, stats):
+        """Compara `stats` con un recálculo completo desde self.all_data"""
+        incremental_cube = self._cube
+        self.build_aggregation_cube()
+        full_stats = self.generate_all_statistics()
+        self._cube = incremental_cube
+
+        mismatched = [key for key in full_stats
+                      if json.dumps(full_stats[key], sort_keys=False, default=str) != json.dumps(stats.get(key), sort_keys=False, default=str)]
+        if mismatched:
+            raise RuntimeError(f"Las estadísticas incrementales no coinciden con el recálculo completo en: {mismatched}")
+        print("Verificación OK: las estadísticas incrementales coinciden con el recálculo completo.")
+
+    def _load_stats_snapshot(self, snapshot_path):
+        """Lee el snapshot anterior; devuelve None si no existe o no es compatible"""
+        if not os.path.exists(snapshot_path):
+            return None
+        try:
+            with open(snapshot_path, 'rb') as f:
+                snapshot = pickle.load(f)
+        except Exception as e:
+            print(f"Warning: snapshot de estadísticas ilegible ({e}). Recalculando todo.")
+            return None
+        if snapshot.get('version') != STATS_SNAPSHOT_VERSION:
+            return None
+        return snapshot
+
+    def _save_stats_snapshot(self, snapshot_path, snapshot):
+        try:
+            with open(snapshot_path, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            print(f"Warning: no se pudo guardar el snapshot de estadísticas ({e}).")
+
+    @profiled
+    def generate_html_dashboard(self, stats, compress_payload=False):
+        """Genera el dashboard HTML con TODAS las métricas"""
+        return ''.join(self.iter_html_dashboard(stats, compress_payload=compress_payload))
+
+    def iter_html_dashboard(self, stats, data_files=None, assets=None, plotly_url=None, static_charts=True,
+                            compress_payload=False):
+        """
+        Genera el HTML del dashboard por fragmentos, en orden, para escribirlos
+        directamente al archivo. Cada tabla se emite como un solo fragmento.
+        Con data_files ({archivo: URL}), allStats no se incrusta: el navegador pide los
+        archivos de split_statistics cuando cada pestaña los necesita.
+        Con assets ({'css': URL, 'js': URL}), estilos y lógica se enlazan en lugar de
+        incrustarse; el JS enlazado es lazy_dashboard_script, así que requiere data_files.
+        Con plotly_url, Plotly se carga con defer desde esa URL en lugar de plotly-latest
+        del CDN, y los gráficos iniciales esperan a DOMContentLoaded.
+        Con static_charts, cada gráfico se incrusta como SVG (render_static_charts) y pasa a
+        Plotly cuando el usuario interactúa con él.
+        Con compress_payload, allStats se incrusta comprimido con gzip y en base64 y el navegador
+        lo descomprime con DecompressionStream antes de dibujar; si el payload no llega a
+        COMPRESS_PAYLOAD_MIN_BYTES se incrusta como JSON igualmente.
+        """
+        charts = self.render_static_charts(stats) if static_charts else {}
+        yield """<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Dashboard QA - Métricas</title>
+    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
+"""
+        if plotly_url is None:
+            yield '    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>\n'
+        else:
+            yield f'    <script src="{plotly_url}" defer></script>\n'
+        if assets is None:
+            yield "    <style>\n"
+            yield DASHBOARD_STYLES
+            yield "    </style>\n"
+        else:
+            yield f'    <link rel="stylesheet" href="{assets["css"]}">\n'
+        yield """</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>📊 Dashboard QA - Análisis de Tarjetas</h1>
+            <p class="timestamp">Generado el: """ + datetime.now().strftime('%d/%m/%Y a las %H:%M:%S') + """</p>
+            <p class="timestamp">Total de semanas analizadas: """ + str(stats['total_weeks']) + """</p>
         </div>
 
-        <div id="pm" class="tab-content">
-            <h2 class="section-title">Estadísticas Completas de Project Management</h2>
+        <div class="nav-tabs">
+            <button class="tab-button active" onclick="showTab('resumen')">📈 Resumen General</button>
+            <button class="tab-button" onclick="showTab('qa')">👥 QA</button>
+            <button class="tab-button" onclick="showTab('web')">🌐 Web</button>
+            <button class="tab-button" onclick="showTab('app')">📱 App</button>
+            <button class="tab-button" onclick="showTab('devs')">👨‍💻 Desarrolladores</button>
+            <button class="tab-button" onclick="showTab('pm')">📋 PM</button>
+            <button class="tab-button" onclick="showTab('sites')">🏢 Sitios</button>
+            <button class="tab-button" onclick="showTab('weekly')">📅 Vista Semanal</button>
+            <button class="tab-button" onclick="showTab('explorer')">🔎 Explorar</button>
+        </div>
+
+        <div id="resumen" class="tab-content active">
+            <h2 class="section-title">Resumen General - Métricas Históricas</h2>
 
             <div class="stats-grid">
                 <div class="stat-card">
-                    <div class="stat-label">Tarjetas Prioridad Alta</div>
-                    <div class="stat-value">""" + str(stats['pm']['prioridades']['alta']['total']) + """</div>
-                    <p class="small-text">Promedio: """ + str(stats['pm']['prioridades']['alta']['promedio_semanal']) + """ por semana</p>
+                    <div class="stat-label">Total Tarjetas Revisadas</div>
+                    <div class="stat-value">""" + str(stats['qa']['historical']['total_revisadas']) + """</div>
+                    <p class="small-text">En """ + str(stats['total_weeks']) + """ semanas</p>
                 </div>
 
                 <div class="stat-card">
-                    <div class="stat-label">Tarjetas Prioridad Media</div>
-                    <div class="stat-value">""" + str(stats['pm']['prioridades']['media']['total']) + """</div>
-                    <p class="small-text">Promedio: """ + str(stats['pm']['prioridades']['media']['promedio_semanal']) + """ por semana</p>
+                    <div class="stat-label">Total Rechazadas</div>
+                    <div class="stat-value">""" + str(stats['qa']['historical']['total_rechazadas']) + """</div>
+                    <p class="small-text">""" + str(round(stats['qa']['historical']['total_rechazadas'] / stats['qa']['historical']['total_revisadas'] * 100, 2) if stats['qa']['historical']['total_revisadas'] > 0 else 0) + """% del total</p>
                 </div>
 
                 <div class="stat-card">
-                    <div class="stat-label">Tarjetas Prioridad Baja</div>
-                    <div class="stat-value">""" + str(stats['pm']['prioridades']['baja']['total']) + """</div>
-                    <p class="small-text">Promedio: """ + str(stats['pm']['prioridades']['baja']['promedio_semanal']) + """ por semana</p>
+                    <div class="stat-label">Tarjetas Web</div>
+                    <div class="stat-value">""" + str(stats['web']['historical']['total_revisadas']) + """</div>
+                    <p class="small-text">""" + str(stats['web']['historical']['porcentaje_rechazo']) + """% rechazadas</p>
                 </div>
-            </div>
 
-            <div class="metric-group">
-                <h4>📊 Promedio de Tarjetas Enviadas por Semana</h4>
-                <p><strong>Web:</strong> """ + str(stats['pm']['promedio_semanal']['web']) + """ tarjetas/semana</p>
-                <p><strong>App:</strong> """ + str(stats['pm']['promedio_semanal']['app']) + """ tarjetas/semana</p>
-                <p><strong>Total:</strong> """ + str(stats['pm']['promedio_semanal']['total']) + """ tarjetas/semana</p>
+                <div class="stat-card">
+                    <div class="stat-label">Tarjetas App</div>
+                    <div class="stat-value">""" + str(stats['app']['historical']['total_revisadas']) + """</div>
+                    <p class="small-text">""" + str(stats['app']['historical']['porcentaje_rechazo']) + """% rechazadas</p>
+                </div>
             </div>
 
-            <h3>Desglose Semanal de Prioridades</h3>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Semana</th>
-                        <th>Alta</th>
-                        <th>Media</th>
-                        <th>Baja</th>
-                        <th>Web</th>
-                        <th>App</th>
-                    </tr>
-                </thead>
-                <tbody>"""
-
-        # Datos semanales PM
-        for week, data in stats['pm']['por_semana'].items():
-            html += f"""
-                <tr>
-                    <td data-label="Semana">{week}</td>
-                    <td data-label="Alta">{data['alta']}</td>
-                    <td data-label="Media">{data['media']}</td>
-                    <td data-label="Baja">{data['baja']}</td>
-                    <td data-label="Web">{data['web']}</td>
-                    <td data-label="App">{data['app']}</td>
-                </tr>"""
-
-        html += """
-                </tbody>
-            </table>
+            <div class="chart-container">
+                """ + self._chart_div(charts, 'summaryChart') + """
+            </div>
 
+            <h3 class="section-title">Distribución por Plataforma</h3>
             <div class="chart-container">
-                <div id="priorityChart"></div>
+                """ + self._chart_div(charts, 'platformChart') + """
+            </div>
+
+            <h3 class="section-title">Retrabajo (Ciclos de Rechazo)</h3>
+            <div class="stats-grid">""" + self._render_rework_cards(stats['rework']['historical']) + """
+            </div>
+            <div class="week-selector">
+                <label>Agrupar por: </label>
+                <select id="reworkGroupBy" onchange="updateReworkView()">
+                    <option value="por_desarrollador">Desarrollador</option>
+                    <option value="por_sitio">Sitio</option>
+                    <option value="por_tipo">Web/App</option>
+                    <option value="por_semana">Semana</option>
+                </select>
             </div>
+            <div id="reworkDetails"></div>
         </div>
 
-        <div id="sites" class="tab-content">
-            <h2 class="section-title">Estadísticas Completas por Sitio</h2>
+        <div id="qa" class="tab-content">
+            <h2 class="section-title">Estadísticas Completas de QA</h2>
+
+            <div class="info-box">
+                <h3>📊 Resumen Histórico de QA</h3>
+                <p><strong>Total de tarjetas revisadas:</strong> """ + str(stats['qa']['historical']['total_revisadas']) + """</p>
+                <p><strong>Total de tarjetas rechazadas:</strong> """ + str(stats['qa']['historical']['total_rechazadas']) + """</p>
+            </div>
 
+            <h3>Detalle por QA (Histórico)</h3>
             <table>
                 <thead>
                     <tr>
-                        <th>Sitio</th>
-                        <th>Total</th>
-                        <th>Web</th>
-                        <th>App</th>
-                        <th>Aceptadas</th>
-                        <th>Rechazadas</th>
-                        <th>Promedio/Semana</th>
-                        <th>Promedio Rechazadas/Semana</th>
-                        <th>Promedio Aceptadas/Semana</th>
+                        <th>QA/PM</th>
+                        <th>Total Revisadas</th>
+                        <th>Total Rechazadas</th>
+                        <th>Promedio Semanal</th>
+                        <th>% Rechazo</th>
                     </tr>
                 </thead>
                 <tbody>"""
 
-        # Top sitios
-        site_count = 0
-        for site, data in stats['sites'].items():
-            if site_count < 25:  # Top 25
-                html += f"""
-                <tr>
-                    <td data-label="Sitio">{site}</td>
-                    <td data-label="Total">{data['total']}</td>
-                    <td data-label="Web">{data['web']}</td>
-                    <td data-label="App">{data['app']}</td>
-                    <td data-label="Aceptadas">{data['aceptadas']}</td>
-                    <td data-label="Rechazadas">{data['rechazadas']}</td>
-                    <td data-label="Promedio/Semana">{data['promedio_por_semana']}</td>
-                    <td data-label="Promedio Rechazadas/Semana">{data['promedio_rechazadas_semana']}</td>
-                    <td data-label="Promedio Aceptadas/Semana">{data['promedio_aceptadas_semana']}</td>
-                </tr>"""
-                site_count += 1
+        # Agregar datos de QA
+        yield ''.join(self._render_qa_row(qa, data) for qa, data in stats['qa']['historical']['por_qa'].items())
 
-        html += """
+        yield """
                 </tbody>
             </table>
 
-            <div class="chart-container">
-                <div id="siteChart"></div>
-            </div>
-        </div>
-
-        <div id="weekly" class="tab-content">
-            <h2 class="section-title">Vista Semanal Completa</h2>
-
+            <h3>Vista Semanal de QA</h3>
             <div class="week-selector">
-                <label>Seleccionar semana para análisis detallado: </label>
-                <select id="weekSelector" onchange="updateWeeklyView()">"""
+                <label>Seleccionar semana: </label>
+                <select id="qaWeekSelector" onchange="updateQAWeekView()">
+                    <option value="all">Todas las semanas</option>"""
 
-        for week in stats['weeks_list']:
-            html += f'<option value="{week}">{week}</option>'
+        yield self._render_week_options(stats['weeks_list'])
 
-        html += """
+        yield """
                 </select>
             </div>
+            <div id="qaWeeklyDetails"></div>
 
-            <div id="weeklyAnalysis"></div>
+            <h3>Tiempo de Respuesta de QA</h3>
+            <div class="info-box">
+                <p>Días desde la fecha tentativa de validación hasta la aprobación o rechazo, sobre las """ + str(stats['turnaround']['historical']['tarjetas']) + """ tarjetas con ambas fechas.</p>
+                <p>""" + self._render_turnaround_summary(stats['turnaround']) + """</p>
+            </div>
+            <div class="week-selector">
+                <label>Agrupar por: </label>
+                <select id="turnaroundGroupBy" onchange="updateTurnaroundView()">
+                    <option value="por_qa">QA/PM</option>
+                    <option value="por_desarrollador">Desarrollador</option>
+                    <option value="por_sitio">Sitio</option>
+                    <option value="por_semana">Semana</option>
+                </select>
+            </div>
+            <div id="turnaroundDetails"></div>
         </div>
-    </div>
-
-    <script>
-        // Datos para los gráficos
-        const allStats = """ + json.dumps(stats) + """;
-
-        // Common Plotly layout options for consistency
-        const commonLayout = {
-            font: {
-                family: 'Inter, sans-serif',
-                size: 12,
-                color: 'var(--text-dark)'
-            },
-            paper_bgcolor: 'var(--card-background)',
-            plot_bgcolor: 'var(--card-background)',
-            margin: { t: 60, b: 80, l: 60, r: 30 },
-            hovermode: 'closest',
-            title: {
-                font: {
-                    size: 18,
-                    color: 'var(--text-dark)'
-                },
-                x: 0.05, // Align title to left
-                xanchor: 'left'
-            },
-            xaxis: {
-                showgrid: false,
-                zeroline: false,
-                linecolor: 'var(--border-light)',
-                linewidth: 1,
-                tickfont: { size: 10 }
-            },
-            yaxis: {
-                showgrid: true,
-                gridcolor: '#f0f0f0',
-                zeroline: false,
-                linecolor: 'var(--border-light)',
-                linewidth: 1,
-                tickfont: { size: 10 }
-            },
-            legend: {
-                orientation: 'h',
-                xanchor: 'center',
-                x: 0.5,
-                y: -0.2, // Below the chart
-                font: { size: 10 }
-            }
-        };
-
-        // Function to change tabs
-        function showTab(tabName) {
-            // Ocultar todos los tabs
-            const tabs = document.querySelectorAll('.tab-content');
-            tabs.forEach(tab => tab.classList.remove('active'));
-
-            // Desactivar todos los botones
-            const buttons = document.querySelectorAll('.tab-button');
-            buttons.forEach(btn => btn.classList.remove('active'));
-
-            // Mostrar tab seleccionado
-            document.getElementById(tabName).classList.add('active');
-
-            // Activar botón correspondiente
-            const buttonTextMap = {
-                'resumen': 'Resumen General',
-                'qa': 'QA',
-                'web': 'Web',
-                'app': 'App',
-                'devs': 'Desarrolladores',
-                'pm': 'PM',
-                'sites': 'Sitios',
-                'weekly': 'Vista Semanal'
-            };
-            const clickedButton = Array.from(document.querySelectorAll('.tab-button')).find(btn => btn.textContent.includes(buttonTextMap[tabName]));
-            if (clickedButton) {
-                clickedButton.classList.add('active');
-            }
 
+        <div id="web" class="tab-content">
+            <h2 class="section-title">Estadísticas Completas Web</h2>
 
-            // Cargar gráficos según el tab
-            if (tabName === 'resumen') {
-                loadSummaryCharts();
-            } else if (tabName === 'web') {
-                loadWebCharts();
-            } else if (tabName === 'app') {
-                loadAppCharts();
-            } else if (tabName === 'devs') {
-                loadDevCharts();
-                // Hide any previously shown developer weekly details
-                document.getElementById('devWebWeeklyDetails').style.display = 'none';
-                document.getElementById('devAppWeeklyDetails').style.display = 'none';
-            } else if (tabName === 'pm') {
-                loadPMCharts();
-            } else if (tabName === 'sites') {
-                loadSiteCharts();
-            }
-        }
+            <div class="metric-group">
+                <h4>🌐 Totales Históricos Web</h4>
+                <p><strong>Número de tarjetas revisadas:</strong> """ + str(stats['web']['historical']['total_revisadas']) + """</p>
+                <p><strong>Número de tarjetas rechazadas:</strong> """ + str(stats['web']['historical']['total_rechazadas']) + """</p>
+                <p><strong>Número de tarjetas aceptadas:</strong> """ + str(stats['web']['historical']['total_aceptadas']) + """</p>
+                <p><strong>Porcentaje de rechazo:</strong> <span class="highlight">""" + str(stats['web']['historical']['porcentaje_rechazo']) + """%</span></p>
+            </div>
 
-        // Cargar gráficos de resumen
-        function loadSummaryCharts() {
-            // Gráfico de resumen general
-            const summaryData = [
-                {
-                    x: ['Web', 'App'],
-                    y: [allStats.web.historical.total_revisadas, allStats.app.historical.total_revisadas],
-                    name: 'Total Revisadas',
-                    type: 'bar',
-                    marker: { color: 'var(--primary-color)' }
-                },
-                {
-                    x: ['Web', 'App'],
-                    y: [allStats.web.historical.total_rechazadas, allStats.app.historical.total_rechazadas],
-                    name: 'Rechazadas',
-                    type: 'bar',
-                    marker: { color: 'var(--danger-color)' }
-                },
-                {
-                    x: ['Web', 'App'],
-                    y: [allStats.web.historical.total_aceptadas, allStats.app.historical.total_aceptadas],
-                    name: 'Aceptadas',
-                    type: 'bar',
-                    marker: { color: 'var(--success-color)' }
-                }
-            ];
+            <h3>Estadísticas Web por Semana</h3>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Semana</th>
+                        <th>Revisadas</th>
+                        <th>Aceptadas</th>
+                        <th>Rechazadas</th>
+                        <th>% Rechazo</th>
+                    </tr>
+                </thead>
+                <tbody>"""
 
-            const summaryLayout = {
-                ...commonLayout,
-                title: 'Resumen General - Web vs App',
-                barmode: 'group',
-                height: 400
-            };
+        # Datos semanales Web
+        yield ''.join(self._render_weekly_type_row(week, data) for week, data in stats['web']['weekly'].items())
 
-            Plotly.newPlot('summaryChart', summaryData, summaryLayout);
+        yield """
+                </tbody>
+            </table>
 
-            // Gráfico de plataformas
-            const platformData = {
-                labels: Object.keys(allStats.platforms),
-                values: Object.values(allStats.platforms),
-                type: 'pie',
-                hole: 0.4,
-                textposition: 'outside', // Changed to outside for better readability
-                textinfo: 'label+percent',
-                marker: {
-                    colors: [
-                        '#4A00E0', '#8E2DE2', '#00C9FF', '#FF8C00', '#20B2AA',
-                        '#FF6347', '#4682B4', '#DA70D6', '#3CB371', '#BA55D3'
-                    ]
-                },
-                hoverinfo: 'label+value+percent',
-                pull: [0.05, 0, 0, 0, 0, 0, 0, 0, 0, 0] // Slightly pull out the first slice
-            };
+            <div class="chart-container">
+                """ + self._chart_div(charts, 'webTrendChart') + """
+            </div>
+        </div>
 
-            const platformLayout = {
-                ...commonLayout,
-                title: 'Distribución por Plataforma',
-                height: 400,
-                showlegend: true,
-                legend: {
-                    orientation: 'h',
-                    xanchor: 'center',
-                    x: 0.5,
-                    y: -0.2, // Below the chart
-                    font: { size: 10 }
-                }
-            };
+        <div id="app" class="tab-content">
+            <h2 class="section-title">Estadísticas Completas App</h2>
 
-            Plotly.newPlot('platformChart', [platformData], platformLayout);
-        }
+            <div class="metric-group">
+                <h4>📱 Totales Históricos App</h4>
+                <p><strong>Número de tarjetas revisadas:</strong> """ + str(stats['app']['historical']['total_revisadas']) + """</p>
+                <p><strong>Número de tarjetas rechazadas:</strong> """ + str(stats['app']['historical']['total_rechazadas']) + """</p>
+                <p><strong>Número de tarjetas aceptadas:</strong> """ + str(stats['app']['historical']['total_aceptadas']) + """</p>
+                <p><strong>Porcentaje de rechazo:</strong> <span class="highlight">""" + str(stats['app']['historical']['porcentaje_rechazo']) + """%</span></p>
+            </div>
 
-        // Cargar gráficos Web
-        function loadWebCharts() {
-            const weeks = Object.keys(allStats.web.weekly);
-            const webData = Object.values(allStats.web.weekly);
+            <h3>Estadísticas App por Semana</h3>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Semana</th>
+                        <th>Revisadas</th>
+                        <th>Aceptadas</th>
+                        <th>Rechazadas</th>
+                        <th>% Rechazo</th>
+                    </tr>
+                </thead>
+                <tbody>"""
 
-            const webTrace = {
-                x: weeks.map(w => w.replace('tarjetas semana ', '')),
-                y: webData.map(d => d.porcentaje_rechazo),
-                type: 'scatter',
-                mode: 'lines+markers',
-                name: 'Porcentaje de Rechazo',
-                line: { color: 'var(--primary-color)', width: 3, shape: 'spline' },
-                marker: { size: 8, symbol: 'circle', color: 'var(--primary-color)', line: { width: 1, color: 'white' } },
-                hovertemplate: 'Semana: %{x}<br>Rechazo: %{y:.2f}%<extra></extra>'
-            };
+        # Datos semanales App
+        yield ''.join(self._render_weekly_type_row(week, data) for week, data in stats['app']['weekly'].items())
 
-            const webLayout = {
-                ...commonLayout,
-                title: 'Tendencia de Rechazo Web por Semana',
-                xaxis: { title: 'Semana' },
-                yaxis: { title: 'Porcentaje de Rechazo (%)', range: [0, Math.max(...webData.map(d => d.porcentaje_rechazo)) * 1.2 || 100] },
-                height: 400
-            };
+        yield """
+                </tbody>
+            </table>
 
-            Plotly.newPlot('webTrendChart', [webTrace], webLayout);
-        }
+            <div class="chart-container">
+                """ + self._chart_div(charts, 'appTrendChart') + """
+            </div>
+        </div>
 
-        // Cargar gráficos App
-        function loadAppCharts() {
-            const weeks = Object.keys(allStats.app.weekly);
-            const appData = Object.values(allStats.app.weekly);
+        <div id="devs" class="tab-content">
+            <h2 class="section-title">Estadísticas Completas de Desarrolladores</h2>
 
-            const appTrace = {
-                x: weeks.map(w => w.replace('tarjetas semana ', '')),
-                y: appData.map(d => d.porcentaje_rechazo),
-                type: 'scatter',
-                mode: 'lines+markers',
-                name: 'Porcentaje de Rechazo',
-                line: { color: 'var(--danger-color)', width: 3, shape: 'spline' },
-                marker: { size: 8, symbol: 'square', color: 'var(--danger-color)', line: { width: 1, color: 'white' } },
-                hovertemplate: 'Semana: %{x}<br>Rechazo: %{y:.2f}%<extra></extra>'
-            };
+            <h3>🌐 Desarrollo Web - Todas las métricas</h3>"""
 
-            const appLayout = {
-                ...commonLayout,
-                title: 'Tendencia de Rechazo App por Semana',
-                xaxis: { title: 'Semana' },
-                yaxis: { title: 'Porcentaje de Rechazo (%)', range: [0, Math.max(...appData.map(d => d.porcentaje_rechazo)) * 1.2 || 100] },
-                height: 400
-            };
+        yield self._render_virtual_table('devWebTable', self.DEV_TABLE_COLUMNS, stats['dev_web'],
+                                         lambda dev, data: self._render_dev_row(dev, data, 'web'), 'desarrolladores')
 
-            Plotly.newPlot('appTrendChart', [appTrace], appLayout);
-        }
+        yield """
+            <div id="devWebWeeklyDetails" class="info-box" style="display: none;"></div>
 
-        // Cargar gráficos de desarrolladores
-        function loadDevCharts() {
-            // Top 5 desarrolladores Web vs App
-            const top5Web = Object.entries(allStats.dev_web).slice(0, 5);
-            const top5App = Object.entries(allStats.dev_app).slice(0, 5);
+            <h3>📱 Desarrollo App - Todas las métricas</h3>"""
 
-            const traces = [
-                {
-                    x: top5Web.map(([dev, data]) => dev),
-                    y: top5Web.map(([dev, data]) => data.total_tarjetas),
-                    name: 'Web - Total',
-                    type: 'bar',
-                    marker: { color: 'var(--primary-color)' }
-                },
-                {
-                    x: top5Web.map(([dev, data]) => dev),
-                    y: top5Web.map(([dev, data]) => data.rechazadas),
-                    name: 'Web - Rechazadas',
-                    type: 'bar',
-                    marker: { color: 'rgba(74, 0, 224, 0.6)' } // Lighter primary
-                },
-                {
-                    x: top5App.map(([dev, data]) => dev),
-                    y: top5App.map(([dev, data]) => data.total_tarjetas),
-                    name: 'App - Total',
-                    type: 'bar',
-                    marker: { color: 'var(--danger-color)' }
-                },
-                {
-                    x: top5App.map(([dev, data]) => dev),
-                    y: top5App.map(([dev, data]) => data.rechazadas),
-                    name: 'App - Rechazadas',
-                    type: 'bar',
-                    marker: { color: 'rgba(231, 76, 60, 0.6)' } // Lighter danger
-                }
-            ];
+        yield self._render_virtual_table('devAppTable', self.DEV_TABLE_COLUMNS, stats['dev_app'],
+                                         lambda dev, data: self._render_dev_row(dev, data, 'app'), 'desarrolladores')
 
-            const layout = {
-                ...commonLayout,
-                title: 'Top 5 Desarrolladores - Comparación Web vs App',
-                barmode: 'group',
-                height: 500,
-                xaxis: { tickangle: -45 }
-            };
+        yield """
+            <div id="devAppWeeklyDetails" class="info-box" style="display: none;"></div>
 
-            Plotly.newPlot('devComparisonChart', traces, layout);
-        }
+            <div class="chart-container">
+                """ + self._chart_div(charts, 'devComparisonChart') + """
+            </div>
+        </div>
 
-        // Cargar gráficos PM
-        function loadPMCharts() {
-            const weeks = Object.keys(allStats.pm.por_semana);
-            const pmData = Object.values(allStats.pm.por_semana);
+        <div id="pm" class="tab-content">
+            <h2 class="section-title">Estadísticas Completas de Project Management</h2>
 
-            const traces = [
-                {
-                    x: weeks.map(w => w.replace('tarjetas semana ', '')),
-                    y: pmData.map(d => d.alta),
-                    name: 'Alta',
-                    type: 'scatter',
-                    mode: 'lines+markers',
-                    line: { color: 'var(--danger-color)', width: 3, shape: 'spline' },
-                    marker: { size: 8 }
-                },
-                {
-                    x: weeks.map(w => w.replace('tarjetas semana ', '')),
-                    y: pmData.map(d => d.media),
-                    name: 'Media',
-                    type: 'scatter',
-                    mode: 'lines+markers',
-                    line: { color: 'var(--warning-color)', width: 3, shape: 'spline' },
-                    marker: { size: 8 }
-                },
-                {
-                    x: weeks.map(w => w.replace('tarjetas semana ', '')),
-                    y: pmData.map(d => d.baja),
-                    name: 'Baja',
-                    type: 'scatter',
-                    mode: 'lines+markers',
-                    line: { color: 'var(--success-color)', width: 3, shape: 'spline' },
-                    marker: { size: 8 }
-                }
-            ];
+            <div class="stats-grid">
+                <div class="stat-card">
+                    <div class="stat-label">Tarjetas Prioridad Alta</div>
+                    <div class="stat-value">""" + str(stats['pm']['prioridades']['alta']['total']) + """</div>
+                    <p class="small-text">Promedio: """ + str(stats['pm']['prioridades']['alta']['promedio_semanal']) + """ por semana</p>
+                </div>
 
-            const layout = {
-                ...commonLayout,
-                title: 'Evolución de Prioridades por Semana',
-                xaxis: { title: 'Semana' },
-                yaxis: { title: 'Número de Tarjetas' },
-                height: 400
-            };
+                <div class="stat-card">
+                    <div class="stat-label">Tarjetas Prioridad Media</div>
+                    <div class="stat-value">""" + str(stats['pm']['prioridades']['media']['total']) + """</div>
+                    <p class="small-text">Promedio: """ + str(stats['pm']['prioridades']['media']['promedio_semanal']) + """ por semana</p>
+                </div>
 
-            Plotly.newPlot('priorityChart', traces, layout);
-        }
+                <div class="stat-card">
+                    <div class="stat-label">Tarjetas Prioridad Baja</div>
+                    <div class="stat-value">""" + str(stats['pm']['prioridades']['baja']['total']) + """</div>
+                    <p class="small-text">Promedio: """ + str(stats['pm']['prioridades']['baja']['promedio_semanal']) + """ por semana</p>
+                </div>
+            </div>
 
-        // Cargar gráficos de sitios
-        function loadSiteCharts() {
-            const top10Sites = Object.entries(allStats.sites).slice(0, 10);
+            <div class="metric-group">
+                <h4>📊 Promedio de Tarjetas Enviadas por Semana</h4>
+                <p><strong>Web:</strong> """ + str(stats['pm']['promedio_semanal']['web']) + """ tarjetas/semana</p>
+                <p><strong>App:</strong> """ + str(stats['pm']['promedio_semanal']['app']) + """ tarjetas/semana</p>
+                <p><strong>Total:</strong> """ + str(stats['pm']['promedio_semanal']['total']) + """ tarjetas/semana</p>
+            </div>
 
-            const traces = [
-                {
-                    x: top10Sites.map(([site, data]) => site),
-                    y: top10Sites.map(([site, data]) => data.web),
-                    name: 'Web',
-                    type: 'bar',
-                    marker: { color: 'var(--primary-color)' }
-                },
-                {
-                    x: top10Sites.map(([site, data]) => site),
-                    y: top10Sites.map(([site, data]) => data.app),
-                    name: 'App',
-                    type: 'bar',
-                    marker: { color: 'var(--danger-color)' }
-                }
-            ];
+            <h3>Desglose Semanal de Prioridades</h3>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Semana</th>
+                        <th>Alta</th>
+                        <th>Media</th>
+                        <th>Baja</th>
+                        <th>Web</th>
+                        <th>App</th>
+                    </tr>
+                </thead>
+                <tbody>"""
 
-            const layout = {
-                ...commonLayout,
-                title: 'Top 10 Sitios - Distribución Web vs App',
-                barmode: 'stack',
-                height: 400,
-                xaxis: { tickangle: -45 }
-            };
+        # Datos semanales PM
+        yield ''.join(self._render_pm_row(week, data) for week, data in stats['pm']['por_semana'].items())
 
-            Plotly.newPlot('siteChart', traces, layout);
-        }
+        yield """
+                </tbody>
+            </table>
 
-        // Actualizar vista semanal
-        function updateWeeklyView() {
-            const selectedWeek = document.getElementById('weekSelector').value;
-            const weekData = {
-                qa: allStats.qa.weekly[selectedWeek],
-                web: allStats.web.weekly[selectedWeek],
-                app: allStats.app.weekly[selectedWeek],
-                pm: allStats.pm.por_semana[selectedWeek]
-            };
+            <div class="chart-container">
+                """ + self._chart_div(charts, 'priorityChart') + """
+            </div>
+        </div>
 
-            let html = '<div class="info-box">';
-            html += '<h3>Resumen de ' + selectedWeek + '</h3>';
-            html += '<div class="stats-grid">';
-            html += '<div class="metric-group">';
-            html += '<h4>QA</h4>';
-            html += '<p>Total tarjetas: <strong>' + weekData.qa.total_semana + '</strong></p>';
-            html += '<p>Total rechazadas: <strong>' + weekData.qa.total_rechazadas_semana + '</strong></p>';
-            html += '</div>';
-            html += '<div class="metric-group">';
-            html += '<h4>Web</h4>';
-            html += '<p>Revisadas: <strong>' + weekData.web.revisadas + '</strong></p>';
-            html += '<p>Aceptadas: <strong>' + weekData.web.aceptadas + '</strong></p>';
-            html += '<p>Rechazadas: <strong>' + weekData.web.rechazadas + '</strong></p>';
-            html += '<p>% Rechazo: <span class="highlight">' + weekData.web.porcentaje_rechazo + '%</span></p>';
-            html += '</div>';
-            html += '<div class="metric-group">';
-            html += '<h4>App</h4>';
-            html += '<p>Revisadas: <strong>' + weekData.app.revisadas + '</strong></p>';
-            html += '<p>Aceptadas: <strong>' + weekData.app.aceptadas + '</strong></p>';
-            html += '<p>Rechazadas: <strong>' + weekData.app.rechazadas + '</strong></p>';
-            html += '<p>% Rechazo: <span class="highlight">' + weekData.app.porcentaje_rechazo + '%</span></p>';
-            html += '</div>';
-            html += '<div class="metric-group">';
-            html += '<h4>Prioridades</h4>';
-            html += '<p>Alta: <strong>' + weekData.pm.alta + '</strong></p>';
-            html += '<p>Media: <strong>' + weekData.pm.media + '</strong></p>';
-            html += '<p>Baja: <strong>' + weekData.pm.baja + '</strong></p>';
-            html += '</div>';
-            html += '</div>';
-            html += '</div>';
+        <div id="sites" class="tab-content">
+            <h2 class="section-title">Estadísticas Completas por Sitio</h2>
+"""
 
-            document.getElementById('weeklyAnalysis').innerHTML = html;
-        }
+        yield self._render_virtual_table('siteTable', self.SITE_TABLE_COLUMNS, stats['sites'],
+                                         self._render_site_row, 'sitios')
 
-        // Actualizar vista semanal de QA
-        function updateQAWeekView() {
-            const selector = document.getElementById('qaWeekSelector');
-            const selectedWeek = selector.value;
+        yield """
 
-            if (selectedWeek === 'all') {
-                document.getElementById('qaWeeklyDetails').innerHTML = '';
-                return;
-            }
+            <div class="chart-container">
+                """ + self._chart_div(charts, 'siteChart') + """
+            </div>
+        </div>
 
-            const weekData = allStats.qa.weekly[selectedWeek];
-            let html = '<div class="info-box">';
-            html += '<h4>Detalle de ' + selectedWeek + '</h4>';
-            html += '<table><thead><tr><th>QA/PM</th><th>Tarjetas Revisadas</th><th>Tarjetas Rechazadas</th></tr></thead><tbody>';
+        <div id="weekly" class="tab-content">
+            <h2 class="section-title">Vista Semanal Completa</h2>
 
-            for (const [qa, count] of Object.entries(weekData.tarjetas_por_qa)) {
-                const rechazadas = weekData.rechazadas_por_qa[qa] || 0;
-                html += `<tr>
-                            <td data-label="QA/PM">${qa}</td>
-                            <td data-label="Tarjetas Revisadas">${count}</td>
-                            <td data-label="Tarjetas Rechazadas">${rechazadas}</td>
-                         </tr>`;
-            }
+            <div class="week-selector">
+                <label>Seleccionar semana para análisis detallado: </label>
+                <select id="weekSelector" onchange="updateWeeklyView()">"""
 
-            html += '</tbody></table></div>';
-            document.getElementById('qaWeeklyDetails').innerHTML = html;
-        }
+        yield self._render_week_options(stats['weeks_list'])
 
-        // NEW: Function to show weekly metrics for a specific developer
-        function showDevWeeklyMetrics(developerName, devType) {
-            let weeklyDetails = {};
-            let targetDivId = '';
+        yield """
+                </select>
+            </div>
 
-            if (devType === 'web') {
-                weeklyDetails = allStats.dev_web_weekly_details[developerName];
-                targetDivId = 'devWebWeeklyDetails';
-            } else if (devType === 'app') {
-                weeklyDetails = allStats.dev_app_weekly_details[developerName];
-                targetDivId = 'devAppWeeklyDetails';
-            }
+            <div id="weeklyAnalysis"></div>
+        </div>
 
-            let html = `<h3>Métricas Semanales para ${developerName} (${devType.toUpperCase()})</h3>`;
-            html += `<table>
+        <div id="explorer" class="tab-content">
+            <h2 class="section-title">Explorador</h2>
+            <p class="small-text">Combina filtros por semanas, tipo, sitio, plataforma, desarrollador, QA/PM y prioridad. Entre paréntesis, las tarjetas de cada opción con el resto de filtros aplicados.</p>
+""" + self._render_explorer_filters() + """
+            <div id="explorerTotals" class="stats-grid"></div>
+            <div class="chart-container">
+                <div id="explorerChart"></div>
+            </div>
+            <div id="explorerGroups"></div>
+            <p id="explorerStatus" class="small-text"></p>
+        </div>
+    </div>
+
+    <script>
+        // Datos para los gráficos
+"""
+        # Con Plotly en defer, el script en línea corre antes que Plotly: se espera a DOMContentLoaded
+        wait_for_dom = plotly_url is not None
+        if data_files is None:
+            payload = self.statistics_payload(stats)
+            if compress_payload and len(payload.encode('utf-8')) >= self.COMPRESS_PAYLOAD_MIN_BYTES:
+                compressed = base64.b64encode(gzip.compress(payload.encode('utf-8'), mtime=0)).decode('ascii')
+                yield "        const allStats = {};\n"
+                yield ("        const statsReady = inflateStats('" + compressed + "')"
+                       + ".then(data => Object.assign(allStats, data));\n")
+                yield DASHBOARD_SCRIPT
+                ready = "statsReady"
+                if wait_for_dom:
+                    ready = ("Promise.all([" + ready
+                             + ", new Promise(resolve => document.addEventListener('DOMContentLoaded', resolve))])")
+                yield ("\n        " + ready + ".then(() => {" + DASHBOARD_INIT_SCRIPT + "        })"
+                       + "\n            .catch(error => console.error('No se pudieron descomprimir los datos del dashboard:', error));\n")
+            else:
+                yield "        const allStats = decodeStats(" + payload + ");\n"
+                yield DASHBOARD_SCRIPT
+                if wait_for_dom:
+                    yield "\n        document.addEventListener('DOMContentLoaded', () => {" + DASHBOARD_INIT_SCRIPT + "        });\n"
+                else:
+                    yield DASHBOARD_INIT_SCRIPT
+        else:
+            yield "        const allStats = {};\n"
+            yield "        const dataFiles = " + json.dumps(data_files) + ";\n"
+            yield "        const tabDataFiles = " + json.dumps(self.TAB_DATA_FILES) + ";\n"
+            if assets is None:
+                yield self.lazy_dashboard_script(wait_for_dom)
+        yield "    </script>\n"
+        if assets is not None:
+            # defer mantiene el orden respecto a Plotly y corre con el documento ya leído
+            yield f'    <script src="{assets["js"]}" defer></script>\n'
+        yield """</body>
+</html>"""
+
+    @staticmethod
+    def lazy_dashboard_script(wait_for_dom=False):
+        """
+        Lógica del navegador para el modo de datos separados: arranca cuando llega summary.json
+        y, con wait_for_dom, también DOMContentLoaded.
+        """
+        ready = "loadDataFile('summary')"
+        if wait_for_dom:
+            ready = ("Promise.all([" + ready
+                     + ", new Promise(resolve => document.addEventListener('DOMContentLoaded', resolve))])")
+        return (DASHBOARD_SCRIPT + DASHBOARD_LAZY_SCRIPT
+                + "\n        " + ready + ".then(() => {" + DASHBOARD_INIT_SCRIPT + "        });\n")
+
+
+    def render_static_charts(self, stats):
+        """SVG de la vista inicial de cada gráfico, con los mismos datos que las funciones load*Charts del JS"""
+        def short_week(week):
+            return week.replace('tarjetas semana ', '')
+
+        web, app = stats['web']['historical'], stats['app']['historical']
+        charts = {
+            'summaryChart': svg_bar_chart('Resumen General - Web vs App', [
+                ('Total Revisadas', {'Web': web['total_revisadas'], 'App': app['total_revisadas']}, 'var(--primary-color)'),
+                ('Rechazadas', {'Web': web['total_rechazadas'], 'App': app['total_rechazadas']}, 'var(--danger-color)'),
+                ('Aceptadas', {'Web': web['total_aceptadas'], 'App': app['total_aceptadas']}, 'var(--success-color)'),
+            ]),
+            'platformChart': svg_donut_chart('Distribución por Plataforma', list(stats['platforms']),
+                                             list(stats['platforms'].values()), PLATFORM_COLORS),
+        }
+        for chart_id, platform_type, title, color in [
+            ('webTrendChart', 'web', 'Tendencia de Rechazo Web por Semana', 'var(--primary-color)'),
+            ('appTrendChart', 'app', 'Tendencia de Rechazo App por Semana', 'var(--danger-color)'),
+        ]:
+            weekly = stats[platform_type]['weekly']
+            rates = [data['porcentaje_rechazo'] for data in weekly.values()]
+            charts[chart_id] = svg_line_chart(title, [short_week(week) for week in weekly],
+                                              [('Porcentaje de Rechazo', rates, color)],
+                                              y_max=max(rates, default=0) * 1.2 or 100)
+
+        top5_web = list(islice(stats['dev_web'].items(), 5))
+        top5_app = list(islice(stats['dev_app'].items(), 5))
+        charts['devComparisonChart'] = svg_bar_chart('Top 5 Desarrolladores - Comparación Web vs App', [
+            ('Web - Total', {dev: data['total_tarjetas'] for dev, data in top5_web}, 'var(--primary-color)'),
+            ('Web - Rechazadas', {dev: data['rechazadas'] for dev, data in top5_web}, 'rgba(74, 0, 224, 0.6)'),
+            ('App - Total', {dev: data['total_tarjetas'] for dev, data in top5_app}, 'var(--danger-color)'),
+            ('App - Rechazadas', {dev: data['rechazadas'] for dev, data in top5_app}, 'rgba(231, 76, 60, 0.6)'),
+        ], height=500, tickangle=-45)
+
+        por_semana = stats['pm']['por_semana']
+        charts['priorityChart'] = svg_line_chart('Evolución de Prioridades por Semana', [short_week(week) for week in por_semana], [
+            ('Alta', [data['alta'] for data in por_semana.values()], 'var(--danger-color)'),
+            ('Media', [data['media'] for data in por_semana.values()], 'var(--warning-color)'),
+            ('Baja', [data['baja'] for data in por_semana.values()], 'var(--success-color)'),
+        ])
+
+        top10_sites = list(islice(stats['sites'].items(), 10))
+        charts['siteChart'] = svg_bar_chart('Top 10 Sitios - Distribución Web vs App', [
+            ('Web', {site: data['web'] for site, data in top10_sites}, 'var(--primary-color)'),
+            ('App', {site: data['app'] for site, data in top10_sites}, 'var(--danger-color)'),
+        ], stacked=True, tickangle=-45)
+        return charts
+
+    @staticmethod
+    def _chart_div(charts, chart_id):
+        if chart_id not in charts:
+            return f'<div id="{chart_id}"></div>'
+        return f'<div id="{chart_id}" data-static-chart>{charts[chart_id]}</div>'
+
+    def _render_virtual_table(self, table_id, columns, entries, render_row, noun):
+        """
+        Contenedor de una tabla virtualizada (ver initVirtualTable en el JS), con las primeras
+        VIRTUAL_TABLE_PRERENDER_ROWS filas ya en el HTML para verse antes de que corra el JS.
+        """
+        headers = ''.join(f"""
+                            <th data-key="{key}" onclick="sortVirtualTable('{table_id}', '{key}')">{label}</th>"""
+                          for label, key in columns)
+        rows = ''.join(render_row(name, data) for name, data in islice(entries.items(), self.VIRTUAL_TABLE_PRERENDER_ROWS))
+        return f"""
+            <div id="{table_id}" class="virtual-table">
+                <div class="virtual-table-toolbar">
+                    <input type="search" class="table-filter" placeholder="Filtrar {noun}..." oninput="filterVirtualTable('{table_id}', this.value)">
+                    <span class="table-count">{len(entries)} de {len(entries)} {noun}</span>
+                </div>
+                <div class="virtual-table-viewport" onscroll="scheduleVirtualTableRender('{table_id}')">
+                    <table>
                         <thead>
-                            <tr>
-                                <th>Semana</th>
-                                <th>Total Tarjetas</th>
-                                <th>Rechazadas</th>
-                                <th>Aceptadas</th>
-                                <th>% Rechazo</th>
+                            <tr>{headers}
                             </tr>
                         </thead>
-                        <tbody>`;
-
-            if (!weeklyDetails || Object.keys(weeklyDetails).length === 0) {
-                html += `<tr><td colspan="5" style="text-align: center; color: var(--text-medium);">No hay datos semanales disponibles para este desarrollador.</td></tr>`;
-            } else {
-                for (const week of allStats.weeks_list) { // Iterate through all weeks to show gaps
-                    const data = weeklyDetails[week];
-                    if (data) {
-                        const percentageClass = data.porcentaje_rechazo > 20 ? 'high' : (data.porcentaje_rechazo > 10 ? 'medium' : 'low');
-                        html += `<tr>
-                                    <td data-label="Semana">${week}</td>
-                                    <td data-label="Total Tarjetas">${data.total_tarjetas}</td>
-                                    <td data-label="Rechazadas">${data.rechazadas}</td>
-                                    <td data-label="Aceptadas">${data.aceptadas}</td>
-                                    <td data-label="% Rechazo"><span class="percentage ${percentageClass}">${data.porcentaje_rechazo}%</span></td>
-                                </tr>`;
-                    } else {
-                        html += `<tr>
-                                    <td data-label="Semana">${week}</td>
-                                    <td colspan="4" style="text-align: center; color: var(--text-medium); font-style: italic;">(No activo esta semana)</td>
-                                </tr>`;
-                    }
-                }
-            }
-
-            html += `</tbody></table>`;
+                        <tbody>{rows}
+                        </tbody>
+                    </table>
+                </div>
+            </div>"""
+
+    @staticmethod
+    def _percentage_class(porcentaje):
+        return 'high' if porcentaje > 20 else 'medium' if porcentaje > 10 else 'low'
+
+    def _render_explorer_filters(self):
+        """Selectores del explorador; las opciones las rellena initExplorer con allStats.facts"""
+        selects = [f'                <label>{label}<select id="explorer-{name}" onchange="updateExplorer()"></select></label>\n'
+                   for _, name, label in self.FACT_DIMENSIONS if name != 'semana']
+        group_options = ''.join(f'<option value="{name}"{" selected" if name == "sitio" else ""}>{label}</option>'
+                                for _, name, label in self.FACT_DIMENSIONS)
+        return ('            <div class="explorer-filters">\n'
+                '                <label>Desde la semana<select id="explorerWeekFrom" onchange="updateExplorer()"></select></label>\n'
+                '                <label>Hasta la semana<select id="explorerWeekTo" onchange="updateExplorer()"></select></label>\n'
+                + ''.join(selects)
+                + f'                <label>Agrupar por<select id="explorerGroupBy" onchange="updateExplorer()">{group_options}</select></label>\n'
+                '            </div>\n')
+
+    @staticmethod
+    def _render_week_options(weeks):
+        return ''.join(f'<option value="{week}">{week}</option>' for week in weeks)
+
+    @staticmethod
+    def _render_rework_cards(rework):
+        cards = [
+            ('Ciclos de Rechazo', rework['ciclos'], f"En {rework['tarjetas']} tarjetas"),
+            ('Promedio por Tarjeta', rework['promedio_ciclos'], 'Rechazos por tarjeta'),
+            ('Máximo por Tarjeta', rework['max_ciclos'], 'Rechazos de una sola tarjeta'),
+            ('Tarjetas con 2+ Rechazos', rework['tarjetas_2_o_mas'], f"{rework['porcentaje_2_o_mas']}% del total"),
+        ]
+        return ''.join(f"""
+                <div class="stat-card">
+                    <div class="stat-label">{label}</div>
+                    <div class="stat-value">{value}</div>
+                    <p class="small-text">{note}</p>
+                </div>""" for label, value, note in cards)
+
+    @staticmethod
+    def _render_turnaround_summary(turnaround):
+        historical = turnaround['historical']
+        return ' · '.join(
+            f"<strong>p{percentile}:</strong> "
+            + (f"{historical[f'p{percentile}']} días" if historical[f'p{percentile}'] is not None else 'sin datos')
+            for percentile in turnaround['percentiles'])
+
+    def _render_qa_row(self, qa, data):
+        porcentaje_rechazo = round((data['total_rechazadas'] / data['total_revisadas'] * 100) if data['total_revisadas'] > 0 else 0, 2)
+        return f"""
+                <tr>
+                    <td data-label="QA/PM">{qa}</td>
+                    <td data-label="Total Revisadas">{data['total_revisadas']}</td>
+                    <td data-label="Total Rechazadas">{data['total_rechazadas']}</td>
+                    <td data-label="Promedio Semanal">{data['promedio_semanal']:.2f}</td>
+                    <td data-label="% Rechazo"><span class="percentage {self._percentage_class(porcentaje_rechazo)}">{porcentaje_rechazo}%</span></td>
+                </tr>"""
 
-            const targetDiv = document.getElementById(targetDivId);
-            targetDiv.innerHTML = html;
-            targetDiv.style.display = 'block'; // Make the div visible
+    def _render_weekly_type_row(self, week, data):
+        return f"""
+                <tr>
+                    <td data-label="Semana">{week}</td>
+                    <td data-label="Revisadas">{data['revisadas']}</td>
+                    <td data-label="Aceptadas">{data['aceptadas']}</td>
+                    <td data-label="Rechazadas">{data['rechazadas']}</td>
+                    <td data-label="% Rechazo"><span class="percentage {self._percentage_class(data['porcentaje_rechazo'])}">{data['porcentaje_rechazo']}%</span></td>
+                </tr>"""
 
-            // Scroll to the new details section
-            targetDiv.scrollIntoView({ behavior: 'smooth', block: 'start' });
-        }
+    def _render_dev_row(self, dev, data, dev_type):
+        # Doble clic en la fila muestra el desglose semanal del desarrollador
+        return f"""
+                <tr class="developer-table-row" ondblclick="showDevWeeklyMetrics('{dev}', '{dev_type}')">
+                    <td data-label="Desarrollador">{dev}</td>
+                    <td data-label="Total Tarjetas">{data['total_tarjetas']}</td>
+                    <td data-label="Rechazadas">{data['rechazadas']}</td>
+                    <td data-label="Aceptadas">{data['aceptadas']}</td>
+                    <td data-label="Promedio Semanal (Histórico)">{data['promedio_semanal_historico']}</td>
+                    <td data-label="% Rechazo"><span class="percentage {self._percentage_class(data['porcentaje_rechazo'])}">{data['porcentaje_rechazo']}%</span></td>
+                    <td data-label="Semanas Activo">{data['semanas_activo']}</td>
+                </tr>"""
 
+    def _render_pm_row(self, week, data):
+        return f"""
+                <tr>
+                    <td data-label="Semana">{week}</td>
+                    <td data-label="Alta">{data['alta']}</td>
+                    <td data-label="Media">{data['media']}</td>
+                    <td data-label="Baja">{data['baja']}</td>
+                    <td data-label="Web">{data['web']}</td>
+                    <td data-label="App">{data['app']}</td>
+                </tr>"""
 
-        // Cargar gráficos iniciales
-        loadSummaryCharts();
+    def _render_site_row(self, site, data):
+        return f"""
+                <tr>
+                    <td data-label="Sitio">{site}</td>
+                    <td data-label="Total">{data['total']}</td>
+                    <td data-label="Web">{data['web']}</td>
+                    <td data-label="App">{data['app']}</td>
+                    <td data-label="Aceptadas">{data['aceptadas']}</td>
+                    <td data-label="Rechazadas">{data['rechazadas']}</td>
+                    <td data-label="Promedio/Semana">{data['promedio_por_semana']}</td>
+                    <td data-label="Promedio Rechazadas/Semana">{data['promedio_rechazadas_semana']}</td>
+                    <td data-label="Promedio Aceptadas/Semana">{data['promedio_aceptadas_semana']}</td>
+                </tr>"""
 
-        // Inicializar vista semanal con la primera semana
-        if (allStats.weeks_list.length > 0) {
-            document.getElementById('weekSelector').value = allStats.weeks_list[0];
-            updateWeeklyView();
+    @staticmethod
+    def payload_dimensions(stats):
+        """Dimensiones de encode_stats_payload: semanas, QAs, desarrolladores y sitios de `stats`"""
+        qa_names = stats['qa']['historical']['por_qa']
+        return {
+            'weeks': {_json_key(week) for week in stats['weeks_list']},
+            'qas': {_json_key(qa) for qa in qa_names},
+            'devs': {_json_key(dev) for dev in [*stats['dev_web'], *stats['dev_app']]},
+            'sites': {_json_key(site) for site in stats['sites']},
         }
-    </script>
-</body>
-</html>"""
 
-        return html
+    def statistics_payload(self, stats, dimensions=None):
+        """JSON compacto de `stats` (o de una parte, con las dimensiones del total) según encode_stats_payload"""
+        payload = encode_stats_payload(stats, dimensions or self.payload_dimensions(stats))
+        return json.dumps(payload, separators=(',', ':'))
+
+    def split_statistics(self, stats):
+        """Reparte las estadísticas en los archivos de datos del modo separado: {nombre: secciones}"""
+        assigned = {key for keys in self.DATA_FILES.values() for key in keys}
+        files = {'summary': {key: value for key, value in stats.items() if key not in assigned}}
+        for name, keys in self.DATA_FILES.items():
+            files[name] = {key: stats[key] for key in keys}
+        return files
+
+    def write_data_files(self, stats, output_dir):
+        """Escribe un data/<nombre>.json por archivo de split_statistics; devuelve {nombre: URL}"""
+        os.makedirs(os.path.join(output_dir, 'data'), exist_ok=True)
+        data_files = {}
+        dimensions = self.payload_dimensions(stats)
+        for name, data in self.split_statistics(stats).items():
+            data_files[name] = f'data/{name}.json'
+            with open(os.path.join(output_dir, data_files[name]), 'w', encoding='utf-8') as f:
+                f.write(self.statistics_payload(data, dimensions))
+        return data_files
+
+    def write_static_assets(self, stats, output_dir, plotly_path=None):
+        """
+        Escribe datos, estilos y lógica como recursos con hash mediante AssetWriter.
+        plotly_path es el bundle de Plotly ya copiado en output_dir, que se publica también con hash.
+        Devuelve (data_files, assets, plotly_url) para iter_html_dashboard y el AssetWriter, cuyo
+        finish() (que borra los recursos anteriores) se llama cuando el nuevo HTML ya está escrito.
+        """
+        writer = AssetWriter(output_dir)
+        plotly_url = None
+        if plotly_path:
+            with open(os.path.join(output_dir, plotly_path), 'rb') as f:
+                plotly_url = writer.add('assets/plotly-basic.min.js', f.read())
+        dimensions = self.payload_dimensions(stats)
+        data_files = {name: writer.add(f'data/{name}.json', self.statistics_payload(data, dimensions))
+                      for name, data in self.split_statistics(stats).items()}
+        assets = {
+            'css': writer.add('assets/dashboard.css', DASHBOARD_STYLES),
+            'js': writer.add('assets/dashboard.js', self.lazy_dashboard_script()),
+        }
+        return (data_files, assets, plotly_url), writer
 
-    def save_dashboard(self, filename='qa_dashboard_completo.html'):
-        """Guarda el dashboard completo como archivo HTML"""
+    def save_dashboard(self, filename='qa_dashboard_completo.html', incremental=False, verify=False,
+                       split_data=False, static_assets=False, plotly='cdn', plotly_bundle=None, static_charts=True,
+                       compress_payload=False, open_browser=True):
+        """
+        Guarda el dashboard completo como archivo HTML.
+        Con incremental=True las estadísticas parten del snapshot guardado junto al HTML.
+        Con split_data=True el HTML no incrusta los datos: se escriben en data/ junto al HTML
+        y el navegador los pide por pestaña (requiere servirlo por HTTP, p. ej. GitHub Pages).
+        Con static_assets=True, además, datos, estilos y lógica se escriben como recursos
+        con hash y precomprimidos (ver AssetWriter).
+        Con plotly='vendor' se usa una copia local del bundle parcial de Plotly (plotly_bundle,
+        o PLOTLY_BUNDLE descargado una vez) en lugar de plotly-latest del CDN.
+        Con static_charts=False los gráficos no se pre-renderizan como SVG.
+        Con compress_payload=True los datos incrustados van comprimidos (ver iter_html_dashboard).
+        Con open_browser=False no se abre el navegador al terminar.
+        Devuelve las estadísticas usadas.
+        """
         print("\nGenerando todas las estadísticas...")
-        stats = self.generate_all_statistics()
+        if incremental:
+            snapshot_path = os.path.splitext(filename)[0] + '.stats.pkl'
+            stats = self.generate_statistics_incremental(snapshot_path, verify=verify)
+        else:
+            stats = self.generate_all_statistics()
+            if verify:
+                self.verify_statistics(stats)
 
         print("Creando dashboard HTML completo...")
-        html_content = self.generate_html_dashboard(stats)
-
+        output_dir = os.path.dirname(filename)
+        data_files = assets = plotly_url = asset_writer = None
+        if plotly == 'vendor':
+            try:
+                plotly_url = vendor_plotly_bundle(output_dir, plotly_bundle)
+            except OSError as e:
+                print(f"Aviso: no se pudo obtener el bundle de Plotly ({e}); se usa {PLOTLY_BUNDLE_URL}")
+                plotly_url = PLOTLY_BUNDLE_URL
+        if static_assets:
+            with self._phase('write_assets'):
+                local_plotly = plotly_url if plotly_url and plotly_url != PLOTLY_BUNDLE_URL else None
+                (data_files, assets, hashed_plotly), asset_writer = self.write_static_assets(stats, output_dir,
+                                                                                             local_plotly)
+                plotly_url = hashed_plotly or plotly_url
+        elif split_data:
+            with self._phase('write_data'):
+                data_files = self.write_data_files(stats, output_dir)
+            print(f"Datos del dashboard guardados en '{os.path.join(output_dir, 'data')}'")
+
+        # Los fragmentos se escriben según se generan, sin construir el HTML completo en memoria,
+        # en un temporal que reemplaza a `filename` al terminar: si algo falla, el dashboard
+        # anterior queda intacto y el error llega a quien llamó
+        tmp_path = f'{filename}.{os.getpid()}.tmp'
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            print(f"Dashboard guardado exitosamente como '{filename}'")
-            # Abre el archivo automáticamente en el navegador predeterminado
-            webbrowser.open(f'file:///{os.path.abspath(filename)}')
-        except Exception as e:
-            print(f"Error al guardar o abrir el dashboard: {e}")
+            with self._phase('render_html'), open(tmp_path, 'w', encoding='utf-8') as f:
+                f.writelines(self.iter_html_dashboard(stats, data_files=data_files, assets=assets, plotly_url=plotly_url,
+                                                      static_charts=static_charts, compress_payload=compress_payload))
+            os.replace(tmp_path, filename)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        if asset_writer is not None:
+            # El HTML anterior usaba los recursos anteriores: se borran solo cuando ya no hay quien los pida
+            asset_writer.finish()
+            print(f"Recursos del dashboard guardados en '{os.path.join(output_dir, AssetWriter.MANIFEST)}'")
+        print(f"Dashboard guardado exitosamente como '{filename}'")
+
+        # Abre el archivo automáticamente en el navegador predeterminado
+        if open_browser:
+            try:
+                webbrowser.open(f'file:///{os.path.abspath(filename)}')
+            except Exception as e:
+                print(f"Error al abrir el dashboard: {e}")
+        return stats
+
+
+def merge_partial_statistics(partials):
+    """
+    Combina agregados parciales (PartialStatistics) de varios libros.
+    El resultado es idéntico al de un único libro cuyas hojas contuvieran, semana a semana,
+    las filas de cada libro en el orden dado: las semanas se unen por orden de primera aparición
+    y los conteos del cubo se suman por combinación de claves, conservando el orden de primera
+    aparición dentro de cada semana. La operación es asociativa, así que los agregados se
+    pueden combinar por partes (en árbol o en paralelo) con el mismo resultado.
+    """
+    partials = list(partials)
+    if len(partials) == 1:
+        return partials[0]
+    weeks = list(dict.fromkeys(week for partial in partials for week in partial.weeks_list))
+    week_rank = {week: rank for rank, week in enumerate(weeks)}
+    cube = pd.concat([partial.cube for partial in partials], ignore_index=True)
+    # Orden estable por semana: dentro de cada semana, los libros (y sus filas) en el orden dado
+    order = cube['Semana'].astype(object).map(week_rank).to_numpy()
+    cube = cube.iloc[np.argsort(order, kind='stable')]
+    cube = (cube
+            .groupby(ComprehensiveQADashboard.CUBE_KEYS, dropna=False, sort=False, observed=True)
+            .agg(ComprehensiveQADashboard.CUBE_MEASURES)
+            .reset_index())
+    return PartialStatistics(weeks, cube)
+
+
+# Subdirectorio del modo batch para el dashboard combinado de todos los equipos
+COMBINED_DIR = '_todos'
+
+
+def find_workbooks(patterns):
+    """Libros .xlsx de una lista de directorios, globs o archivos, sin los temporales ~$ de Excel"""
+    paths = []
+    for pattern in patterns:
+        matches = glob.glob(os.path.join(pattern, '*.xlsx') if os.path.isdir(pattern) else pattern)
+        paths.extend(sorted(path for path in matches if not os.path.basename(path).startswith('~$')))
+    return list(dict.fromkeys(paths))
+
+
+def team_names(paths):
+    """Nombre de equipo de cada libro: el nombre del archivo, con sufijo si se repite"""
+    names = {}
+    for path in paths:
+        base = os.path.splitext(os.path.basename(path))[0]
+        name, suffix = base, 2
+        while name in names.values() or name == COMBINED_DIR:
+            name, suffix = f'{base}-{suffix}', suffix + 1
+        names[path] = name
+    return names
+
+
+def build_team_dashboard(excel_path, output_path, cache_dir='.sheet_cache', reader='stream', save_options=None,
+                         with_partial=False):
+    """
+    Genera el dashboard de un libro; es la tarea de cada proceso del modo batch.
+    Devuelve un resumen para el índice con los tiempos de carga y de generación y los
+    totales Web/App, o con 'error' si el libro no se pudo procesar.
+    Con with_partial=True el resumen incluye además su agregado parcial en 'partial'.
+    """
+    start = time.perf_counter()
+    result = {'excel': excel_path, 'output': output_path}
+    try:
+        dashboard = ComprehensiveQADashboard(excel_path, cache_dir=cache_dir, reader=reader)
+        loaded = time.perf_counter()
+        result['sheet_digests'] = list(dashboard.sheet_digests.values())
+        if dashboard.all_data.empty:
+            raise ValueError("el libro no tiene datos legibles")
+        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+        stats = dashboard.save_dashboard(output_path, open_browser=False, **(save_options or {}))
+        result.update({
+            'load_seconds': loaded - start,
+            'build_seconds': time.perf_counter() - loaded,
+            'records': len(dashboard.all_data),
+            'weeks': stats['total_weeks'],
+            'web': stats['web']['historical'],
+            'app': stats['app']['historical'],
+        })
+        if with_partial:
+            result['partial'] = dashboard.partial_statistics()
+    except Exception as e:
+        result['error'] = str(e)
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def render_batch_index(results, elapsed, combined_link=None):
+    """
+    Índice HTML del lote: una fila por equipo con enlace a <equipo>/index.html, totales y tiempos.
+    combined_link enlaza la fila de totales al dashboard combinado de todos los equipos.
+    """
+    def platform_cells(historical):
+        porcentaje = historical['porcentaje_rechazo']
+        return (f'<td data-label="Revisadas">{historical["total_revisadas"]}</td>'
+                f'<td data-label="% Rechazo"><span class="percentage '
+                f'{ComprehensiveQADashboard._percentage_class(porcentaje)}">{porcentaje}%</span></td>')
+
+    rows = []
+    totals = {platform: {'total_revisadas': 0, 'total_rechazadas': 0} for platform in ('web', 'app')}
+    for result in results:
+        team = escape(result['team'])
+        if 'error' in result:
+            rows.append(f"""
+                <tr>
+                    <td data-label="Equipo">{team}</td>
+                    <td colspan="6" style="color: var(--danger-color);">Error: {escape(result['error'])}</td>
+                    <td data-label="Tiempo">{result['seconds']:.2f}s</td>
+                </tr>""")
+            continue
+        for platform in totals:
+            totals[platform]['total_revisadas'] += result[platform]['total_revisadas']
+            totals[platform]['total_rechazadas'] += result[platform]['total_rechazadas']
+        link = quote(result['team']) + '/index.html'
+        rows.append(f"""
+                <tr>
+                    <td data-label="Equipo"><a href="{link}">{team}</a></td>
+                    <td data-label="Semanas">{result['weeks']}</td>
+                    <td data-label="Tarjetas">{result['records']}</td>
+                    {platform_cells(result['web'])}
+                    {platform_cells(result['app'])}
+                    <td data-label="Tiempo">{result['seconds']:.2f}s (carga {result['load_seconds']:.2f}s)</td>
+                </tr>""")
+    for historical in totals.values():
+        revisadas = historical['total_revisadas']
+        historical['porcentaje_rechazo'] = round(historical['total_rechazadas'] / revisadas * 100, 2) if revisadas else 0
+    total_label = f'<a href="{combined_link}">Total</a>' if combined_link else 'Total'
+    rows.append(f"""
+                <tr>
+                    <td data-label="Equipo"><strong>{total_label}</strong></td>
+                    <td data-label="Semanas"></td>
+                    <td data-label="Tarjetas">{sum(result.get('records', 0) for result in results)}</td>
+                    {platform_cells(totals['web'])}
+                    {platform_cells(totals['app'])}
+                    <td data-label="Tiempo">{elapsed:.2f}s</td>
+                </tr>""")
+
+    return """<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Dashboard QA - Equipos</title>
+    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
+    <style>
+""" + DASHBOARD_STYLES + """    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>📊 Dashboard QA - Equipos</h1>
+            <p class="timestamp">Generado el: """ + datetime.now().strftime('%d/%m/%Y a las %H:%M:%S') + """</p>
+            <p class="timestamp">Libros procesados: """ + str(len(results)) + """</p>
+        </div>
+
+        <table>
+            <thead>
+                <tr>
+                    <th>Equipo</th>
+                    <th>Semanas</th>
+                    <th>Tarjetas</th>
+                    <th>Web Revisadas</th>
+                    <th>Web % Rechazo</th>
+                    <th>App Revisadas</th>
+                    <th>App % Rechazo</th>
+                    <th>Tiempo</th>
+                </tr>
+            </thead>
+            <tbody>""" + ''.join(rows) + """
+            </tbody>
+        </table>
+    </div>
+</body>
+</html>"""
+
+
+def run_batch(patterns, output_dir='dashboards', jobs=None, cache_dir='.sheet_cache', reader='stream',
+              save_options=None, combined=False):
+    """
+    Modo batch: genera en paralelo, con como mucho `jobs` procesos, un dashboard por libro
+    en <output_dir>/<equipo>/index.html y un índice común en <output_dir>/index.html.
+    Todos los procesos comparten la caché de hojas. Devuelve los resúmenes de build_team_dashboard.
+    Con combined=True cada proceso devuelve además su agregado parcial y se combinan
+    (merge_partial_statistics) en un dashboard de toda la organización en
+    <output_dir>/COMBINED_DIR/index.html, sin juntar las filas de los libros.
+    """
+    paths = find_workbooks(patterns)
+    if not paths:
+        print(f"No se encontraron libros .xlsx en: {', '.join(patterns)}")
+        return []
+    names = team_names(paths)
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(paths)))
+    print(f"Procesando {len(paths)} libros con {jobs} procesos...")
+
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(build_team_dashboard, path, os.path.join(output_dir, names[path], 'index.html'),
+                            cache_dir, reader, save_options, combined): path
+            for path in paths
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            result['team'] = names[futures[future]]
+            results.append(result)
+            status = f"error: {result['error']}" if 'error' in result else f"{result['records']} tarjetas"
+            print(f"  {result['team']}: {result['seconds']:.2f}s ({status})")
+    elapsed = time.perf_counter() - start
+    results.sort(key=lambda result: paths.index(result['excel']))
+
+    # La caché es compartida: solo se limpia al final y con las hojas de todos los libros.
+    # Si algún libro no se pudo leer, sus entradas se conservan y no se limpia nada
+    digests = [result.pop('sheet_digests', None) for result in results]
+    if cache_dir and None not in digests:
+        digests = [digest for team in digests for digest in team]
+        if None not in digests:
+            removed = prune_sheet_cache(cache_dir, digests)
+            if removed:
+                print(f"Caché de hojas: {removed} entradas sin uso borradas")
+
+    combined_link = None
+    partials = [result.pop('partial') for result in results if 'partial' in result]
+    if partials:
+        combined_path = os.path.join(output_dir, COMBINED_DIR, 'index.html')
+        os.makedirs(os.path.dirname(combined_path), exist_ok=True)
+        print(f"\nCombinando {len(partials)} agregados parciales...")
+        # El snapshot incremental y la verificación necesitan las filas, que aquí no existen
+        options = {key: value for key, value in (save_options or {}).items() if key not in ('incremental', 'verify')}
+        ComprehensiveQADashboard(partial=merge_partial_statistics(partials)).save_dashboard(
+            combined_path, open_browser=False, **options)
+        combined_link = quote(COMBINED_DIR) + '/index.html'
+
+    index_path = os.path.join(output_dir, 'index.html')
+    os.makedirs(output_dir, exist_ok=True)
+    with open(index_path, 'w', encoding='utf-8') as f:
+        f.write(render_batch_index(results, elapsed, combined_link))
+
+    print(f"\n{'Equipo':<30} {'Carga':>8} {'Generación':>11} {'Total':>8}")
+    for result in results:
+        if 'error' in result:
+            print(f"{result['team']:<30} {'':>8} {'':>11} {result['seconds']:>7.2f}s  error")
+        else:
+            print(f"{result['team']:<30} {result['load_seconds']:>7.2f}s {result['build_seconds']:>10.2f}s "
+                  f"{result['seconds']:>7.2f}s")
+    print(f"Lote completo en {elapsed:.2f}s; índice en '{index_path}'")
+    return results
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Genera el dashboard QA a partir del Excel de tarjetas")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Reutiliza el snapshot de la ejecución anterior y solo procesa semanas nuevas o modificadas")
+    parser.add_argument('--verify', action='store_true',
+                        help="Comprueba las estadísticas contra un recálculo completo")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Número de procesos para leer las hojas en paralelo (por defecto 1)")
+    parser.add_argument('--reader', choices=['stream', 'pandas'], default='stream',
+                        help="Lector de hojas: 'stream' lee fila a fila solo las columnas usadas; 'pandas' usa pd.read_excel completo")
+    parser.add_argument('--profile', action='store_true',
+                        help="Mide tiempo, CPU y memoria de cada fase y escribe una traza Chrome trace-event")
+    parser.add_argument('--profile-trace', default='profile_trace.json',
+                        help="Archivo de la traza de --profile (por defecto profile_trace.json)")
+    parser.add_argument('--profile-cprofile', action='store_true', help="Con --profile, envuelve la ejecución en cProfile")
+    parser.add_argument('--profile-tracemalloc', action='store_true',
+                        help="Con --profile, mide la memoria con tracemalloc en lugar del RSS")
+    parser.add_argument('--store', metavar='DIR',
+                        help="Genera el dashboard desde el almacén columnar en lugar del Excel")
+    parser.add_argument('--split-data', action='store_true',
+                        help="Escribe los datos en data/*.json y el navegador los carga por pestaña en lugar de incrustarlos en el HTML")
+    parser.add_argument('--static-assets', action='store_true',
+                        help="Como --split-data, pero datos, CSS y JS se escriben con hash en el nombre y copias .gz/.br")
+    parser.add_argument('--plotly', choices=['cdn', 'vendor'], default='cdn',
+                        help="'vendor' sirve junto al HTML un bundle parcial y fijado de Plotly (" + PLOTLY_BUNDLE + ") cargado con defer")
+    parser.add_argument('--watch', action='store_true',
+                        help="Vigila reporte_tarjetas.xlsx, regenera de forma incremental al guardarlo y recarga el navegador")
+    parser.add_argument('--port', type=int, default=8000,
+                        help="Con --watch, puerto del servidor local (por defecto 8000)")
+    parser.add_argument('--debounce', type=float, default=1.0,
+                        help="Con --watch, segundos sin cambios en el Excel antes de regenerar (por defecto 1)")
+    parser.add_argument('--no-static-charts', dest='static_charts', action='store_false',
+                        help="No incrusta la versión SVG de los gráficos; Plotly los dibuja al cargar")
+    parser.add_argument('--plotly-bundle', metavar='ARCHIVO',
+                        help="Con --plotly vendor, usa este archivo local en lugar de descargar el bundle")
+    parser.add_argument('--compress-payload', action='store_true',
+                        help="Incrusta los datos comprimidos con gzip (en base64) y el navegador los descomprime; "
+                             "por debajo de " + str(ComprehensiveQADashboard.COMPRESS_PAYLOAD_MIN_BYTES // 1024)
+                             + " KB se incrustan como JSON")
+    parser.add_argument('--sections', metavar='SECCIONES',
+                        help="En lugar del dashboard, exporta como JSON solo estas secciones separadas por comas ("
+                             + ", ".join(ComprehensiveQADashboard.STATISTICS_SECTIONS) + "); las demás no se calculan")
+    parser.add_argument('--sections-output', default='estadisticas.json', metavar='ARCHIVO',
+                        help="Con --sections, archivo JSON de salida (por defecto estadisticas.json)")
+
+    subparsers = parser.add_subparsers(dest='command')
+    import_parser = subparsers.add_parser('import', help="Importa las semanas nuevas o modificadas del Excel al almacén")
+    import_parser.add_argument('--excel', default='reporte_tarjetas.xlsx', help="Libro a importar")
+    import_parser.add_argument('--store', dest='import_store', default='card_store', metavar='DIR',
+                               help="Directorio del almacén (por defecto card_store)")
+    batch_parser = subparsers.add_parser('batch', help="Genera un dashboard por libro de equipo y un índice común")
+    batch_parser.add_argument('inputs', nargs='+', metavar='LIBROS',
+                              help="Directorios, globs o archivos .xlsx (un libro por equipo)")
+    batch_parser.add_argument('--output-dir', default='dashboards',
+                              help="Directorio de salida: <dir>/<equipo>/index.html e <dir>/index.html")
+    batch_parser.add_argument('--jobs', type=int, default=None,
+                              help="Libros procesados a la vez (por defecto, uno por CPU)")
+    batch_parser.add_argument('--combined', action='store_true',
+                              help="Genera además un dashboard de todos los equipos en <dir>/" + COMBINED_DIR
+                                   + "/index.html combinando sus agregados")
+    args = parser.parse_args()
+    if args.watch and (args.store or args.command):
+        parser.error("--watch solo vigila el Excel; no se combina con --store ni con import o batch")
+    sections = None
+    if args.sections:
+        if args.watch or args.command:
+            parser.error("--sections no se combina con --watch ni con import o batch")
+        sections = [section.strip() for section in args.sections.split(',') if section.strip()]
+        unknown = [section for section in sections if section not in ComprehensiveQADashboard.STATISTICS_SECTIONS]
+        if unknown or not sections:
+            parser.error(f"secciones desconocidas: {', '.join(unknown) or repr(args.sections)}; disponibles: "
+                         + ", ".join(ComprehensiveQADashboard.STATISTICS_SECTIONS))
+
+    profiler = None
+    if args.profile:
+        profiler = PhaseProfiler(use_tracemalloc=args.profile_tracemalloc, use_cprofile=args.profile_cprofile)
+        profiler.start()
+
     try:
-        dashboard = ComprehensiveQADashboard()
-        dashboard.save_dashboard(filename="index.html")
+        with profiler.phase('total') if profiler else nullcontext():
+            if args.command == 'import':
+                dashboard = ComprehensiveQADashboard(args.excel, workers=args.workers, reader=args.reader, profiler=profiler)
+                dashboard.prune_sheet_cache()
+                CardStore(args.import_store).import_dashboard(dashboard)
+            elif args.command == 'batch':
+                run_batch(args.inputs, output_dir=args.output_dir, jobs=args.jobs, reader=args.reader,
+                          save_options={'incremental': args.incremental, 'verify': args.verify,
+                                        'split_data': args.split_data, 'static_assets': args.static_assets,
+                                        'plotly': args.plotly, 'plotly_bundle': args.plotly_bundle,
+                                        'static_charts': args.static_charts,
+                                        'compress_payload': args.compress_payload},
+                          combined=args.combined)
+            else:
+                def build():
+                    dashboard = ComprehensiveQADashboard(workers=args.workers, reader=args.reader, profiler=profiler,
+                                                         store_dir=args.store)
+                    dashboard.prune_sheet_cache()
+                    if sections:
+                        dashboard.export_statistics(args.sections_output, sections)
+                        return
+                    dashboard.save_dashboard(filename="index.html", incremental=args.incremental or args.watch,
+                                             verify=args.verify, split_data=args.split_data,
+                                             static_assets=args.static_assets, plotly=args.plotly,
+                                             plotly_bundle=args.plotly_bundle, static_charts=args.static_charts,
+                                             compress_payload=args.compress_payload,
+                                             open_browser=not args.watch)
+
+                build()
+                if args.watch:
+                    server = LiveReloadServer('.', port=args.port)
+                    server.start()
+                    print(f"\nSirviendo el dashboard en {server.url} (Ctrl+C para salir)")
+                    print("Vigilando 'reporte_tarjetas.xlsx'...")
+                    webbrowser.open(server.url)
+
+                    def rebuild():
+                        # Si build() falla, watch_file lo registra y no se recargan las pestañas
+                        start = time.perf_counter()
+                        build()
+                        server.notify_reload()
+                        print(f"Dashboard regenerado en {time.perf_counter() - start:.2f}s")
+
+                    try:
+                        watch_file('reporte_tarjetas.xlsx', rebuild, debounce=args.debounce)
+                    except KeyboardInterrupt:
+                        pass
+                    finally:
+                        server.stop()
     except FileNotFoundError:
         print("El archivo 'reporte_tarjetas.xlsx' no fue encontrado. Asegúrate de que esté en la misma carpeta que el script.")
     except Exception as e:
         print(f"Ocurrió un error inesperado: {e}")
+    finally:
+        if profiler:
+            profiler.stop()
+            profiler.print_summary()
+            profiler.write_chrome_trace(args.profile_trace)
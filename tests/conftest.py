@@ -0,0 +1,38 @@
+import os
+import sys
+from datetime import datetime
+
+import openpyxl
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Encabezado de las hojas de reporte_tarjetas.xlsx
+HEADER = ['Sitio', 'Descripción', 'Número de tarjeta', 'Prioridad en la Tarjeta', 'Web/App', 'Plataforma',
+          'Desarrollador', 'PM', 'Fecha tentativa  de validación por parte de QA', 'Fecha de Aprobación o Rechazo',
+          'Criterios de Aceptación Entendibles', 'Número de rechazos', 'Aceptado/Rechazado', 'Comentarios',
+          'Incidencias/Stoppers']
+
+
+def card(sitio='Sitio A', tipo='Web', plataforma='Android', desarrollador='Ana', pm='Luis', prioridad='Alta',
+         tentativa=datetime(2025, 5, 5), decision=datetime(2025, 5, 7), rechazos=0, estado='APROBADO'):
+    """Fila de una tarjeta en el orden de HEADER"""
+    return [sitio, 'Descripción', 1, prioridad, tipo, plataforma, desarrollador, pm, tentativa, decision,
+            'Sí', rechazos, estado, None, None]
+
+
+@pytest.fixture
+def make_workbook(tmp_path):
+    """Escribe un libro con las hojas {nombre: (encabezado, filas)} y devuelve su ruta"""
+    def make(sheets, name='reporte.xlsx'):
+        wb = openpyxl.Workbook()
+        wb.remove(wb.active)
+        for sheet_name, (header, rows) in sheets.items():
+            ws = wb.create_sheet(sheet_name)
+            ws.append(header)
+            for row in rows:
+                ws.append(row)
+        path = tmp_path / name
+        wb.save(path)
+        return str(path)
+    return make
@@ -0,0 +1,46 @@
+import pytest
+
+from conftest import HEADER, card
+from dashboard_generator import ComprehensiveQADashboard
+
+
+def rename(header, **names):
+    return [names.get(name, name) for name in header]
+
+
+@pytest.fixture
+def mixed_workbook(make_workbook):
+    """
+    Libro cuyas hojas usan variantes de encabezado distintas: la primera los nombres
+    canónicos y la segunda 'SITIO', 'Web o App', 'QA' y dos columnas de desarrollador.
+    """
+    backend = HEADER.index('Desarrollador')
+    old_header = rename(HEADER, **{'Sitio': 'SITIO', 'Web/App': 'Web o App', 'PM': 'QA', 'Desarrollador': 'Developer'})
+    old_header.insert(backend + 1, 'Desarrollador Backend')
+    old_rows = []
+    for developer, backend_developer in [('Eva', None), (None, 'Iván')]:
+        row = card(sitio='Sitio B', tipo='App', pm='Marta', desarrollador=developer)
+        row.insert(backend + 1, backend_developer)
+        old_rows.append(row)
+    return make_workbook({
+        'tarjetas semana 2': (HEADER, [card()]),
+        'tarjetas semana 1': (old_header, old_rows),
+    })
+
+
+@pytest.mark.parametrize('reader', ['stream', 'pandas'])
+def test_variants_are_resolved_per_sheet(mixed_workbook, reader):
+    """
+    Cada hoja resuelve sus propias variantes de encabezado. A diferencia de la resolución
+    sobre el libro completo, las filas de la hoja con variantes conservan su sitio, tipo,
+    QA y desarrolladores aunque otra hoja use los nombres canónicos.
+    """
+    data = ComprehensiveQADashboard(mixed_workbook, cache_dir=None, reader=reader).all_data
+    old = data[data['Semana'] == 'tarjetas semana 1']
+
+    assert old['Sitio'].tolist() == ['Sitio B', 'Sitio B']
+    assert old['Web/App'].tolist() == ['App', 'App']
+    assert old['PM'].tolist() == ['Marta', 'Marta']
+    # Las columnas de desarrollador de la hoja se combinan: primer valor no nulo
+    assert old['Desarrollador'].tolist() == ['Eva', 'Iván']
+    assert data.loc[data['Semana'] == 'tarjetas semana 2', 'Desarrollador'].tolist() == ['Ana']
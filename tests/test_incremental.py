@@ -0,0 +1,30 @@
+import json
+
+from conftest import HEADER, card
+from dashboard_generator import ComprehensiveQADashboard
+
+
+def weeks(changed=False):
+    """Tres semanas; con changed, la segunda tiene un rechazo más"""
+    sheets = {}
+    for week, (site, developer) in enumerate([('Sitio A', 'Ana'), ('Sitio B', 'Eva'), ('Sitio C', 'Iván')]):
+        rows = [card(sitio=site, desarrollador=developer, tipo=tipo) for tipo in ('Web', 'App', 'Web')]
+        if changed and week == 1:
+            rows[0] = card(sitio=site, desarrollador=developer, estado='RECHAZADO', rechazos=2)
+        sheets[f'tarjetas semana {week}'] = (HEADER, rows)
+    return sheets
+
+
+def test_incremental_matches_full_recalculation(make_workbook, tmp_path, capsys):
+    snapshot = str(tmp_path / 'index.stats.pkl')
+    path = make_workbook(weeks())
+    ComprehensiveQADashboard(path, cache_dir=None).generate_statistics_incremental(snapshot)
+
+    make_workbook(weeks(changed=True))
+    incremental = ComprehensiveQADashboard(path, cache_dir=None).generate_statistics_incremental(snapshot)
+    full = ComprehensiveQADashboard(path, cache_dir=None).generate_all_statistics()
+
+    assert 'Semanas nuevas o modificadas: 1 de 3' in capsys.readouterr().out
+    assert incremental['qa']['historical']['total_revisadas'] == 9
+    for section in full:
+        assert json.dumps(incremental[section], default=str) == json.dumps(full[section], default=str), section
@@ -0,0 +1,37 @@
+import json
+from datetime import datetime
+
+from conftest import HEADER, card
+from dashboard_generator import ComprehensiveQADashboard, merge_partial_statistics
+
+
+def statistics(dashboard):
+    return json.dumps(dashboard.generate_all_statistics(), default=str)
+
+
+def test_merge_matches_concatenated_workbook(make_workbook):
+    late = dict(tentativa=datetime(2025, 5, 5), decision=datetime(2025, 5, 14))
+    team_a = {
+        'tarjetas semana 1': [card(), card(tipo='App', plataforma='iOS', estado='RECHAZADO', rechazos=1)],
+        'tarjetas semana 2': [card(sitio='Sitio B', desarrollador='Eva'), card(prioridad='Baja', **late)],
+    }
+    # La semana 3 solo existe en el segundo libro
+    team_b = {
+        'tarjetas semana 2': [card(desarrollador='Eva', estado='RECHAZADO', rechazos=3), card(pm='Sara')],
+        'tarjetas semana 3': [card(sitio='Sitio C', desarrollador='Iván', **late), card(tipo='App')],
+    }
+    team_c = {'tarjetas semana 1': [card(sitio='Sitio C', plataforma='iOS', estado=None)]}
+    books = [team_a, team_b, team_c]
+    paths = [make_workbook({week: (HEADER, rows) for week, rows in book.items()}, name=f'equipo_{i}.xlsx')
+             for i, book in enumerate(books)]
+
+    weeks = list(dict.fromkeys(week for book in books for week in book))
+    combined = make_workbook({week: (HEADER, [row for book in books for row in book.get(week, [])])
+                              for week in weeks}, name='todos.xlsx')
+
+    partials = [ComprehensiveQADashboard(path, cache_dir=None).partial_statistics() for path in paths]
+    expected = statistics(ComprehensiveQADashboard(combined, cache_dir=None))
+    assert statistics(ComprehensiveQADashboard(partial=merge_partial_statistics(partials))) == expected
+    # Asociativa: combinar por partes da el mismo resultado
+    nested = merge_partial_statistics([merge_partial_statistics(partials[:2]), partials[2]])
+    assert statistics(ComprehensiveQADashboard(partial=nested)) == expected
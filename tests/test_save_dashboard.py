@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from conftest import HEADER, card
+from dashboard_generator import AssetWriter, ComprehensiveQADashboard, build_team_dashboard
+
+
+def fail(*args, **kwargs):
+    raise RuntimeError("fallo al renderizar")
+
+
+def test_failed_render_keeps_previous_dashboard(make_workbook, tmp_path, monkeypatch):
+    path = make_workbook({'tarjetas semana 1': (HEADER, [card(), card(estado='RECHAZADO')])})
+    index = tmp_path / 'index.html'
+    ComprehensiveQADashboard(path, cache_dir=None).save_dashboard(str(index), open_browser=False)
+    previous = index.read_text(encoding='utf-8')
+
+    monkeypatch.setattr(ComprehensiveQADashboard, '_render_pm_row', fail)
+    with pytest.raises(RuntimeError):
+        ComprehensiveQADashboard(path, cache_dir=None).save_dashboard(str(index), open_browser=False)
+
+    assert index.read_text(encoding='utf-8') == previous
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['index.html', 'reporte.xlsx']
+
+
+def test_batch_reports_failed_render(make_workbook, tmp_path, monkeypatch):
+    path = make_workbook({'tarjetas semana 1': (HEADER, [card()])})
+    monkeypatch.setattr(ComprehensiveQADashboard, '_render_pm_row', fail)
+
+    result = build_team_dashboard(path, str(tmp_path / 'equipo' / 'index.html'), cache_dir=None)
+
+    assert result['error'] == "fallo al renderizar"
+    assert not (tmp_path / 'equipo' / 'index.html').exists()
+
+
+def test_failed_render_keeps_previous_static_assets(make_workbook, tmp_path, monkeypatch):
+    index = tmp_path / 'index.html'
+    path = make_workbook({'tarjetas semana 1': (HEADER, [card()])})
+    ComprehensiveQADashboard(path, cache_dir=None).save_dashboard(str(index), static_assets=True, open_browser=False)
+    manifest = json.loads((tmp_path / AssetWriter.MANIFEST).read_text(encoding='utf-8'))
+    previous = [entry['path'] for entry in manifest['files'].values()]
+    assert all(name in index.read_text(encoding='utf-8') for name in previous)
+
+    # Datos nuevos (otros hashes) y un fallo al renderizar el HTML
+    path = make_workbook({'tarjetas semana 1': (HEADER, [card(), card(estado='RECHAZADO')])})
+    monkeypatch.setattr(ComprehensiveQADashboard, '_render_pm_row', fail)
+    with pytest.raises(RuntimeError):
+        ComprehensiveQADashboard(path, cache_dir=None).save_dashboard(str(index), static_assets=True,
+                                                                      open_browser=False)
+    assert all((tmp_path / name).exists() for name in previous)
+
+    # Con éxito, los recursos que el nuevo HTML ya no usa se borran
+    monkeypatch.undo()
+    ComprehensiveQADashboard(path, cache_dir=None).save_dashboard(str(index), static_assets=True, open_browser=False)
+    html = index.read_text(encoding='utf-8')
+    assert not all(name in html for name in previous)
+    assert all((tmp_path / name).exists() == (name in html) for name in previous)
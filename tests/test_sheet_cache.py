@@ -0,0 +1,38 @@
+import os
+
+from conftest import HEADER, card
+from dashboard_generator import ComprehensiveQADashboard, get_sheet_digests, run_batch
+
+
+def cached_digests(cache_dir):
+    return {name.split('.')[0] for name in os.listdir(cache_dir)}
+
+
+def test_prune_keeps_only_current_sheets(make_workbook, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    path = make_workbook({'tarjetas semana 1': (HEADER, [card()]), 'tarjetas semana 2': (HEADER, [card()])})
+    ComprehensiveQADashboard(path, cache_dir=cache_dir).prune_sheet_cache()
+    first = set(get_sheet_digests(path).values())
+    assert cached_digests(cache_dir) == first
+
+    path = make_workbook({'tarjetas semana 1': (HEADER, [card()]), 'tarjetas semana 2': (HEADER, [card(), card()])})
+    open(os.path.join(cache_dir, 'otro-archivo.txt'), 'w').close()
+    ComprehensiveQADashboard(path, cache_dir=cache_dir).prune_sheet_cache()
+
+    current = set(get_sheet_digests(path).values())
+    assert len(current & first) == 1
+    assert cached_digests(cache_dir) == current | {'otro-archivo'}
+
+
+def test_batch_prunes_with_the_sheets_of_every_workbook(make_workbook, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    team_a = make_workbook({'tarjetas semana 1': (HEADER, [card()])}, name='equipo_a.xlsx')
+    team_b = make_workbook({'tarjetas semana 1': (HEADER, [card(sitio='Sitio B')])}, name='equipo_b.xlsx')
+    run_batch([team_a, team_b], output_dir=str(tmp_path / 'out'), jobs=1, cache_dir=cache_dir)
+
+    team_a = make_workbook({'tarjetas semana 1': (HEADER, [card(), card()])}, name='equipo_a.xlsx')
+    run_batch([team_a, team_b], output_dir=str(tmp_path / 'out'), jobs=1, cache_dir=cache_dir)
+
+    current = set(get_sheet_digests(team_a).values()) | set(get_sheet_digests(team_b).values())
+    assert len(current) == 2
+    assert cached_digests(cache_dir) == current
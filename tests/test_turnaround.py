@@ -0,0 +1,39 @@
+from datetime import datetime
+
+from conftest import HEADER, card
+from dashboard_generator import ComprehensiveQADashboard
+
+
+def build(path):
+    dashboard = ComprehensiveQADashboard(path, cache_dir=None)
+    stats = dashboard.generate_all_statistics()
+    html = dashboard.generate_html_dashboard(stats)
+    return stats, html
+
+
+def test_header_only_workbook(make_workbook):
+    stats, html = build(make_workbook({'tarjetas semana 1': (HEADER, [])}))
+
+    assert stats['turnaround']['historical'] == {'tarjetas': 0, 'p50': None, 'p90': None, 'p99': None}
+    for grouping in ('por_qa', 'por_desarrollador', 'por_sitio', 'por_semana'):
+        assert stats['turnaround'][grouping] == {}
+    assert 'Tiempo de Respuesta de QA' in html
+
+
+def test_workbook_without_pm_column(make_workbook):
+    pm = HEADER.index('PM')
+    rows = [card(decision=datetime(2025, 5, 5 + days)) for days in (1, 2, 3, 10)]
+    sheets = {'tarjetas semana 1': ([h for i, h in enumerate(HEADER) if i != pm],
+                                    [[v for i, v in enumerate(row) if i != pm] for row in rows])}
+    stats, _ = build(make_workbook(sheets))
+
+    assert stats['turnaround']['por_qa'] == {}
+    assert stats['turnaround']['historical'] == {'tarjetas': 4, 'p50': 2, 'p90': 10, 'p99': 10}
+    assert stats['turnaround']['por_sitio'] == {'Sitio A': {'tarjetas': 4, 'p50': 2, 'p90': 10, 'p99': 10}}
+
+
+def test_workbook_without_decision_dates(make_workbook):
+    stats, _ = build(make_workbook({'tarjetas semana 1': (HEADER, [card(decision=None), card(decision=None)])}))
+
+    assert stats['turnaround']['historical']['tarjetas'] == 0
+    assert stats['turnaround']['por_semana'] == {}
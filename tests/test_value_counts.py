@@ -0,0 +1,17 @@
+import random
+
+from conftest import HEADER, card
+from dashboard_generator import ComprehensiveQADashboard
+
+
+def test_platform_ties_keep_first_appearance_order(make_workbook):
+    """Mayor conteo primero; los empates, por orden de primera aparición (con cualquier versión de pandas)"""
+    # Suficientes valores con conteos repetidos para que una ordenación no estable los desordene
+    rnd = random.Random(0)
+    counts = {f'Plataforma {i:02d}': rnd.randint(1, 4) for i in range(40)}
+    rows = [card(plataforma=platform) for platform, count in counts.items() for _ in range(count)]
+    dashboard = ComprehensiveQADashboard(make_workbook({'tarjetas semana 1': (HEADER, rows)}), cache_dir=None)
+
+    expected = sorted(counts.items(), key=lambda item: -item[1])
+    assert list(dashboard.get_platform_report().items()) == expected
+    assert list(dashboard.get_site_statistics_complete()['Sitio A']['plataformas'].items()) == expected
@@ -0,0 +1,49 @@
+import threading
+import time
+
+import pytest
+
+from conftest import HEADER, card
+from dashboard_generator import ComprehensiveQADashboard, watch_file
+
+
+@pytest.mark.parametrize('broken', [lambda data: data[:len(data) // 2], lambda data: b''],
+                         ids=['truncado', 'vacio'])
+def test_watch_keeps_last_dashboard_on_broken_save(make_workbook, tmp_path, capsys, broken):
+    path = make_workbook({'tarjetas semana 1': (HEADER, [card()])})
+    updated = make_workbook({'tarjetas semana 1': (HEADER, [card(), card(estado='RECHAZADO', rechazos=1)])},
+                            name='nuevo.xlsx')
+    index = tmp_path / 'index.html'
+
+    def build():
+        ComprehensiveQADashboard(path, cache_dir=None).save_dashboard(filename=str(index), open_browser=False)
+
+    build()
+    first = index.read_text(encoding='utf-8')
+    good, new = open(path, 'rb').read(), open(updated, 'rb').read()
+    builds = []
+
+    def rebuild():
+        builds.append(index.read_text(encoding='utf-8'))
+        build()
+        # Solo se llega aquí con un libro válido: se termina la vigilancia
+        raise KeyboardInterrupt
+
+    def save():
+        time.sleep(0.2)
+        with open(path, 'wb') as f:
+            f.write(broken(good))
+        time.sleep(0.6)
+        with open(path, 'wb') as f:
+            f.write(new)
+
+    writer = threading.Thread(target=save)
+    writer.start()
+    with pytest.raises(KeyboardInterrupt):
+        watch_file(path, rebuild, interval=0.02, debounce=0.2)
+    writer.join()
+
+    # El guardado roto no tocó index.html y la vigilancia siguió hasta el siguiente cambio
+    assert builds == [first, first]
+    assert 'se conserva el anterior' in capsys.readouterr().out
+    assert index.read_text(encoding='utf-8') != first